@@ -30,7 +30,12 @@ if config.config_file_name is not None:
 from app.api.v1.users.models import User  # noqa: F401
 from app.api.v1.properties.models import Property  # noqa: F401
 from app.api.v1.listings.models import Amenity, Listing, ListingAmenity, SavedListing  # noqa: F401
-from app.api.v1.images.models import ListingImage, PropertyImage  # noqa: F401
+from app.api.v1.images.models import (  # noqa: F401
+    ImageBlob,
+    ListingImage,
+    PropertyImage,
+    StorageDeletion,
+)
 from app.api.v1.reviews.models import Review  # noqa: F401
 from app.api.v1.test.models import TestTable  # noqa: F401
 
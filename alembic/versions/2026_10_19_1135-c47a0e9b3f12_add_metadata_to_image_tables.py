@@ -0,0 +1,65 @@
+"""Add metadata to image tables.
+
+Revision ID: c47a0e9b3f12
+Revises: 8b2e5f7c1d90
+Create Date: 2026-10-19 11:35:27.904416
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c47a0e9b3f12"
+down_revision: Union[str, Sequence[str], None] = "8b2e5f7c1d90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+IMAGE_TABLES = ("listing_images", "property_images")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in IMAGE_TABLES:
+        op.add_column(
+            table,
+            sa.Column(
+                "width",
+                sa.Integer(),
+                nullable=True,
+                comment="Display width in pixels",
+            ),
+        )
+        op.add_column(
+            table,
+            sa.Column(
+                "height",
+                sa.Integer(),
+                nullable=True,
+                comment="Display height in pixels",
+            ),
+        )
+        op.add_column(table, sa.Column("byte_size", sa.BigInteger(), nullable=True))
+        op.add_column(table, sa.Column("content_type", sa.Text(), nullable=True))
+        op.add_column(
+            table,
+            sa.Column(
+                "placeholder",
+                sa.Text(),
+                nullable=True,
+                comment="Low-quality image placeholder as a data: URI",
+            ),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in IMAGE_TABLES:
+        op.drop_column(table, "placeholder")
+        op.drop_column(table, "content_type")
+        op.drop_column(table, "byte_size")
+        op.drop_column(table, "height")
+        op.drop_column(table, "width")
@@ -1,8 +1,13 @@
+import hashlib
+import time
+
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
 
 from app.api.v1.users.models import User
+from app.core.cache import TTLCache
 from app.core.config import settings
 from app.core.security import decode_access_token
 from app.db.session import SessionLocal
@@ -10,6 +15,17 @@ from app.db.session import SessionLocal
 
 security = HTTPBearer(auto_error=False)
 
+# Verified JWT claims keyed by the token's SHA-256, and detached copies of
+# users keyed by id; both per process (see the AUTH_*_CACHE_* settings)
+_token_cache = TTLCache(
+    maxsize=settings.AUTH_TOKEN_CACHE_SIZE,
+    ttl_seconds=settings.AUTH_TOKEN_CACHE_TTL_SECONDS,
+)
+_user_cache = TTLCache(
+    maxsize=settings.AUTH_USER_CACHE_SIZE,
+    ttl_seconds=settings.AUTH_USER_CACHE_TTL_SECONDS,
+)
+
 
 def get_db() -> Session:
     """Yield a database session and ensure it is closed after the request."""
@@ -20,34 +36,131 @@ def get_db() -> Session:
         db.close()
 
 
-def get_current_user(
-    request: Request,
-    credentials: HTTPAuthorizationCredentials | None = Depends(security),
-    db: Session = Depends(get_db),
-) -> User:
-    """Decode the JWT and return the authenticated User row from the database."""
+def _token_from_request(
+    request: Request, credentials: HTTPAuthorizationCredentials | None
+) -> str | None:
+    """Return the bearer token, falling back to the session cookie."""
     token = credentials.credentials if credentials else None
     if not token:
         token = request.cookies.get("bp_session")
-    if not token:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated"
-        )
+    return token
+
 
-    payload = decode_access_token(
+def _verified_claims(token: str) -> dict:
+    """
+    Decode and verify a JWT. Valid tokens are cached by hash so repeat
+    requests skip the signature check; an entry never outlives the token's exp.
+    """
+    key = hashlib.sha256(token.encode()).digest()
+    claims = _token_cache.get(key)
+    if claims is not None:
+        return claims
+
+    claims = decode_access_token(
         token, secret_key=settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM
     )
-
-    sub = payload.get("sub")
-    if not sub:
+    if not claims.get("sub"):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload"
         )
+    ttl = settings.AUTH_TOKEN_CACHE_TTL_SECONDS
+    if "exp" in claims:
+        ttl = min(ttl, claims["exp"] - time.time())
+    if ttl > 0:
+        _token_cache.set(key, claims, ttl_seconds=ttl)
+    return claims
+
 
-    user = db.get(User, sub)
-    if not user:
+def _request_claims(
+    request: Request, credentials: HTTPAuthorizationCredentials | None
+) -> dict:
+    """Verified claims of the request's token; 401 when there is none."""
+    token = _token_from_request(request, credentials)
+    if not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated"
+        )
+    return _verified_claims(token)
+
+
+def invalidate_cached_user(user_id: str) -> None:
+    """Drop a user's cached row after it changes (call after commit)."""
+    _user_cache.pop(user_id)
+
+
+@event.listens_for(User, "after_update")
+def _invalidate_updated_user(mapper, connection, target: User) -> None:
+    """ORM updates of a user (e.g. soft_delete() and commit) evict its copy."""
+    invalidate_cached_user(target.id)
+
+
+def _load_user(db: Session, user_id: str) -> User:
+    """
+    Return the user attached to db, served from the short-lived user cache
+    when possible. Cached copies are detached snapshots merged into the
+    request's session without a query, so commits in one request cannot
+    expire another request's user.
+    """
+    cached = _user_cache.get(user_id)
+    if cached is not None:
+        return db.merge(cached, load=False)
+
+    user = db.get(User, user_id)
+    if not user or user.deleted_at is not None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found"
         )
+    snapshot = User(
+        **{attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+    )
+    make_transient_to_detached(snapshot)
+    _user_cache.set(user_id, snapshot)
+    return user
+
+
+def get_current_user(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials | None = Depends(security),
+    db: Session = Depends(get_db),
+) -> User:
+    """Verify the JWT and return the authenticated (non-deleted) User."""
+    claims = _request_claims(request, credentials)
+    return _load_user(db, claims["sub"])
+
 
+def get_current_user_id(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials | None = Depends(security),
+) -> str:
+    """
+    Claims-only authentication for endpoints that need nothing but the user
+    id: verify the JWT and return its subject without touching the database.
+    A deleted user's tokens are accepted here until they expire.
+    """
+    return _request_claims(request, credentials)["sub"]
+
+
+def get_optional_current_user_id(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials | None = Depends(security),
+) -> str | None:
+    """
+    Like get_current_user_id, but return None for anonymous requests. An
+    invalid or expired token (e.g. a stale session cookie the browser still
+    sends) is treated as anonymous rather than rejected.
+    """
+    if not _token_from_request(request, credentials):
+        return None
+    try:
+        return get_current_user_id(request=request, credentials=credentials)
+    except HTTPException:
+        return None
+
+
+def get_current_admin(user: User = Depends(get_current_user)) -> User:
+    """Require an authenticated user whose email is listed in ADMIN_EMAILS."""
+    if user.email.lower() not in settings.admin_emails:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required"
+        )
     return user
@@ -5,15 +5,14 @@ from urllib.parse import urlencode
 import requests
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from fastapi.responses import RedirectResponse, JSONResponse
-from google.oauth2 import id_token as google_id_token
-from google.auth.transport.requests import Request as GoogleRequest
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_current_user, get_db, invalidate_cached_user
+from app.api.v1.auth.google_certs import google_certs
 from app.api.v1.users.schemas import UserResponse
+from app.api.v1.users.services import upsert_google_user
 from app.core.config import settings
 from app.core.security import create_access_token
 from sqlalchemy.orm import Session
-from app.api.v1.users.models import User
 
 
 router = APIRouter()
@@ -84,10 +83,18 @@ def callback(
             status_code=status.HTTP_400_BAD_REQUEST, detail="No id_token in response"
         )
 
-    # Verify the ID token
-    idinfo = google_id_token.verify_oauth2_token(
-        id_token, GoogleRequest(), settings.GOOGLE_CLIENT_ID
-    )
+    # Verify the ID token against the process-wide cache of Google's certs
+    try:
+        idinfo = google_certs.verify_id_token(id_token, settings.GOOGLE_CLIENT_ID)
+    except requests.RequestException as exc:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="Failed to fetch Google certificates",
+        ) from exc
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid ID token"
+        ) from exc
 
     email = idinfo.get("email")
     email_verified = idinfo.get("email_verified")
@@ -102,27 +109,9 @@ def callback(
             status_code=status.HTTP_403_FORBIDDEN, detail="Email domain not allowed"
         )
 
-    # Upsert user (JIT provisioning)
-    user_id = idinfo.get("sub")
-    existing: User | None = db.get(User, user_id)
-    if existing:
-        existing.email = email
-        existing.name = idinfo.get("name")
-        existing.profile_picture = idinfo.get("picture")
-        # Update last_login
-        from datetime import datetime
-
-        existing.last_login = datetime.utcnow()
-    else:
-        db.add(
-            User(
-                id=user_id,
-                email=email,
-                name=idinfo.get("name"),
-                profile_picture=idinfo.get("picture"),
-            )
-        )
-    db.commit()
+    # Upsert user (JIT provisioning) in one INSERT ... ON CONFLICT statement
+    user_id = upsert_google_user(db, idinfo)
+    invalidate_cached_user(user_id)
 
     # Issue app JWT
     payload = {
@@ -0,0 +1,143 @@
+"""
+Process-wide cache of Google's ID-token signing certificates.
+
+google.oauth2.id_token.verify_oauth2_token() downloads the certificates on
+every call. Here they are fetched once per process and kept for the
+Cache-Control max-age Google serves them with (minus the Age header). Within
+GOOGLE_CERTS_REFRESH_MARGIN_SECONDS of expiry the next login starts a
+background refresh and keeps using the current set meanwhile, so logins only
+wait on the network for the very first fetch, or after the set has lapsed.
+Tokens signed with a key id the cached set lacks (Google rotated its keys)
+trigger one throttled synchronous refetch.
+
+GOOGLE_CERTS_URL points at Google's PEM endpoint; set it to a local stand-in
+serving the same {key id: PEM certificate} JSON to verify tokens offline.
+"""
+
+import logging
+import re
+import threading
+import time
+from typing import Optional
+
+import requests
+from google.auth import jwt as google_jwt
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+
+_MAX_AGE = re.compile(r"(?:^|,)\s*max-age\s*=\s*(\d+)", re.IGNORECASE)
+# Minimum spacing of refetches forced by an unknown key id
+_UNKNOWN_KID_REFETCH_SECONDS = 30.0
+
+
+def _max_age(response: requests.Response) -> float:
+    """Seconds the response may be cached for, per Cache-Control and Age."""
+    match = _MAX_AGE.search(response.headers.get("Cache-Control", ""))
+    if match is None:
+        return settings.GOOGLE_CERTS_DEFAULT_MAX_AGE_SECONDS
+    try:
+        age = int(response.headers.get("Age", 0))
+    except ValueError:
+        age = 0
+    return max(int(match.group(1)) - age, 0)
+
+
+class GoogleCertCache:
+    """Thread-safe cache of one certificate endpoint's {key id: PEM} set."""
+
+    def __init__(self, url: str):
+        self.url = url
+        self._lock = threading.Lock()
+        self._fetch_lock = threading.Lock()
+        self._certs: Optional[dict[str, str]] = None
+        self._expires_at = 0.0
+        self._fetched_at = 0.0
+        self._refreshing = False
+
+    def _fetch(self) -> dict[str, str]:
+        response = requests.get(self.url, timeout=10)
+        response.raise_for_status()
+        certs = response.json()
+        now = time.monotonic()
+        with self._lock:
+            self._certs = certs
+            self._expires_at = now + _max_age(response)
+            self._fetched_at = now
+        return certs
+
+    def _fetch_unless_fresh(self, fetched_before: float) -> dict[str, str]:
+        """Fetch, unless another thread did so since fetched_before (single flight)."""
+        with self._fetch_lock:
+            with self._lock:
+                if self._fetched_at > fetched_before and self._certs is not None:
+                    return self._certs
+            return self._fetch()
+
+    def _background_refresh(self) -> None:
+        try:
+            self._fetch_unless_fresh(self._fetched_at)
+        except Exception:
+            # The current set stays in use until it expires
+            logger.exception("Refreshing Google certificates failed")
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def certs(self) -> dict[str, str]:
+        """The current certificate set, fetching it if missing or expired."""
+        now = time.monotonic()
+        with self._lock:
+            certs, expires_at, fetched_at = (
+                self._certs,
+                self._expires_at,
+                self._fetched_at,
+            )
+            refresh = (
+                certs is not None
+                and now < expires_at
+                and now >= expires_at - settings.GOOGLE_CERTS_REFRESH_MARGIN_SECONDS
+                and not self._refreshing
+            )
+            if refresh:
+                self._refreshing = True
+        if refresh:
+            threading.Thread(
+                target=self._background_refresh,
+                name="google-certs-refresh",
+                daemon=True,
+            ).start()
+        if certs is not None and now < expires_at:
+            return certs
+        return self._fetch_unless_fresh(fetched_at)
+
+    def _certs_for(self, token: str) -> dict[str, str]:
+        """The cached set, refetched once if it lacks the token's key id."""
+        certs = self.certs()
+        key_id = google_jwt.decode_header(token).get("kid")
+        if key_id is None or key_id in certs:
+            return certs
+        with self._lock:
+            fetched_at = self._fetched_at
+        if time.monotonic() - fetched_at < _UNKNOWN_KID_REFETCH_SECONDS:
+            return certs
+        return self._fetch_unless_fresh(fetched_at)
+
+    def verify_id_token(self, token: str, audience: str) -> dict:
+        """
+        Verify a Google ID token's signature, expiry, audience and issuer and
+        return its claims, like verify_oauth2_token(). Raises ValueError
+        (google.auth.exceptions errors subclass it) when the token is invalid.
+        """
+        claims = google_jwt.decode(
+            token, certs=self._certs_for(token), audience=audience
+        )
+        if claims.get("iss") not in GOOGLE_ISSUERS:
+            raise ValueError(f"Wrong issuer: {claims.get('iss')}")
+        return claims
+
+
+google_certs = GoogleCertCache(settings.GOOGLE_CERTS_URL)
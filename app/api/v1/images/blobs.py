@@ -0,0 +1,140 @@
+"""
+Content-addressed image storage (IMAGE_CONTENT_ADDRESSED).
+
+Identical bytes share one stored object, tracked by an `ImageBlob` row keyed
+by SHA-256 that counts the image rows pointing at it. The first upload of some
+content becomes the shared object; later uploads of the same bytes point at
+it and their own copy is queued for deletion. Deleting an image queues the
+shared object (and its variants) for deletion only with its last reference.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.api.v1.images.models import ImageBlob, ListingImage, PropertyImage
+from app.api.v1.images.storage import ObjectHead
+
+
+def stored_blob_keys(db: Session, hashes: list[str]) -> dict[str, str]:
+    """Map each already-stored SHA-256 in hashes to its shared storage key."""
+    if not hashes:
+        return {}
+    rows = db.execute(
+        select(ImageBlob.sha256, ImageBlob.storage_key).where(
+            ImageBlob.sha256.in_(hashes)
+        )
+    ).all()
+    return {row.sha256: row.storage_key for row in rows}
+
+
+def lock_blob(db: Session, sha256: str, storage_key: str) -> Optional[ImageBlob]:
+    """
+    Return the blob for sha256 stored under storage_key, locked FOR UPDATE so
+    a concurrent release cannot drop it before the caller adds its reference.
+    """
+    return (
+        db.query(ImageBlob)
+        .where(ImageBlob.sha256 == sha256, ImageBlob.storage_key == storage_key)
+        .with_for_update()
+        .first()
+    )
+
+
+def acquire_blob(db: Session, storage_key: str, head: ObjectHead) -> tuple[str, bool]:
+    """
+    Add a reference to the blob for head.sha256, creating it at storage_key
+    if the content is new.
+
+    Returns (shared storage key, whether the blob was just created).
+    """
+    row = db.execute(
+        pg_insert(ImageBlob)
+        .values(
+            sha256=head.sha256,
+            storage_key=storage_key,
+            byte_size=head.byte_size,
+            content_type=head.content_type,
+            ref_count=1,
+        )
+        .on_conflict_do_update(
+            index_elements=[ImageBlob.sha256],
+            set_={
+                "ref_count": ImageBlob.ref_count + 1,
+                "updated_at": datetime.utcnow(),
+            },
+        )
+        .returning(ImageBlob.storage_key, ImageBlob.ref_count)
+    ).one()
+    return row.storage_key, row.ref_count == 1
+
+
+def release_blob(db: Session, storage_key: str) -> Optional[bool]:
+    """
+    Drop one reference to the blob stored under storage_key.
+
+    Returns None if storage_key is not a shared object, True if that was the
+    last reference (the blob row is removed), False if others remain.
+    """
+    row = db.execute(
+        update(ImageBlob)
+        .where(ImageBlob.storage_key == storage_key)
+        .values(ref_count=ImageBlob.ref_count - 1, updated_at=datetime.utcnow())
+        .returning(ImageBlob.sha256, ImageBlob.ref_count)
+    ).first()
+    if row is None:
+        return None
+    if row.ref_count > 0:
+        return False
+    db.execute(delete(ImageBlob).where(ImageBlob.sha256 == row.sha256))
+    return True
+
+
+def is_shared_object(db: Session, storage_key: str) -> bool:
+    """Whether storage_key is a shared object still referenced by images."""
+    return (
+        db.scalar(select(ImageBlob.sha256).where(ImageBlob.storage_key == storage_key))
+        is not None
+    )
+
+
+def shared_image_fields(db: Session, storage_key: str, image_model) -> dict:
+    """
+    Dimensions, placeholder and variants already rendered for a shared object
+    by any image row, so a new reference can reuse them; {} if none yet. New
+    listing images also reuse the perceptual hashes of a listing image that
+    shares the object, when one has been hashed.
+    """
+    fields = {}
+    for shared_model in (PropertyImage, ListingImage):
+        row = db.execute(
+            select(
+                shared_model.width,
+                shared_model.height,
+                shared_model.placeholder,
+                shared_model.variants,
+            )
+            .where(
+                shared_model.storage_key == storage_key,
+                shared_model.variants.is_not(None),
+            )
+            .limit(1)
+        ).first()
+        if row is not None:
+            fields = dict(row._mapping)
+            break
+    if fields and image_model is ListingImage:
+        row = db.execute(
+            select(ListingImage.phash, ListingImage.dhash)
+            .where(
+                ListingImage.storage_key == storage_key,
+                ListingImage.phash.is_not(None),
+            )
+            .limit(1)
+        ).first()
+        if row is not None:
+            fields.update(row._mapping)
+    return fields
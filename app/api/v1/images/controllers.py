@@ -1,33 +1,55 @@
+from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Header, Query, Request, Response, status
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db
+from app.api.deps import get_current_admin, get_db
 from app.api.v1.images.schemas import (
     BulkImageFinalizeRequest,
     BulkImageUploadUrlsRequest,
     BulkImageUploadUrlsResponse,
     ImageFinalizeRequest,
     ImageListResponse,
+    ImageMultipartAbortRequest,
+    ImageMultipartCompleteRequest,
+    ImageMultipartResumeRequest,
+    ImageMultipartResumeResponse,
+    ImageOrderRequest,
     ImageResponse,
     ImageUploadUrlRequest,
     ImageUploadUrlResponse,
+    ListingGalleryResponse,
+    ListingImageDuplicatesResponse,
 )
 from app.api.v1.images.services import (
+    abort_listing_multipart_upload,
+    abort_property_multipart_upload,
+    complete_listing_multipart_upload,
+    complete_property_multipart_upload,
     create_listing_upload_url,
     create_listing_upload_urls,
     create_property_upload_url,
     create_property_upload_urls,
     delete_listing_image,
     delete_property_image,
+    etag_matches,
     finalize_listing_image,
     finalize_listing_images,
     finalize_property_image,
     finalize_property_images,
+    get_listing_gallery,
+    get_listing_image_duplicates,
     get_listing_images,
     get_property_images,
+    reorder_listing_images,
+    reorder_property_images,
+    resume_listing_multipart_upload,
+    resume_property_multipart_upload,
+    upload_listing_image,
+    upload_property_image,
 )
+from app.api.v1.users.models import User
 
 router = APIRouter()
 
@@ -46,26 +68,30 @@ def get_property_images_controller(
     "/properties/{property_id}/images/upload-url",
     response_model=ImageUploadUrlResponse,
 )
-def post_property_upload_url_controller(
+async def post_property_upload_url_controller(
     property_id: UUID,
     payload: ImageUploadUrlRequest,
     db: Session = Depends(get_db),
 ):
     """Generate a pre-signed S3 upload URL for a property image."""
-    return create_property_upload_url(db=db, property_id=property_id, payload=payload)
+    return await create_property_upload_url(
+        db=db, property_id=property_id, payload=payload
+    )
 
 
 @router.post(
     "/properties/{property_id}/images/upload-urls",
     response_model=BulkImageUploadUrlsResponse,
 )
-def post_property_upload_urls_controller(
+async def post_property_upload_urls_controller(
     property_id: UUID,
     payload: BulkImageUploadUrlsRequest,
     db: Session = Depends(get_db),
 ):
     """Generate pre-signed S3 upload URLs for many property images."""
-    return create_property_upload_urls(db=db, property_id=property_id, payload=payload)
+    return await create_property_upload_urls(
+        db=db, property_id=property_id, payload=payload
+    )
 
 
 @router.post(
@@ -73,13 +99,42 @@ def post_property_upload_urls_controller(
     response_model=ImageResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def post_property_image_controller(
+async def post_property_image_controller(
     property_id: UUID,
     payload: ImageFinalizeRequest,
     db: Session = Depends(get_db),
 ):
     """Finalize an uploaded property image and persist its metadata."""
-    return finalize_property_image(db=db, property_id=property_id, payload=payload)
+    return await finalize_property_image(
+        db=db, property_id=property_id, payload=payload
+    )
+
+
+@router.post(
+    "/properties/{property_id}/images/upload",
+    response_model=ImageResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def upload_property_image_controller(
+    property_id: UUID,
+    request: Request,
+    display_order: Optional[int] = Query(None, ge=0),
+    db: Session = Depends(get_db),
+):
+    """
+    Upload a property image through the API and finalize it in one request.
+
+    For clients that cannot PUT to pre-signed URLs: send the raw image bytes as
+    the request body. The body is streamed to storage in parts, sniffed for an
+    image type and capped in size as it arrives.
+    """
+    return await upload_property_image(
+        db=db,
+        property_id=property_id,
+        body=request.stream(),
+        content_length=request.headers.get("content-length"),
+        display_order=display_order,
+    )
 
 
 @router.post(
@@ -87,13 +142,74 @@ def post_property_image_controller(
     response_model=ImageListResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def post_property_images_batch_controller(
+async def post_property_images_batch_controller(
     property_id: UUID,
     payload: BulkImageFinalizeRequest,
     db: Session = Depends(get_db),
 ):
     """Finalize many uploaded property images and persist their metadata."""
-    return finalize_property_images(db=db, property_id=property_id, payload=payload)
+    return await finalize_property_images(
+        db=db, property_id=property_id, payload=payload
+    )
+
+
+@router.post(
+    "/properties/{property_id}/images/multipart/complete",
+    response_model=ImageResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def post_property_multipart_complete_controller(
+    property_id: UUID,
+    payload: ImageMultipartCompleteRequest,
+    db: Session = Depends(get_db),
+):
+    """Assemble the uploaded parts of a property image and finalize it."""
+    return await complete_property_multipart_upload(
+        db=db, property_id=property_id, payload=payload
+    )
+
+
+@router.post(
+    "/properties/{property_id}/images/multipart/abort",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def post_property_multipart_abort_controller(
+    property_id: UUID,
+    payload: ImageMultipartAbortRequest,
+    db: Session = Depends(get_db),
+):
+    """Discard a multipart property image upload and its uploaded parts."""
+    await abort_property_multipart_upload(
+        db=db, property_id=property_id, payload=payload
+    )
+
+
+@router.post(
+    "/properties/{property_id}/images/multipart/parts",
+    response_model=ImageMultipartResumeResponse,
+)
+async def post_property_multipart_parts_controller(
+    property_id: UUID,
+    payload: ImageMultipartResumeRequest,
+    db: Session = Depends(get_db),
+):
+    """
+    Resume a multipart property image upload: list the parts already stored
+    and presign fresh URLs for the rest.
+    """
+    return await resume_property_multipart_upload(
+        db=db, property_id=property_id, payload=payload
+    )
+
+
+@router.put("/properties/{property_id}/images/order", response_model=ImageListResponse)
+def reorder_property_images_controller(
+    property_id: UUID,
+    payload: ImageOrderRequest,
+    db: Session = Depends(get_db),
+):
+    """Reorder a property's images; image_ids must list every image once."""
+    return reorder_property_images(db=db, property_id=property_id, payload=payload)
 
 
 @router.delete(
@@ -105,7 +221,7 @@ def delete_property_image_controller(
     image_id: UUID,
     db: Session = Depends(get_db),
 ):
-    """Delete a property image from both S3 and the database."""
+    """Delete a property image; its S3 object is removed in the background."""
     delete_property_image(db=db, property_id=property_id, image_id=image_id)
 
 
@@ -119,30 +235,74 @@ def get_listing_images_controller(
     return get_listing_images(db=db, listing_id=listing_id)
 
 
+@router.get(
+    "/listings/{listing_id}/gallery",
+    response_model=ListingGalleryResponse,
+    responses={304: {"description": "Gallery unchanged since the given ETag"}},
+)
+def get_listing_gallery_controller(
+    listing_id: UUID,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    """
+    Return the listing's images followed by its property's shared images,
+    each tagged with its source. Send the ETag back in If-None-Match to get
+    304 Not Modified while the gallery is unchanged.
+    """
+    gallery, etag = get_listing_gallery(db=db, listing_id=listing_id)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return gallery
+
+
+@router.get(
+    "/listings/{listing_id}/images/duplicates",
+    response_model=ListingImageDuplicatesResponse,
+)
+def get_listing_image_duplicates_controller(
+    listing_id: UUID,
+    db: Session = Depends(get_db),
+    admin: User = Depends(get_current_admin),
+):
+    """
+    Admin only: near-duplicates of the listing's photos in other listings
+    (perceptual hash match), to review spam and cross-posted listings.
+    """
+    return get_listing_image_duplicates(db=db, listing_id=listing_id)
+
+
 @router.post(
     "/listings/{listing_id}/images/upload-url",
     response_model=ImageUploadUrlResponse,
 )
-def post_listing_upload_url_controller(
+async def post_listing_upload_url_controller(
     listing_id: UUID,
     payload: ImageUploadUrlRequest,
     db: Session = Depends(get_db),
 ):
     """Generate a pre-signed S3 upload URL for a listing image."""
-    return create_listing_upload_url(db=db, listing_id=listing_id, payload=payload)
+    return await create_listing_upload_url(
+        db=db, listing_id=listing_id, payload=payload
+    )
 
 
 @router.post(
     "/listings/{listing_id}/images/upload-urls",
     response_model=BulkImageUploadUrlsResponse,
 )
-def post_listing_upload_urls_controller(
+async def post_listing_upload_urls_controller(
     listing_id: UUID,
     payload: BulkImageUploadUrlsRequest,
     db: Session = Depends(get_db),
 ):
     """Generate pre-signed S3 upload URLs for many listing images."""
-    return create_listing_upload_urls(db=db, listing_id=listing_id, payload=payload)
+    return await create_listing_upload_urls(
+        db=db, listing_id=listing_id, payload=payload
+    )
 
 
 @router.post(
@@ -150,13 +310,39 @@ def post_listing_upload_urls_controller(
     response_model=ImageResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def post_listing_image_controller(
+async def post_listing_image_controller(
     listing_id: UUID,
     payload: ImageFinalizeRequest,
     db: Session = Depends(get_db),
 ):
     """Finalize an uploaded listing image and persist its metadata."""
-    return finalize_listing_image(db=db, listing_id=listing_id, payload=payload)
+    return await finalize_listing_image(db=db, listing_id=listing_id, payload=payload)
+
+
+@router.post(
+    "/listings/{listing_id}/images/upload",
+    response_model=ImageResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def upload_listing_image_controller(
+    listing_id: UUID,
+    request: Request,
+    display_order: Optional[int] = Query(None, ge=0),
+    db: Session = Depends(get_db),
+):
+    """
+    Upload a listing image through the API and finalize it in one request.
+
+    Send the raw image bytes as the request body; see the property upload
+    endpoint for details.
+    """
+    return await upload_listing_image(
+        db=db,
+        listing_id=listing_id,
+        body=request.stream(),
+        content_length=request.headers.get("content-length"),
+        display_order=display_order,
+    )
 
 
 @router.post(
@@ -164,13 +350,70 @@ def post_listing_image_controller(
     response_model=ImageListResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def post_listing_images_batch_controller(
+async def post_listing_images_batch_controller(
     listing_id: UUID,
     payload: BulkImageFinalizeRequest,
     db: Session = Depends(get_db),
 ):
     """Finalize many uploaded listing images and persist their metadata."""
-    return finalize_listing_images(db=db, listing_id=listing_id, payload=payload)
+    return await finalize_listing_images(db=db, listing_id=listing_id, payload=payload)
+
+
+@router.post(
+    "/listings/{listing_id}/images/multipart/complete",
+    response_model=ImageResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def post_listing_multipart_complete_controller(
+    listing_id: UUID,
+    payload: ImageMultipartCompleteRequest,
+    db: Session = Depends(get_db),
+):
+    """Assemble the uploaded parts of a listing image and finalize it."""
+    return await complete_listing_multipart_upload(
+        db=db, listing_id=listing_id, payload=payload
+    )
+
+
+@router.post(
+    "/listings/{listing_id}/images/multipart/abort",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def post_listing_multipart_abort_controller(
+    listing_id: UUID,
+    payload: ImageMultipartAbortRequest,
+    db: Session = Depends(get_db),
+):
+    """Discard a multipart listing image upload and its uploaded parts."""
+    await abort_listing_multipart_upload(db=db, listing_id=listing_id, payload=payload)
+
+
+@router.post(
+    "/listings/{listing_id}/images/multipart/parts",
+    response_model=ImageMultipartResumeResponse,
+)
+async def post_listing_multipart_parts_controller(
+    listing_id: UUID,
+    payload: ImageMultipartResumeRequest,
+    db: Session = Depends(get_db),
+):
+    """
+    Resume a multipart listing image upload: list the parts already stored
+    and presign fresh URLs for the rest.
+    """
+    return await resume_listing_multipart_upload(
+        db=db, listing_id=listing_id, payload=payload
+    )
+
+
+@router.put("/listings/{listing_id}/images/order", response_model=ImageListResponse)
+def reorder_listing_images_controller(
+    listing_id: UUID,
+    payload: ImageOrderRequest,
+    db: Session = Depends(get_db),
+):
+    """Reorder a listing's images; image_ids must list every image once."""
+    return reorder_listing_images(db=db, listing_id=listing_id, payload=payload)
 
 
 @router.delete(
@@ -182,5 +425,5 @@ def delete_listing_image_controller(
     image_id: UUID,
     db: Session = Depends(get_db),
 ):
-    """Delete a listing image from both S3 and the database."""
+    """Delete a listing image; its S3 object is removed in the background."""
     delete_listing_image(db=db, listing_id=listing_id, image_id=image_id)
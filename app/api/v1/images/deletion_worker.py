@@ -0,0 +1,106 @@
+"""
+Background worker that drains the storage_deletions outbox.
+
+Image deletes only remove the DB row and enqueue its storage key (in the same
+transaction); this worker deletes the objects in batches (S3 multi-object
+delete on the S3 backend) and reschedules failures with exponential backoff.
+"""
+
+import logging
+import threading
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from app.api.v1.images.exceptions import S3Error
+from app.api.v1.images.models import StorageDeletion
+from app.api.v1.images.storage import get_storage
+from app.core.config import settings
+from app.db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    """Exponential backoff for the given attempt count, capped at the max delay."""
+    seconds = settings.STORAGE_DELETION_RETRY_BASE_SECONDS * 2 ** (attempts - 1)
+    return timedelta(seconds=min(seconds, settings.STORAGE_DELETION_RETRY_MAX_SECONDS))
+
+
+def drain_storage_deletions(db: Session, batch_size: int) -> int:
+    """
+    Process one batch of due outbox rows and return how many were claimed.
+
+    Rows are claimed with FOR UPDATE SKIP LOCKED so several app processes can
+    run the worker against the same table without double-deleting.
+    """
+    now = datetime.utcnow()
+    rows = db.scalars(
+        select(StorageDeletion)
+        .where(StorageDeletion.next_attempt_at <= now)
+        .order_by(StorageDeletion.next_attempt_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    ).all()
+    if not rows:
+        db.commit()
+        return 0
+
+    keys = list(dict.fromkeys(row.storage_key for row in rows))
+    try:
+        errors = get_storage().delete_many(keys)
+    except S3Error as exc:
+        reason = str(exc.__cause__ or exc)
+        errors = {key: reason for key in keys}
+
+    done_ids = [row.id for row in rows if row.storage_key not in errors]
+    if done_ids:
+        db.execute(
+            delete(StorageDeletion)
+            .where(StorageDeletion.id.in_(done_ids))
+            .execution_options(synchronize_session=False)
+        )
+    for row in rows:
+        if row.storage_key in errors:
+            row.attempts += 1
+            row.next_attempt_at = now + _retry_delay(row.attempts)
+            row.last_error = errors[row.storage_key]
+    db.commit()
+
+    if errors:
+        logger.warning(
+            "Storage deletion failed for %d of %d objects; will retry",
+            len(errors),
+            len(keys),
+        )
+    return len(rows)
+
+
+def run_storage_deletion_worker(stop_event: threading.Event) -> None:
+    """Poll the outbox until stop_event is set, draining full batches back to back."""
+    batch_size = settings.STORAGE_DELETION_BATCH_SIZE
+    while not stop_event.is_set():
+        try:
+            with SessionLocal() as db:
+                while (
+                    drain_storage_deletions(db, batch_size) == batch_size
+                    and not stop_event.is_set()
+                ):
+                    pass
+        except Exception:
+            logger.exception("Storage deletion worker pass failed")
+        stop_event.wait(settings.STORAGE_DELETION_POLL_SECONDS)
+
+
+def start_storage_deletion_worker() -> tuple[threading.Thread, threading.Event]:
+    """Start the outbox worker on a daemon thread; set the event to stop it."""
+    stop_event = threading.Event()
+    thread = threading.Thread(
+        target=run_storage_deletion_worker,
+        args=(stop_event,),
+        name="storage-deletion-worker",
+        daemon=True,
+    )
+    thread.start()
+    return thread, stop_event
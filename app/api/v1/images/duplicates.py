@@ -0,0 +1,310 @@
+"""
+Near-duplicate detection for listing photos with perceptual hashes.
+
+The variant task stores a 64-bit pHash (DCT) and dHash (gradient) for each
+listing image. Lookups use an in-process banded (multi-index) table over the
+pHashes, so a radius search touches a small fraction of the images instead
+of scanning all of them; dHash distance is then checked to weed out pHash
+collisions.
+Each process keeps its own index, synced incrementally from the database.
+"""
+
+import math
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from functools import cache
+from typing import Optional
+from uuid import UUID
+
+from PIL import Image
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.api.v1.images.models import ListingImage
+from app.api.v1.listings.models import Listing
+from app.core.config import settings
+
+HASH_BITS = 64
+_HASH_MASK = (1 << HASH_BITS) - 1
+BAND_BITS = 16
+_BAND_MASK = (1 << BAND_BITS) - 1
+
+# pHash: DCT of a 32x32 grayscale thumbnail, keeping the 8x8 lowest frequencies
+_PHASH_SIZE = 32
+_PHASH_LOW = 8
+_DCT_COS = [
+    [
+        math.cos((2 * x + 1) * u * math.pi / (2 * _PHASH_SIZE))
+        for x in range(_PHASH_SIZE)
+    ]
+    for u in range(_PHASH_LOW)
+]
+
+
+def _to_signed(value: int) -> int:
+    """Fit an unsigned 64-bit hash into a signed BIGINT column."""
+    return value - (1 << HASH_BITS) if value >= 1 << (HASH_BITS - 1) else value
+
+
+def _bits(flags) -> int:
+    value = 0
+    for flag in flags:
+        value = (value << 1) | int(flag)
+    return _to_signed(value)
+
+
+def dhash(image: Image.Image) -> int:
+    """Difference hash: whether each pixel of a 9x8 thumbnail is darker than its right neighbour."""
+    pixels = list(image.convert("L").resize((9, 8), Image.Resampling.LANCZOS).getdata())
+    return _bits(
+        pixels[row * 9 + col] < pixels[row * 9 + col + 1]
+        for row in range(8)
+        for col in range(8)
+    )
+
+
+def phash(image: Image.Image) -> int:
+    """Perceptual hash: low-frequency DCT coefficients above their median."""
+    size = _PHASH_SIZE
+    pixels = list(
+        image.convert("L").resize((size, size), Image.Resampling.LANCZOS).getdata()
+    )
+    # Separable 2-D DCT-II, computing only the coefficients that are kept
+    rows = [
+        [
+            sum(p * c for p, c in zip(pixels[y * size : (y + 1) * size], _DCT_COS[u]))
+            for u in range(_PHASH_LOW)
+        ]
+        for y in range(size)
+    ]
+    coefficients = [
+        sum(_DCT_COS[v][y] * rows[y][u] for y in range(size))
+        for v in range(_PHASH_LOW)
+        for u in range(_PHASH_LOW)
+    ]
+    median = sorted(coefficients)[len(coefficients) // 2]
+    return _bits(c > median for c in coefficients)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two (signed or unsigned) 64-bit hashes."""
+    return ((a ^ b) & _HASH_MASK).bit_count()
+
+
+@cache
+def _flip_masks(max_flips: int) -> tuple[int, ...]:
+    """Every band-sized mask with at most max_flips bits set."""
+    return tuple(
+        mask for mask in range(1 << BAND_BITS) if mask.bit_count() <= max_flips
+    )
+
+
+class BandedHashIndex:
+    """
+    Multi-index hashing over 64-bit hashes under Hamming distance.
+
+    Each hash is filed under its four 16-bit bands. If two hashes differ in
+    at most r bits, some band differs in at most r // 4 bits (pigeonhole), so
+    a search probes each band's value with up to r // 4 bits flipped and only
+    compares the hashes filed there: a few hundred lookups and a handful of
+    candidates per query regardless of index size, versus a full scan.
+    """
+
+    BANDS = HASH_BITS // BAND_BITS
+
+    def __init__(self):
+        self._tables: list[dict[int, list]] = [{} for _ in range(self.BANDS)]
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @staticmethod
+    def _bands(value: int) -> list[int]:
+        value &= _HASH_MASK
+        return [
+            (value >> (band * BAND_BITS)) & _BAND_MASK
+            for band in range(HASH_BITS // BAND_BITS)
+        ]
+
+    def add(self, value: int, item) -> None:
+        self._size += 1
+        for table, key in zip(self._tables, self._bands(value)):
+            table.setdefault(key, []).append((value, item))
+
+    def search(self, value: int, radius: int) -> list[tuple[int, int, object]]:
+        """Return (distance, hash, item) for every entry within radius."""
+        masks = _flip_masks(min(radius // self.BANDS, BAND_BITS))
+        found = {}
+        for table, key in zip(self._tables, self._bands(value)):
+            for mask in masks:
+                for indexed, item in table.get(key ^ mask, ()):
+                    if (indexed, item) not in found:
+                        distance = hamming_distance(value, indexed)
+                        if distance <= radius:
+                            found[indexed, item] = distance
+        return [
+            (distance, indexed, item) for (indexed, item), distance in found.items()
+        ]
+
+
+@dataclass(frozen=True)
+class DuplicateMatch:
+    """A listing image that looks like a near-duplicate of the probe."""
+
+    image_id: UUID
+    listing_id: UUID
+    owner_id: str
+    url: str
+    phash_distance: int
+    dhash_distance: int
+
+
+class DuplicateIndex:
+    """
+    Banded index of every hashed listing image, built in-process from the
+    database.
+
+    refresh() loads rows changed since the last sync (throttled to
+    IMAGE_DUPLICATE_INDEX_REFRESH_SECONDS); the index is rebuilt from scratch
+    every IMAGE_DUPLICATE_INDEX_REBUILD_SECONDS to drop deleted and re-hashed
+    images. Stale entries in between are filtered out when matches are
+    loaded from the database, and rows committed with a timestamp older than
+    the watermark are picked up by the next rebuild.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._table = BandedHashIndex()
+        self._hashes: dict[UUID, tuple[int, int]] = {}
+        self._watermark: Optional[datetime] = None
+        self._refreshed_at = 0.0
+        self._built_at: Optional[float] = None
+
+    def refresh(self, db: Session) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if (
+                self._built_at is None
+                or now - self._built_at
+                >= settings.IMAGE_DUPLICATE_INDEX_REBUILD_SECONDS
+            ):
+                self._table, self._hashes, self._watermark = BandedHashIndex(), {}, None
+                self._built_at = now
+            elif (
+                now - self._refreshed_at
+                < settings.IMAGE_DUPLICATE_INDEX_REFRESH_SECONDS
+            ):
+                return
+            query = select(
+                ListingImage.id,
+                ListingImage.phash,
+                ListingImage.dhash,
+                ListingImage.updated_at,
+            ).where(ListingImage.phash.is_not(None))
+            if self._watermark is not None:
+                # >= so rows sharing the watermark timestamp are not missed
+                query = query.where(ListingImage.updated_at >= self._watermark)
+            for row in db.execute(query.order_by(ListingImage.updated_at)):
+                if self._hashes.get(row.id) != (row.phash, row.dhash):
+                    self._hashes[row.id] = (row.phash, row.dhash)
+                    self._table.add(row.phash, row.id)
+                self._watermark = row.updated_at
+            self._refreshed_at = now
+
+    def candidates(self, value: int, radius: int) -> list[tuple[UUID, int]]:
+        """(image_id, phash distance) of indexed images within radius."""
+        with self._lock:
+            return [
+                (image_id, distance)
+                for distance, indexed, image_id in self._table.search(value, radius)
+                # Skip entries superseded by a later hash of the same image
+                if self._hashes.get(image_id, (None,))[0] == indexed
+            ]
+
+
+_index = DuplicateIndex()
+
+
+def find_near_duplicates(
+    db: Session, images: list[ListingImage]
+) -> dict[UUID, list[DuplicateMatch]]:
+    """
+    Near-duplicates of each hashed image among other, non-deleted listings,
+    closest first. Images without hashes yet map to an empty list.
+    """
+    _index.refresh(db)
+    candidates: dict[UUID, dict[UUID, int]] = {}
+    for image in images:
+        if image.phash is not None:
+            candidates[image.id] = dict(
+                _index.candidates(image.phash, settings.IMAGE_DUPLICATE_PHASH_DISTANCE)
+            )
+    candidate_ids = {cid for found in candidates.values() for cid in found}
+    rows = {}
+    if candidate_ids:
+        rows = {
+            row.id: row
+            for row in db.execute(
+                select(
+                    ListingImage.id,
+                    ListingImage.listing_id,
+                    ListingImage.url,
+                    ListingImage.dhash,
+                    Listing.owner_id,
+                )
+                .join(Listing, Listing.id == ListingImage.listing_id)
+                .where(
+                    ListingImage.id.in_(candidate_ids),
+                    Listing.deleted_at.is_(None),
+                )
+            )
+        }
+
+    results: dict[UUID, list[DuplicateMatch]] = {}
+    for image in images:
+        matches = []
+        for candidate_id, distance in candidates.get(image.id, {}).items():
+            row = rows.get(candidate_id)
+            if row is None or row.listing_id == image.listing_id:
+                continue
+            dhash_distance = hamming_distance(image.dhash, row.dhash)
+            if dhash_distance > settings.IMAGE_DUPLICATE_DHASH_DISTANCE:
+                continue
+            matches.append(
+                DuplicateMatch(
+                    image_id=row.id,
+                    listing_id=row.listing_id,
+                    owner_id=row.owner_id,
+                    url=row.url,
+                    phash_distance=distance,
+                    dhash_distance=dhash_distance,
+                )
+            )
+        matches.sort(key=lambda m: (m.phash_distance, m.dhash_distance))
+        results[image.id] = matches
+    return results
+
+
+def flag_duplicate_listing(db: Session, image_id: UUID) -> bool:
+    """
+    Mark a listing as a possible duplicate when a newly hashed image of it
+    near-matches a photo of another owner's listing. Reusing photos across
+    one owner's own listings is normal and not flagged. Returns whether the
+    listing was flagged; the caller commits.
+    """
+    image = db.get(ListingImage, image_id)
+    if image is None or image.phash is None:
+        return False
+    owner_id = db.scalar(select(Listing.owner_id).where(Listing.id == image.listing_id))
+    matches = find_near_duplicates(db, [image])[image.id]
+    if not any(match.owner_id != owner_id for match in matches):
+        return False
+    db.execute(
+        update(Listing)
+        .where(Listing.id == image.listing_id)
+        .values(possible_duplicate=True)
+    )
+    return True
@@ -1,6 +1,10 @@
 class S3ObjectNotFoundError(Exception):
-    """Raised when a head_object call returns 404."""
+    """Raised when a storage object that must exist is not found."""
+
+
+class S3MultipartUploadError(Exception):
+    """Raised when a multipart upload cannot be completed from the given id and parts."""
 
 
 class S3Error(Exception):
-    """Raised for generic S3/boto3 errors."""
+    """Raised for generic storage backend errors (S3/boto3 or local filesystem)."""
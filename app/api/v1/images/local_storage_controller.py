@@ -0,0 +1,179 @@
+from email.parser import BytesParser
+from email.policy import HTTP
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import FileResponse
+
+from app.api.v1.images.exceptions import S3Error
+from app.api.v1.images.storage import LocalStorage, get_storage
+from app.core.config import settings
+
+router = APIRouter()
+
+# Allowance for form fields and multipart framing around a POSTed file
+FORM_OVERHEAD_BYTES = 64 * 1024
+
+
+def _local_storage() -> LocalStorage:
+    """Return the local backend; these routes only exist when it is selected."""
+    storage = get_storage()
+    if not isinstance(storage, LocalStorage):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    return storage
+
+
+def _forbidden() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="Invalid or expired upload signature",
+    )
+
+
+async def _read_body(request: Request, limit: int) -> bytes:
+    """Read a request body, rejecting it as soon as it exceeds limit bytes."""
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > limit:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="EntityTooLarge",
+            )
+    return bytes(body)
+
+
+def _parse_form(body: bytes, content_type: str) -> dict[str, bytes]:
+    """Split a multipart/form-data body into field name -> raw value."""
+    message = BytesParser(policy=HTTP).parsebytes(
+        b"Content-Type: " + content_type.encode() + b"\r\n\r\n" + body
+    )
+    if not message.is_multipart():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Expected a multipart/form-data body",
+        )
+    return {
+        part.get_param("name", header="content-disposition"): part.get_payload(
+            decode=True
+        )
+        for part in message.iter_parts()
+    }
+
+
+@router.post("", status_code=status.HTTP_204_NO_CONTENT)
+async def post_local_object(
+    request: Request,
+    content_type: str = Header("", alias="Content-Type"),
+):
+    """
+    Accept a presigned POST form upload, enforcing its signed policy like S3:
+    the file must be 1..max_bytes bytes with the signed Content-Type.
+    """
+    storage = _local_storage()
+    body = await _read_body(
+        request, settings.IMAGE_UPLOAD_MAX_BYTES + FORM_OVERHEAD_BYTES
+    )
+    form = _parse_form(body, content_type)
+    try:
+        key = form["key"].decode()
+        file_type = form["Content-Type"].decode()
+        max_bytes = int(form["max_bytes"])
+        expires = int(form["expires"])
+        signature = form["signature"].decode()
+        data = form["file"]
+    except (KeyError, ValueError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Missing or invalid form fields",
+        ) from exc
+    scope = storage.post_scope(file_type, max_bytes)
+    if not storage.verify_signature("POST", key, scope, expires, signature):
+        raise _forbidden()
+    if not 1 <= len(data) <= max_bytes:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="EntityTooLarge" if data else "EntityTooSmall",
+        )
+    try:
+        storage.put(key, data, file_type)
+    except S3Error as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid storage key",
+        ) from exc
+
+
+async def _put_local_part(
+    storage: LocalStorage,
+    key: str,
+    request: Request,
+    upload_id: str,
+    part_number: int,
+    expires: int,
+    signature: str,
+) -> Response:
+    """Accept a presigned multipart part PUT and return its ETag."""
+    content_length = request.headers.get("Content-Length", "")
+    if not content_length.isdigit():
+        raise HTTPException(
+            status_code=status.HTTP_411_LENGTH_REQUIRED,
+            detail="Content-Length is required",
+        )
+    scope = storage.part_scope(upload_id, part_number, int(content_length))
+    if not storage.verify_signature("PUT", key, scope, expires, signature):
+        raise _forbidden()
+    body = await _read_body(request, int(content_length))
+    try:
+        etag = storage.upload_part(key, upload_id, part_number, body)
+    except S3Error as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="NoSuchUpload",
+        ) from exc
+    return Response(status_code=status.HTTP_200_OK, headers={"ETag": etag})
+
+
+@router.put("/{key:path}", status_code=status.HTTP_200_OK)
+async def put_local_object(
+    key: str,
+    request: Request,
+    expires: int = Query(...),
+    signature: str = Query(...),
+    upload_id: Optional[str] = Query(None, alias="uploadId"),
+    part_number: Optional[int] = Query(None, alias="partNumber", ge=1),
+    content_type: str = Header("", alias="Content-Type"),
+):
+    """
+    Accept a presigned PUT, streaming the body to disk chunk by chunk; with
+    uploadId and partNumber, accept one part of a multipart upload instead.
+    """
+    storage = _local_storage()
+    if upload_id is not None and part_number is not None:
+        return await _put_local_part(
+            storage, key, request, upload_id, part_number, expires, signature
+        )
+    if not storage.verify_signature("PUT", key, content_type, expires, signature):
+        raise _forbidden()
+    try:
+        with storage.writer(key) as fh:
+            async for chunk in request.stream():
+                fh.write(chunk)
+    except S3Error as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid storage key",
+        ) from exc
+
+
+@router.get("/{key:path}")
+def get_local_object(key: str):
+    """Serve a stored object, like a public S3 object URL."""
+    storage = _local_storage()
+    try:
+        head = storage.head(key)
+    except S3Error as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND) from exc
+    if head is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    return FileResponse(storage.path_for(key), media_type=head.content_type)
@@ -1,7 +1,17 @@
 import uuid
+from datetime import datetime
 
-from sqlalchemy import Column, ForeignKey, Integer, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Text,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 
 from app.db.base import Base
 
@@ -15,6 +25,20 @@ class ImageBase(Base):
     storage_key = Column(Text, nullable=False)
     url = Column(Text, nullable=False)
     display_order = Column(Integer, nullable=False)
+    width = Column(Integer, nullable=True, comment="Display width in pixels")
+    height = Column(Integer, nullable=True, comment="Display height in pixels")
+    byte_size = Column(BigInteger, nullable=True)
+    content_type = Column(Text, nullable=True)
+    placeholder = Column(
+        Text,
+        nullable=True,
+        comment="Low-quality image placeholder as a data: URI",
+    )
+    variants = Column(
+        JSONB,
+        nullable=True,
+        comment="Resized variants by format: {format: [{key, url, width, height}]}",
+    )
 
     # created_at, updated_at from Base
 
@@ -52,3 +76,61 @@ class ListingImage(ImageBase):
         nullable=False,
         comment="Property ID that this listing is associated with",
     )
+    phash = Column(
+        BigInteger,
+        nullable=True,
+        comment="64-bit DCT perceptual hash (signed), for near-duplicate lookup",
+    )
+    dhash = Column(
+        BigInteger,
+        nullable=True,
+        comment="64-bit difference hash (signed), confirms pHash matches",
+    )
+
+    __table_args__ = (
+        # Incremental syncs of the in-process duplicate index (duplicates.py)
+        Index(
+            "ix_listing_images_hashed_updated_at",
+            "updated_at",
+            postgresql_where=text("phash IS NOT NULL"),
+        ),
+    )
+
+
+class StorageDeletion(Base):
+    """
+    Outbox of storage objects waiting to be deleted. Rows are written in the
+    same transaction that deletes an image row and drained by a background
+    worker, so request latency does not depend on the storage provider.
+    """
+
+    __tablename__ = "storage_deletions"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    storage_key = Column(Text, nullable=False)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=datetime.utcnow,
+        index=True,
+        comment="Earliest time the worker may try this deletion again",
+    )
+    last_error = Column(Text, nullable=True)
+
+
+class ImageBlob(Base):
+    """
+    One stored object shared by every image row with identical bytes, used in
+    content-addressed mode (IMAGE_CONTENT_ADDRESSED). ref_count is the number
+    of image rows pointing at storage_key; the object (and its variants) is
+    queued for deletion when the last reference goes away.
+    """
+
+    __tablename__ = "image_blobs"
+
+    sha256 = Column(Text, primary_key=True, comment="Hex SHA-256 of the bytes")
+    storage_key = Column(Text, nullable=False, unique=True)
+    byte_size = Column(BigInteger, nullable=False)
+    content_type = Column(Text, nullable=True)
+    ref_count = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,188 @@
+"""
+Reconciliation of stored image objects against the image tables.
+
+Presigned uploads that are never finalized, and deletes whose outbox row was
+lost, leave objects under properties/{id}/images/ and
+properties/{id}/listings/{id}/images/ that no row references. This pages
+through a storage listing in key order and matches each page against the
+database with a few batched queries: an object is in use when it is an image
+row's storage_key, one of its variants, or a shared content-addressed blob.
+Unreferenced objects older than the grace period are orphans; queue_orphans()
+hands them to the storage_deletions outbox for the deletion worker.
+"""
+
+import re
+import uuid
+from dataclasses import dataclass, fields
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, Optional
+from uuid import UUID
+
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session
+
+from app.api.v1.images.models import (
+    ImageBlob,
+    ListingImage,
+    PropertyImage,
+    StorageDeletion,
+)
+from app.api.v1.images.storage import StorageBackend, StoredObject
+from app.api.v1.images.variants import variant_keys
+
+IMAGES_ROOT_PREFIX = "properties/"
+
+_UUID = r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+# Keys under a property or listing images prefix (see s3_utils.py)
+_IMAGE_KEY = re.compile(rf"^properties/{_UUID}/(?:listings/{_UUID}/)?images/[^/]+$")
+# Variant keys: <original stem>_<width>w.<format> (see variants.py)
+_VARIANT_KEY = re.compile(r"^(?P<stem>.+)_\d+w\.[a-z0-9]+$")
+
+
+@dataclass
+class ReconcileStats:
+    """Object counts for one page or a whole run."""
+
+    scanned: int = 0
+    skipped: int = 0
+    referenced: int = 0
+    recent: int = 0
+    queued: int = 0
+    orphans: int = 0
+    orphan_bytes: int = 0
+
+    def add(self, other: "ReconcileStats") -> None:
+        for item in fields(self):
+            setattr(
+                self, item.name, getattr(self, item.name) + getattr(other, item.name)
+            )
+
+
+@dataclass
+class ReconcilePage:
+    """
+    Result of reconciling one listing page. last_key is where the next page
+    starts (checkpoint it to resume); done is set on the final page.
+    """
+
+    orphans: list[StoredObject]
+    stats: ReconcileStats
+    last_key: Optional[str]
+    done: bool
+
+
+def _group(key: str) -> str:
+    """An original's key without extension; its variants share it."""
+    match = _VARIANT_KEY.match(key)
+    return match.group("stem") if match else key.rsplit(".", 1)[0]
+
+
+def _image_id(key: str) -> Optional[UUID]:
+    """The image id an original or variant key was generated from, if any."""
+    name = key.rsplit("/", 1)[-1]
+    try:
+        return uuid.UUID(re.split(r"[._]", name, maxsplit=1)[0])
+    except ValueError:
+        return None
+
+
+def referenced_keys(db: Session, keys: list[str]) -> set[str]:
+    """
+    The subset of keys still in use. Rows are looked up by storage_key and by
+    the image id embedded in the key, which finds variants whose original is
+    gone; a shared blob's variants are found through the rows that share it.
+    """
+    ids = {image_id for image_id in map(_image_id, keys) if image_id is not None}
+    in_use = set()
+    for image_model in (PropertyImage, ListingImage):
+        rows = db.execute(
+            select(image_model.storage_key, image_model.variants).where(
+                or_(image_model.storage_key.in_(keys), image_model.id.in_(ids))
+            )
+        )
+        for row in rows:
+            in_use.add(row.storage_key)
+            in_use.update(variant_keys(row.variants))
+    in_use.update(
+        db.scalars(select(ImageBlob.storage_key).where(ImageBlob.storage_key.in_(keys)))
+    )
+    return in_use & set(keys)
+
+
+def queued_keys(db: Session, keys: list[str]) -> set[str]:
+    """The subset of keys already waiting in the storage_deletions outbox."""
+    if not keys:
+        return set()
+    return set(
+        db.scalars(
+            select(StorageDeletion.storage_key).where(
+                StorageDeletion.storage_key.in_(keys)
+            )
+        )
+    )
+
+
+def reconcile_objects(
+    db: Session, objects: list[StoredObject], cutoff: datetime
+) -> tuple[list[StoredObject], ReconcileStats]:
+    """Orphans among objects (modified before cutoff) and the page's counts."""
+    stats = ReconcileStats(scanned=len(objects))
+    images = [obj for obj in objects if _IMAGE_KEY.match(obj.key)]
+    stats.skipped = len(objects) - len(images)
+    in_use = referenced_keys(db, [obj.key for obj in images]) if images else set()
+    stats.referenced = len(in_use)
+    unreferenced = [obj for obj in images if obj.key not in in_use]
+    stale = [obj for obj in unreferenced if obj.last_modified < cutoff]
+    stats.recent = len(unreferenced) - len(stale)
+    queued = queued_keys(db, [obj.key for obj in stale])
+    stats.queued = len(queued)
+    orphans = [obj for obj in stale if obj.key not in queued]
+    stats.orphans = len(orphans)
+    stats.orphan_bytes = sum(obj.byte_size for obj in orphans)
+    return orphans, stats
+
+
+def iter_reconcile_pages(
+    db: Session,
+    storage: StorageBackend,
+    grace: timedelta,
+    start_after: Optional[str] = None,
+    prefix: str = IMAGES_ROOT_PREFIX,
+    page_size: int = 1000,
+) -> Iterator[ReconcilePage]:
+    """
+    Reconcile every object under prefix after start_after, one page at a time.
+
+    Each page is cut at an original/variant group boundary so a group is
+    always matched against the database together; the held-back tail starts
+    the next page. Pages end on a key, so start_after from a checkpoint
+    resumes the listing without relying on continuation tokens.
+    """
+    cutoff = datetime.now(timezone.utc) - grace
+    while True:
+        page = storage.list_objects(
+            prefix, page_size=page_size, start_after=start_after
+        )
+        objects = page.items
+        done = page.next_token is None
+        if not done:
+            tail = _group(objects[-1].key)
+            head = [obj for obj in objects if _group(obj.key) != tail]
+            objects = head or objects
+        orphans, stats = reconcile_objects(db, objects, cutoff)
+        # End the read transaction so a long pass does not hold one open
+        db.commit()
+        if objects:
+            start_after = objects[-1].key
+        yield ReconcilePage(
+            orphans=orphans, stats=stats, last_key=start_after, done=done
+        )
+        if done:
+            return
+
+
+def queue_orphans(db: Session, keys: list[str]) -> None:
+    """Queue orphaned objects for the deletion worker and commit."""
+    if keys:
+        db.add_all(StorageDeletion(storage_key=key) for key in keys)
+        db.commit()
@@ -1,8 +1,22 @@
+import enum
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+# S3 allows at most 10,000 parts per multipart upload
+MAX_UPLOAD_PARTS = 10000
+
+SHA256_PATTERN = r"^[0-9a-f]{64}$"
+
+
+class ImageUploadMode(str, enum.Enum):
+    """How the client sends the file to storage."""
+
+    PUT = "put"
+    MULTIPART = "multipart"
+    POST = "post"
 
 
 class ImageUploadUrlRequest(BaseModel):
@@ -10,6 +24,34 @@ class ImageUploadUrlRequest(BaseModel):
 
     filename: str = Field(..., min_length=1, max_length=512)
     content_type: str = Field(..., min_length=1, max_length=255)
+    mode: ImageUploadMode = Field(
+        ImageUploadMode.PUT,
+        description="put: one presigned PUT; multipart: presigned part URLs "
+        "(parallel, resumable); post: presigned form POST with a size policy",
+    )
+    size: Optional[int] = Field(
+        None, gt=0, description="File size in bytes; required for multipart"
+    )
+    sha256: Optional[str] = Field(
+        None,
+        pattern=SHA256_PATTERN,
+        description="Hex SHA-256 of the file; in content-addressed mode, lets "
+        "the server skip the upload when identical bytes are already stored",
+    )
+
+    @model_validator(mode="after")
+    def _multipart_requires_size(self):
+        if self.mode == ImageUploadMode.MULTIPART and self.size is None:
+            raise ValueError("size is required for multipart uploads")
+        return self
+
+
+class ImageUploadPartUrl(BaseModel):
+    """Presigned PUT target for one part of a multipart upload."""
+
+    part_number: int
+    url: str
+    size: int = Field(..., description="Exact byte size this part must have")
 
 
 class ImageUploadUrlResponse(BaseModel):
@@ -17,9 +59,26 @@ class ImageUploadUrlResponse(BaseModel):
 
     image_id: UUID
     storage_key: str
-    upload_url: str
+    already_stored: bool = Field(
+        False,
+        description="Identical bytes are already stored at storage_key: skip "
+        "the upload and finalize with this storage_key and sha256",
+    )
+    mode: ImageUploadMode = ImageUploadMode.PUT
+    upload_url: Optional[str] = Field(
+        None, description="PUT/POST target; None for multipart (see parts)"
+    )
     method: str = "PUT"
-    required_headers: dict[str, str]
+    required_headers: dict[str, str] = Field(default_factory=dict)
+    fields: dict[str, str] = Field(
+        default_factory=dict,
+        description="POST mode: form fields to send before the file field",
+    )
+    upload_id: Optional[str] = None
+    parts: list[ImageUploadPartUrl] = Field(
+        default_factory=list,
+        description="Multipart mode: one presigned URL per part, in order",
+    )
     expires_in_seconds: int
 
 
@@ -42,6 +101,12 @@ class ImageFinalizeRequest(BaseModel):
     image_id: UUID
     storage_key: str = Field(..., min_length=1)
     display_order: Optional[int] = Field(None, ge=0)
+    sha256: Optional[str] = Field(
+        None,
+        pattern=SHA256_PATTERN,
+        description="Expected hex SHA-256 of the upload, verified in "
+        "content-addressed mode",
+    )
 
 
 class BulkImageFinalizeRequest(BaseModel):
@@ -50,6 +115,56 @@ class BulkImageFinalizeRequest(BaseModel):
     items: list[ImageFinalizeRequest] = Field(..., min_length=1, max_length=20)
 
 
+class ImageOrderRequest(BaseModel):
+    """Every image of a property or listing, in the new display order."""
+
+    image_ids: list[UUID] = Field(..., min_length=1, max_length=1000)
+
+
+class ImageUploadPart(BaseModel):
+    """A part the client uploaded, with the ETag storage returned for it."""
+
+    part_number: int = Field(..., ge=1, le=MAX_UPLOAD_PARTS)
+    etag: str = Field(..., min_length=1)
+
+
+class ImageMultipartCompleteRequest(ImageFinalizeRequest):
+    """Payload for assembling a multipart upload and finalizing the image."""
+
+    upload_id: str = Field(..., min_length=1)
+    parts: list[ImageUploadPart] = Field(..., min_length=1, max_length=MAX_UPLOAD_PARTS)
+
+
+class ImageMultipartAbortRequest(BaseModel):
+    """Payload for discarding a multipart upload."""
+
+    storage_key: str = Field(..., min_length=1)
+    upload_id: str = Field(..., min_length=1)
+
+
+class ImageMultipartResumeRequest(ImageMultipartAbortRequest):
+    """Payload for resuming a multipart upload after an interruption."""
+
+    size: int = Field(..., gt=0, description="File size sent when the upload began")
+
+
+class ImageMultipartResumeResponse(BaseModel):
+    """Parts already stored, and fresh URLs for the parts still missing."""
+
+    upload_id: str
+    uploaded: list[ImageUploadPart]
+    parts: list[ImageUploadPartUrl]
+    expires_in_seconds: int
+
+
+class ImageVariantResponse(BaseModel):
+    """One resized rendition of an image (an entry of a srcset)."""
+
+    url: str
+    width: int
+    height: int
+
+
 class ImageResponse(BaseModel):
     """Image metadata returned by image APIs."""
 
@@ -57,15 +172,97 @@ class ImageResponse(BaseModel):
     storage_key: str
     url: str
     display_order: int
+    width: Optional[int] = None
+    height: Optional[int] = None
+    byte_size: Optional[int] = None
+    content_type: Optional[str] = None
+    placeholder: Optional[str] = Field(
+        None, description="Tiny blurred preview as a data: URI (LQIP)"
+    )
+    variants: dict[str, list[ImageVariantResponse]] = Field(
+        default_factory=dict,
+        description="Resized renditions by format (e.g. webp, avif), ascending "
+        "width; empty until background generation finishes",
+    )
     created_at: datetime
     updated_at: datetime
 
     class Config:
         from_attributes = True
 
+    @field_validator("variants", mode="before")
+    @classmethod
+    def _variants_default(cls, value):
+        """Rows whose variants have not been generated store NULL."""
+        return value or {}
+
+    def variant_url(self, min_width: int, fmt: str = "webp") -> str:
+        """
+        URL of the smallest `fmt` variant at least min_width wide, falling back
+        to the largest variant, then to the original upload.
+        """
+        candidates = self.variants.get(fmt) or []
+        for variant in candidates:
+            if variant.width >= min_width:
+                return variant.url
+        return candidates[-1].url if candidates else self.url
+
 
 class ImageListResponse(BaseModel):
     """Paginated-like list response for images."""
 
     items: list[ImageResponse]
     total: int
+
+
+class ImageSource(str, enum.Enum):
+    """Which parent a gallery image belongs to."""
+
+    LISTING = "listing"
+    PROPERTY = "property"
+
+
+class GalleryImageResponse(ImageResponse):
+    """An image of a listing gallery, tagged with its source."""
+
+    source: ImageSource
+
+
+class ListingGalleryResponse(BaseModel):
+    """A listing's own images followed by its property's shared images."""
+
+    listing_id: UUID
+    property_id: UUID
+    items: list[GalleryImageResponse]
+    total: int
+
+
+class ImageDuplicateMatch(BaseModel):
+    """An image of another listing that looks like a near-duplicate."""
+
+    image_id: UUID
+    listing_id: UUID
+    owner_id: str
+    url: str
+    phash_distance: int = Field(..., description="Differing pHash bits (of 64)")
+    dhash_distance: int = Field(..., description="Differing dHash bits (of 64)")
+
+    class Config:
+        from_attributes = True
+
+
+class ImageDuplicates(BaseModel):
+    """Near-duplicates found for one image of the listing."""
+
+    image_id: UUID
+    url: str
+    hashed: bool = Field(..., description="False until background hashing finishes")
+    matches: list[ImageDuplicateMatch]
+
+
+class ListingImageDuplicatesResponse(BaseModel):
+    """Near-duplicate report for every image of a listing."""
+
+    listing_id: UUID
+    possible_duplicate: bool
+    items: list[ImageDuplicates]
@@ -1,41 +1,101 @@
+import hashlib
 import uuid
+from dataclasses import replace
+from typing import AsyncIterator, Callable, Optional
 from uuid import UUID
 
 from fastapi import HTTPException, status
-from sqlalchemy import func
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import (
+    Integer,
+    column,
+    func,
+    insert,
+    literal,
+    select,
+    union_all,
+    update,
+    values,
+)
 from sqlalchemy.orm import Session
 
-from app.api.v1.images.models import ListingImage, PropertyImage
-from app.api.v1.images.exceptions import S3Error, S3ObjectNotFoundError
+from app.api.v1.images.blobs import (
+    acquire_blob,
+    lock_blob,
+    release_blob,
+    shared_image_fields,
+    stored_blob_keys,
+)
+from app.api.v1.images.duplicates import find_near_duplicates
+from app.api.v1.images.models import ListingImage, PropertyImage, StorageDeletion
+from app.api.v1.images.exceptions import (
+    S3Error,
+    S3MultipartUploadError,
+    S3ObjectNotFoundError,
+)
 from app.api.v1.images.s3_utils import (
-    assert_object_exists,
-    build_s3_url,
     build_storage_key_for_listing,
     build_storage_key_for_property,
-    delete_object,
     extension_from_filename_or_content_type,
-    generate_presigned_put_url,
+    generate_listing_image_id_and_key,
+    generate_property_image_id_and_key,
     listing_images_prefix,
     property_images_prefix,
 )
 from app.api.v1.images.schemas import (
+    MAX_UPLOAD_PARTS,
     BulkImageFinalizeRequest,
     BulkImageUploadUrlsRequest,
     BulkImageUploadUrlsResponse,
+    GalleryImageResponse,
+    ImageDuplicateMatch,
+    ImageDuplicates,
     ImageFinalizeRequest,
     ImageListResponse,
+    ImageMultipartAbortRequest,
+    ImageMultipartCompleteRequest,
+    ImageMultipartResumeRequest,
+    ImageMultipartResumeResponse,
+    ImageOrderRequest,
     ImageResponse,
+    ImageSource,
+    ImageUploadMode,
+    ImageUploadPart,
+    ImageUploadPartUrl,
     ImageUploadUrlRequest,
     ImageUploadUrlResponse,
+    ListingGalleryResponse,
+    ListingImageDuplicatesResponse,
+)
+from app.api.v1.images.storage import (
+    ObjectHead,
+    StorageBackend,
+    get_storage,
+    map_storage_io,
+    run_storage_io,
+    storage_configured,
+)
+from app.api.v1.images.uploads import (
+    IMAGE_EXTENSIONS,
+    SNIFF_BYTES,
+    StreamingUpload,
+    UploadTooLargeError,
+    sniff_image_type,
+)
+from app.api.v1.images.variants import (
+    enqueue_duplicate_flagging,
+    enqueue_image_variants,
+    probe_dimensions,
+    variant_keys,
 )
 from app.api.v1.listings.models import Listing
 from app.api.v1.properties.models import Property
 from app.core.config import settings
 
 
-def _validate_s3_settings() -> None:
-    """Ensure required S3 settings are present before storage operations."""
-    if not settings.S3_BUCKET_NAME:
+def _validate_storage_settings() -> None:
+    """Ensure the storage backend is configured before storage operations."""
+    if not storage_configured():
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="S3 bucket is not configured",
@@ -90,56 +150,396 @@ def _list_images(
     return ImageListResponse(items=items, total=len(items))
 
 
-def _build_upload_url_response(
-    image_id: UUID, storage_key: str, content_type: str
-) -> ImageUploadUrlResponse:
-    """Build the upload URL response given a pre-computed image_id and storage_key."""
+def _ensure_upload_size(size: Optional[int]) -> None:
+    """Reject a declared file size over the upload cap before signing anything."""
+    max_bytes = settings.IMAGE_UPLOAD_MAX_BYTES
+    if size is not None and size > max_bytes:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=f"Image exceeds the {max_bytes} byte upload limit",
+        )
+
+
+def _multipart_part_sizes(size: int) -> list[int]:
+    """
+    Split a file size into part sizes: IMAGE_UPLOAD_PART_BYTES each (the last
+    one shorter), grown if needed to stay within MAX_UPLOAD_PARTS parts.
+    """
+    part_size = max(settings.IMAGE_UPLOAD_PART_BYTES, -(-size // MAX_UPLOAD_PARTS))
+    return [min(part_size, size - offset) for offset in range(0, size, part_size)]
+
+
+def _presign_part_urls(
+    storage: StorageBackend,
+    storage_key: str,
+    upload_id: str,
+    size: int,
+    skip: frozenset[int] = frozenset(),
+) -> list[ImageUploadPartUrl]:
+    """Presign a PUT URL for every part of a multipart upload not in skip."""
+    return [
+        ImageUploadPartUrl(
+            part_number=part_number,
+            url=storage.presign_upload_part(
+                storage_key,
+                upload_id,
+                part_number,
+                content_length=part_size,
+                expires_in=settings.S3_PRESIGNED_URL_EXPIRES_SECONDS,
+            ),
+            size=part_size,
+        )
+        for part_number, part_size in enumerate(_multipart_part_sizes(size), start=1)
+        if part_number not in skip
+    ]
+
+
+async def _build_upload_url_responses(
+    db: Session,
+    targets: list[tuple[UUID, str, ImageUploadUrlRequest]],
+) -> list[ImageUploadUrlResponse]:
+    """
+    Build upload URL responses for many (image_id, storage_key, request).
+
+    PUT targets are signed in one batch. POST targets get a form policy capped
+    at IMAGE_UPLOAD_MAX_BYTES, so storage itself rejects oversized bodies.
+    Multipart targets start their uploads here, concurrently, and get one URL
+    per part. In content-addressed mode, files whose sha256 is already stored
+    get no URL and point at the shared object instead.
+    """
+    for _, _, payload in targets:
+        _ensure_upload_size(payload.size)
+    stored = {}
+    if settings.IMAGE_CONTENT_ADDRESSED:
+        stored = await run_in_threadpool(
+            stored_blob_keys,
+            db,
+            [payload.sha256 for _, _, payload in targets if payload.sha256],
+        )
+    storage = get_storage()
+    expires_in = settings.S3_PRESIGNED_URL_EXPIRES_SECONDS
+    multipart_types = {
+        storage_key: payload.content_type
+        for _, storage_key, payload in targets
+        if payload.mode == ImageUploadMode.MULTIPART and payload.sha256 not in stored
+    }
     try:
-        upload_url = generate_presigned_put_url(
-            key=storage_key, content_type=content_type
+        upload_ids = await map_storage_io(
+            lambda key: storage.create_multipart_upload(key, multipart_types[key]),
+            list(multipart_types),
+        )
+        put_urls = iter(
+            storage.presign_puts(
+                [
+                    (storage_key, payload.content_type)
+                    for _, storage_key, payload in targets
+                    if payload.mode == ImageUploadMode.PUT
+                    and payload.sha256 not in stored
+                ],
+                expires_in=expires_in,
+            )
         )
+        responses = []
+        for image_id, storage_key, payload in targets:
+            if payload.sha256 in stored:
+                responses.append(
+                    ImageUploadUrlResponse(
+                        image_id=image_id,
+                        storage_key=stored[payload.sha256],
+                        already_stored=True,
+                        mode=payload.mode,
+                        expires_in_seconds=expires_in,
+                    )
+                )
+                continue
+            response = ImageUploadUrlResponse(
+                image_id=image_id,
+                storage_key=storage_key,
+                mode=payload.mode,
+                expires_in_seconds=expires_in,
+            )
+            if payload.mode == ImageUploadMode.PUT:
+                response.upload_url = next(put_urls)
+                response.required_headers = {"Content-Type": payload.content_type}
+            elif payload.mode == ImageUploadMode.POST:
+                response.method = "POST"
+                response.upload_url, response.fields = storage.presign_post(
+                    storage_key,
+                    payload.content_type,
+                    max_bytes=settings.IMAGE_UPLOAD_MAX_BYTES,
+                    expires_in=expires_in,
+                )
+            else:
+                response.upload_id = upload_ids[storage_key]
+                response.parts = _presign_part_urls(
+                    storage, storage_key, response.upload_id, payload.size
+                )
+            responses.append(response)
     except S3Error as exc:
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
             detail="Failed to generate upload URL",
         ) from exc
+    return responses
 
-    return ImageUploadUrlResponse(
-        image_id=image_id,
-        storage_key=storage_key,
-        upload_url=upload_url,
-        required_headers={"Content-Type": content_type},
-        expires_in_seconds=settings.S3_PRESIGNED_URL_EXPIRES_SECONDS,
+
+async def _build_upload_url_response(
+    db: Session, image_id: UUID, storage_key: str, payload: ImageUploadUrlRequest
+) -> ImageUploadUrlResponse:
+    """Build the upload URL response given a pre-computed image_id and storage_key."""
+    responses = await _build_upload_url_responses(
+        db, [(image_id, storage_key, payload)]
     )
+    return responses[0]
 
 
-def _assert_s3_object_exists(storage_key: str) -> None:
-    """Validate that an uploaded object exists in S3; raises HTTPException on failure."""
-    _validate_s3_settings()
+async def _read_uploaded_object(storage_key: str) -> ObjectHead:
+    """Validate that an uploaded object exists and read its head; raises HTTPException on failure."""
+    _validate_storage_settings()
     try:
-        assert_object_exists(storage_key)
-    except S3ObjectNotFoundError as exc:
+        head = await run_storage_io(get_storage().read_head, storage_key)
+    except S3Error as exc:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="Storage provider error while validating upload",
+        ) from exc
+    if head is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Uploaded object was not found in storage",
-        ) from exc
+        )
+    return head
+
+
+async def _read_uploaded_objects(
+    items: list[ImageFinalizeRequest],
+) -> dict[str, ObjectHead]:
+    """
+    Validate that all uploaded objects of a batch exist and read their heads
+    (size, content type, leading bytes), with one concurrent ranged GET each.
+
+    Raises:
+        HTTPException: 400 listing every missing item; 502 on provider errors.
+    """
+    _validate_storage_settings()
+    try:
+        heads = await map_storage_io(
+            get_storage().read_head, [item.storage_key for item in items]
+        )
     except S3Error as exc:
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
             detail="Storage provider error while validating upload",
         ) from exc
+    missing = [
+        {"image_id": str(item.image_id), "storage_key": item.storage_key}
+        for item in items
+        if heads[item.storage_key] is None
+    ]
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "message": "Uploaded objects were not found in storage",
+                "items": missing,
+            },
+        )
+    return heads
+
+
+def _image_metadata(head: ObjectHead) -> dict:
+    """Column values derived from an object head; dimensions may be None."""
+    dimensions = probe_dimensions(head.data)
+    return {
+        "width": dimensions[0] if dimensions else None,
+        "height": dimensions[1] if dimensions else None,
+        "byte_size": head.byte_size,
+        "content_type": head.content_type,
+    }
 
 
-def _delete_s3_object(storage_key: str) -> None:
-    """Delete an object from S3 by storage key; raises HTTPException on failure."""
-    _validate_s3_settings()
+async def _with_content_hashes(
+    items: list[ImageFinalizeRequest], heads: dict[str, ObjectHead]
+) -> dict[str, ObjectHead]:
+    """
+    In content-addressed mode, attach each upload's SHA-256 to its head
+    (hashing objects concurrently where it is not known yet) and check it
+    against any sha256 the client sent.
+
+    Raises:
+        HTTPException: 400 listing every mismatch; 502 on provider errors.
+    """
+    if not settings.IMAGE_CONTENT_ADDRESSED:
+        return heads
     try:
-        delete_object(storage_key)
-    except S3Error as exc:
+        hashes = await map_storage_io(
+            get_storage().sha256,
+            [
+                item.storage_key
+                for item in items
+                if heads[item.storage_key].sha256 is None
+            ],
+        )
+    except (S3Error, S3ObjectNotFoundError) as exc:
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
-            detail="Failed to delete object from storage",
+            detail="Storage provider error while hashing upload",
         ) from exc
+    heads = {
+        key: replace(head, sha256=head.sha256 or hashes[key])
+        for key, head in heads.items()
+    }
+    mismatched = [
+        {"image_id": str(item.image_id), "storage_key": item.storage_key}
+        for item in items
+        if item.sha256 and item.sha256 != heads[item.storage_key].sha256
+    ]
+    if mismatched:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "message": "sha256 does not match the uploaded object",
+                "items": mismatched,
+            },
+        )
+    return heads
+
+
+def _shared_object_head(
+    db: Session, item: ImageFinalizeRequest
+) -> Optional[ObjectHead]:
+    """
+    Head of the shared object an item points at when its upload was skipped
+    (content-addressed mode, storage_key is the shared key for item.sha256);
+    None for regular uploads. The blob is locked until the transaction ends.
+    """
+    if not settings.IMAGE_CONTENT_ADDRESSED or not item.sha256:
+        return None
+    blob = lock_blob(db, item.sha256, item.storage_key)
+    if blob is None:
+        return None
+    return ObjectHead(
+        byte_size=blob.byte_size, content_type=blob.content_type, sha256=blob.sha256
+    )
+
+
+def _content_addressed_fields(
+    db: Session, image_model, storage_key: str, head: ObjectHead
+) -> dict:
+    """
+    Reference the shared object for an upload's content (content-addressed
+    mode) and return the column values that differ from a regular upload.
+
+    New content keeps its own key and becomes the shared object. Known content
+    points at the shared object, reusing its rendered variants, and a freshly
+    uploaded duplicate is queued for deletion in the same transaction.
+    """
+    if not settings.IMAGE_CONTENT_ADDRESSED or head.sha256 is None:
+        return {}
+    shared_key, created = acquire_blob(db, storage_key, head)
+    if created:
+        return {}
+    if shared_key != storage_key:
+        db.add(StorageDeletion(storage_key=storage_key))
+    return {
+        "storage_key": shared_key,
+        "url": get_storage().url(shared_key),
+        **shared_image_fields(db, shared_key, image_model),
+    }
+
+
+def _image_fields(db: Session, image_model, storage_key: str, head: ObjectHead) -> dict:
+    """Storage key, URL and metadata columns for a new image row."""
+    return {
+        "storage_key": storage_key,
+        "url": get_storage().url(storage_key),
+        **_image_metadata(head),
+        **_content_addressed_fields(db, image_model, storage_key, head),
+    }
+
+
+async def _read_finalized_object(
+    db: Session, payload: ImageFinalizeRequest, prefix: str, detail: str
+) -> ObjectHead:
+    """
+    Validate a finalize payload's storage key and read the object's head.
+
+    A key outside the parent's prefix is only accepted when it is the shared
+    object for payload.sha256 (content-addressed mode, upload skipped).
+    """
+    shared = await run_in_threadpool(_shared_object_head, db, payload)
+    if shared is not None:
+        return shared
+    _ensure_storage_key_prefix(
+        storage_key=payload.storage_key, prefix=prefix, detail=detail
+    )
+    head = await _read_uploaded_object(payload.storage_key)
+    heads = await _with_content_hashes([payload], {payload.storage_key: head})
+    return heads[payload.storage_key]
+
+
+def _pending_uploads(
+    db: Session,
+    image_model,
+    items: list[ImageFinalizeRequest],
+    prefix: str,
+    detail: str,
+) -> tuple[dict[str, ObjectHead], list[ImageFinalizeRequest]]:
+    """
+    Database side of _read_finalized_objects: heads of the shared objects
+    items point at, and the items whose uploads still have to be read.
+    """
+    existing_ids = set(
+        db.scalars(
+            select(image_model.id).where(
+                image_model.id.in_([item.image_id for item in items])
+            )
+        )
+    )
+    heads = {}
+    uploaded = []
+    for item in items:
+        if item.image_id in existing_ids:
+            continue
+        shared = _shared_object_head(db, item)
+        if shared is not None:
+            heads[item.storage_key] = shared
+            continue
+        _ensure_storage_key_prefix(
+            storage_key=item.storage_key, prefix=prefix, detail=detail
+        )
+        uploaded.append(item)
+    return heads, uploaded
+
+
+async def _read_finalized_objects(
+    db: Session,
+    image_model,
+    items: list[ImageFinalizeRequest],
+    prefix: str,
+    detail: str,
+) -> dict[str, ObjectHead]:
+    """
+    Batch version of _read_finalized_object; uploads are read concurrently.
+    Items already finalized are skipped, so retried batches stay idempotent
+    even after a deduplicated upload was deleted.
+    """
+    heads, uploaded = await run_in_threadpool(
+        _pending_uploads, db, image_model, items, prefix, detail
+    )
+    if uploaded:
+        uploaded_heads = await _read_uploaded_objects(uploaded)
+        heads.update(await _with_content_hashes(uploaded, uploaded_heads))
+    return heads
+
+
+def _ensure_storage_key_prefix(storage_key: str, prefix: str, detail: str) -> None:
+    """Reject storage keys outside the parent resource's key prefix."""
+    if not storage_key.startswith(prefix):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=detail,
+        )
 
 
 def _get_or_validate_existing_image(
@@ -162,13 +562,110 @@ def _get_or_validate_existing_image(
     return existing
 
 
-def _save_new_image(db: Session, image_model, **kwargs) -> ImageResponse:
-    """Persist a new image row and return serialized response."""
-    image = image_model(**kwargs)
-    db.add(image)
+def _commit_new_images(db: Session, image_model, images: list) -> None:
+    """
+    Commit freshly inserted image rows, then schedule what they still need.
+
+    Rows without variants are queued for rendering, as are listing images
+    that reused a shared object's variants but found no perceptual hashes to
+    reuse. Listing images that reused both never reach the variant task, so
+    they are queued for duplicate flagging on the same pool instead.
+    """
+    render, hashed = [], []
+    for image in images:
+        if not image.variants or (image_model is ListingImage and image.phash is None):
+            render.append((image.id, image.storage_key))
+        elif image_model is ListingImage:
+            hashed.append(image.id)
     db.commit()
-    db.refresh(image)
-    return ImageResponse.model_validate(image)
+    enqueue_image_variants(image_model, render)
+    enqueue_duplicate_flagging(hashed)
+
+
+def _save_new_image(db: Session, image_model, **kwargs) -> ImageResponse:
+    """Persist a new image row via INSERT ... RETURNING and return serialized response."""
+    image = db.scalars(
+        insert(image_model).values(**kwargs).returning(image_model)
+    ).one()
+    out = ImageResponse.model_validate(image)
+    _commit_new_images(db, image_model, [image])
+    return out
+
+
+def _persist_image_batch(
+    db: Session,
+    image_model,
+    parent_column,
+    parent_id: UUID,
+    items: list[ImageFinalizeRequest],
+    heads: dict[str, ObjectHead],
+    conflict_detail: str,
+    **parent_fields,
+) -> list[ImageResponse]:
+    """
+    Persist a batch of verified uploads for one parent in a single transaction.
+
+    Existing image IDs are loaded with one IN query (and must belong to the
+    parent), display orders for items without one are assigned contiguously
+    after a single max() lookup, and all new rows go in with one INSERT ...
+    RETURNING. Responses follow the request order.
+    """
+    existing = {
+        image.id: image
+        for image in db.query(image_model)
+        .where(image_model.id.in_([item.image_id for item in items]))
+        .all()
+    }
+    if any(
+        getattr(image, parent_column.key) != parent_id for image in existing.values()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=conflict_detail,
+        )
+
+    new_items = [item for item in items if item.image_id not in existing]
+    next_order = None
+    if any(item.display_order is None for item in new_items):
+        next_order = _next_display_order(
+            db=db,
+            image_model=image_model,
+            parent_column=parent_column,
+            parent_id=parent_id,
+        )
+    rows = []
+    for item in new_items:
+        display_order = item.display_order
+        if display_order is None:
+            display_order = next_order
+            next_order += 1
+        head = heads[item.storage_key]
+        rows.append(
+            {
+                "id": item.image_id,
+                "storage_key": item.storage_key,
+                "url": get_storage().url(item.storage_key),
+                "display_order": display_order,
+                "placeholder": None,
+                "variants": None,
+                **_image_metadata(head),
+                **_content_addressed_fields(db, image_model, item.storage_key, head),
+                **parent_fields,
+            }
+        )
+    created = {}
+    if rows:
+        created = {
+            image.id: image
+            for image in db.scalars(
+                insert(image_model).returning(image_model), rows
+            ).all()
+        }
+
+    saved = {**existing, **created}
+    out = [ImageResponse.model_validate(saved[item.image_id]) for item in items]
+    _commit_new_images(db, image_model, list(created.values()))
+    return out
 
 
 def _ensure_unique_batch_ids(payload: BulkImageFinalizeRequest) -> None:
@@ -189,7 +686,12 @@ def _delete_image_row(
     image_id: UUID,
     not_found_detail: str,
 ) -> None:
-    """Delete image DB row and backing S3 object for a parent resource."""
+    """
+    Delete an image row and enqueue its S3 object (and any variants) for
+    deletion in the same transaction; the storage deletion worker removes the
+    objects later. Objects shared with other images (content-addressed mode)
+    are kept until their last reference is deleted.
+    """
     image = (
         db.query(image_model)
         .where(image_model.id == image_id, parent_column == parent_id)
@@ -200,8 +702,54 @@ def _delete_image_row(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=not_found_detail,
         )
-    _delete_s3_object(image.storage_key)
     db.delete(image)
+    if release_blob(db, image.storage_key) is not False:
+        db.add_all(
+            StorageDeletion(storage_key=key)
+            for key in [image.storage_key, *variant_keys(image.variants)]
+        )
+    db.commit()
+
+
+def _reorder_images(
+    db: Session,
+    image_model,
+    parent_column,
+    parent_id: UUID,
+    payload: ImageOrderRequest,
+) -> None:
+    """
+    Rewrite display_order to follow payload.image_ids with one
+    UPDATE ... FROM (VALUES ...) statement. The ids must be exactly the
+    parent's current images; the rows are locked while that is checked.
+    """
+    image_ids = payload.image_ids
+    if len(set(image_ids)) != len(image_ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Duplicate image_id values in order payload",
+        )
+    current = set(
+        db.scalars(
+            select(image_model.id).where(parent_column == parent_id).with_for_update()
+        )
+    )
+    if current != set(image_ids):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="image_ids must list each of the current images exactly once",
+        )
+    new_order = values(
+        column("id", image_model.id.type),
+        column("display_order", Integer),
+        name="new_order",
+    ).data([(image_id, order) for order, image_id in enumerate(image_ids)])
+    db.execute(
+        update(image_model)
+        .where(image_model.id == new_order.c.id, parent_column == parent_id)
+        .values(display_order=new_order.c.display_order)
+        .execution_options(synchronize_session=False)
+    )
     db.commit()
 
 
@@ -227,12 +775,108 @@ def get_listing_images(db: Session, listing_id: UUID) -> ImageListResponse:
     )
 
 
-def create_property_upload_url(
+def _gallery_select(image_model, parent_column, parent_id: UUID, source: ImageSource):
+    """One UNION ALL arm: a parent's images tagged with their source."""
+    return select(
+        *(getattr(image_model, name) for name in ImageResponse.model_fields),
+        literal(source.value).label("source"),
+    ).where(parent_column == parent_id)
+
+
+def _gallery_etag(rows) -> str:
+    """Weak ETag over the identity and last update of every gallery image."""
+    digest = hashlib.blake2b(digest_size=16)
+    for row in rows:
+        digest.update(f"{row.source}:{row.id}:{row.updated_at.isoformat()};".encode())
+    return f'W/"{digest.hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against etag."""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or any(
+        tag.removeprefix("W/") == etag.removeprefix("W/") for tag in tags
+    )
+
+
+def get_listing_gallery(
+    db: Session, listing_id: UUID
+) -> tuple[ListingGalleryResponse, str]:
+    """
+    Return a listing's images followed by its property's shared images, each
+    in display order, from one UNION ALL query, with the gallery's ETag.
+    """
+    listing = _require_listing(db=db, listing_id=listing_id)
+    gallery = union_all(
+        _gallery_select(
+            ListingImage, ListingImage.listing_id, listing_id, ImageSource.LISTING
+        ),
+        _gallery_select(
+            PropertyImage,
+            PropertyImage.property_id,
+            listing.property_id,
+            ImageSource.PROPERTY,
+        ),
+    ).subquery()
+    rows = db.execute(
+        select(gallery).order_by(
+            # "listing" sorts before "property"
+            gallery.c.source,
+            gallery.c.display_order,
+            gallery.c.created_at,
+        )
+    ).all()
+    items = [GalleryImageResponse.model_validate(row) for row in rows]
+    response = ListingGalleryResponse(
+        listing_id=listing.id,
+        property_id=listing.property_id,
+        items=items,
+        total=len(items),
+    )
+    return response, _gallery_etag(rows)
+
+
+def get_listing_image_duplicates(
+    db: Session, listing_id: UUID
+) -> ListingImageDuplicatesResponse:
+    """
+    Report near-duplicates of each of a listing's images among other
+    listings, found with the in-process perceptual hash index.
+    """
+    listing = _require_listing(db=db, listing_id=listing_id)
+    images = (
+        db.query(ListingImage)
+        .where(ListingImage.listing_id == listing_id)
+        .order_by(ListingImage.display_order.asc(), ListingImage.created_at.asc())
+        .all()
+    )
+    matches = find_near_duplicates(db, images)
+    return ListingImageDuplicatesResponse(
+        listing_id=listing.id,
+        possible_duplicate=listing.possible_duplicate,
+        items=[
+            ImageDuplicates(
+                image_id=image.id,
+                url=image.url,
+                hashed=image.phash is not None,
+                matches=[
+                    ImageDuplicateMatch.model_validate(match)
+                    for match in matches[image.id]
+                ],
+            )
+            for image in images
+        ],
+    )
+
+
+async def create_property_upload_url(
     db: Session, property_id: UUID, payload: ImageUploadUrlRequest
 ) -> ImageUploadUrlResponse:
     """Generate one pre-signed upload URL for a property image."""
-    _validate_s3_settings()
-    _require_property(db=db, property_id=property_id)
+    _validate_storage_settings()
+    await run_in_threadpool(_require_property, db=db, property_id=property_id)
     image_id = uuid.uuid4()
     ext = extension_from_filename_or_content_type(
         filename=payload.filename, content_type=payload.content_type
@@ -240,28 +884,40 @@ def create_property_upload_url(
     storage_key = build_storage_key_for_property(
         property_id=property_id, image_id=image_id, ext=ext
     )
-    return _build_upload_url_response(
-        image_id=image_id, storage_key=storage_key, content_type=payload.content_type
+    return await _build_upload_url_response(
+        db=db, image_id=image_id, storage_key=storage_key, payload=payload
     )
 
 
-def create_property_upload_urls(
+async def create_property_upload_urls(
     db: Session, property_id: UUID, payload: BulkImageUploadUrlsRequest
 ) -> BulkImageUploadUrlsResponse:
-    """Generate pre-signed upload URLs for multiple property images."""
-    items = [
-        create_property_upload_url(db=db, property_id=property_id, payload=file_payload)
-        for file_payload in payload.files
-    ]
+    """
+    Generate pre-signed upload URLs for multiple property images.
+
+    Settings and the property are checked once; all URLs are then signed in
+    one pass.
+    """
+    _validate_storage_settings()
+    await run_in_threadpool(_require_property, db=db, property_id=property_id)
+    targets = []
+    for file_payload in payload.files:
+        image_id, storage_key = generate_property_image_id_and_key(
+            property_id=property_id,
+            filename=file_payload.filename,
+            content_type=file_payload.content_type,
+        )
+        targets.append((image_id, storage_key, file_payload))
+    items = await _build_upload_url_responses(db, targets)
     return BulkImageUploadUrlsResponse(items=items, total=len(items))
 
 
-def create_listing_upload_url(
+async def create_listing_upload_url(
     db: Session, listing_id: UUID, payload: ImageUploadUrlRequest
 ) -> ImageUploadUrlResponse:
     """Generate one pre-signed upload URL for a listing image."""
-    _validate_s3_settings()
-    listing = _require_listing(db=db, listing_id=listing_id)
+    _validate_storage_settings()
+    listing = await run_in_threadpool(_require_listing, db=db, listing_id=listing_id)
     image_id = uuid.uuid4()
     ext = extension_from_filename_or_content_type(
         filename=payload.filename, content_type=payload.content_type
@@ -272,37 +928,39 @@ def create_listing_upload_url(
         image_id=image_id,
         ext=ext,
     )
-    return _build_upload_url_response(
-        image_id=image_id, storage_key=storage_key, content_type=payload.content_type
+    return await _build_upload_url_response(
+        db=db, image_id=image_id, storage_key=storage_key, payload=payload
     )
 
 
-def create_listing_upload_urls(
+async def create_listing_upload_urls(
     db: Session, listing_id: UUID, payload: BulkImageUploadUrlsRequest
 ) -> BulkImageUploadUrlsResponse:
-    """Generate pre-signed upload URLs for multiple listing images."""
-    items = [
-        create_listing_upload_url(db=db, listing_id=listing_id, payload=file_payload)
-        for file_payload in payload.files
-    ]
-    return BulkImageUploadUrlsResponse(items=items, total=len(items))
-
+    """
+    Generate pre-signed upload URLs for multiple listing images.
 
-def finalize_property_image(
-    db: Session, property_id: UUID, payload: ImageFinalizeRequest
-) -> ImageResponse:
-    """Finalize one uploaded property image and persist metadata."""
-    _require_property(db=db, property_id=property_id)
-
-    expected_prefix = property_images_prefix(property_id)
-    if not payload.storage_key.startswith(expected_prefix):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="storage_key does not match property path",
+    Settings and the listing are checked once; all URLs are then signed in
+    one pass.
+    """
+    _validate_storage_settings()
+    listing = await run_in_threadpool(_require_listing, db=db, listing_id=listing_id)
+    targets = []
+    for file_payload in payload.files:
+        image_id, storage_key = generate_listing_image_id_and_key(
+            property_id=listing.property_id,
+            listing_id=listing_id,
+            filename=file_payload.filename,
+            content_type=file_payload.content_type,
         )
+        targets.append((image_id, storage_key, file_payload))
+    items = await _build_upload_url_responses(db, targets)
+    return BulkImageUploadUrlsResponse(items=items, total=len(items))
 
-    _assert_s3_object_exists(payload.storage_key)
 
+def _persist_property_image(
+    db: Session, property_id: UUID, payload: ImageFinalizeRequest, head: ObjectHead
+) -> ImageResponse:
+    """Save (or return the existing) property image row for a verified upload."""
     existing = _get_or_validate_existing_image(
         db=db,
         image_model=PropertyImage,
@@ -319,8 +977,9 @@ def finalize_property_image(
         image_model=PropertyImage,
         id=payload.image_id,
         property_id=property_id,
-        storage_key=payload.storage_key,
-        url=build_s3_url(payload.storage_key),
+        **_image_fields(
+            db=db, image_model=PropertyImage, storage_key=payload.storage_key, head=head
+        ),
         display_order=payload.display_order
         if payload.display_order is not None
         else _next_display_order(
@@ -332,41 +991,81 @@ def finalize_property_image(
     )
 
 
-def finalize_property_images(
+async def finalize_property_image(
+    db: Session, property_id: UUID, payload: ImageFinalizeRequest
+) -> ImageResponse:
+    """Finalize one uploaded property image and persist metadata."""
+    await run_in_threadpool(_require_property, db=db, property_id=property_id)
+    existing = await run_in_threadpool(
+        _get_or_validate_existing_image,
+        db=db,
+        image_model=PropertyImage,
+        image_id=payload.image_id,
+        parent_column=PropertyImage.property_id,
+        parent_id=property_id,
+        conflict_detail="Image ID already exists for another property",
+    )
+    if existing:
+        return ImageResponse.model_validate(existing)
+    head = await _read_finalized_object(
+        db=db,
+        payload=payload,
+        prefix=property_images_prefix(property_id),
+        detail="storage_key does not match property path",
+    )
+    return await run_in_threadpool(
+        _persist_property_image,
+        db=db,
+        property_id=property_id,
+        payload=payload,
+        head=head,
+    )
+
+
+async def finalize_property_images(
     db: Session, property_id: UUID, payload: BulkImageFinalizeRequest
 ) -> ImageListResponse:
-    """Finalize multiple uploaded property images."""
+    """
+    Finalize multiple uploaded property images.
+
+    All storage keys are validated and their heads read concurrently (one
+    ranged GET each, which also yields size, type and dimensions) before any
+    database work, so a batch costs roughly one S3 round trip; rows are then
+    written in one transaction.
+    """
     _ensure_unique_batch_ids(payload)
-    items = [
-        finalize_property_image(db=db, property_id=property_id, payload=item)
-        for item in payload.items
-    ]
+    await run_in_threadpool(_require_property, db=db, property_id=property_id)
+    heads = await _read_finalized_objects(
+        db=db,
+        image_model=PropertyImage,
+        items=payload.items,
+        prefix=property_images_prefix(property_id),
+        detail="storage_key does not match property path",
+    )
+    items = await run_in_threadpool(
+        _persist_image_batch,
+        db=db,
+        image_model=PropertyImage,
+        parent_column=PropertyImage.property_id,
+        parent_id=property_id,
+        items=payload.items,
+        heads=heads,
+        conflict_detail="Image ID already exists for another property",
+        property_id=property_id,
+    )
     return ImageListResponse(items=items, total=len(items))
 
 
-def finalize_listing_image(
-    db: Session, listing_id: UUID, payload: ImageFinalizeRequest
+def _persist_listing_image(
+    db: Session, listing: Listing, payload: ImageFinalizeRequest, head: ObjectHead
 ) -> ImageResponse:
-    """Finalize one uploaded listing image and persist metadata."""
-    listing = _require_listing(db=db, listing_id=listing_id)
-
-    expected_prefix = listing_images_prefix(
-        property_id=listing.property_id, listing_id=listing_id
-    )
-    if not payload.storage_key.startswith(expected_prefix):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="storage_key does not match listing path",
-        )
-
-    _assert_s3_object_exists(payload.storage_key)
-
+    """Save (or return the existing) listing image row for a verified upload."""
     existing = _get_or_validate_existing_image(
         db=db,
         image_model=ListingImage,
         image_id=payload.image_id,
         parent_column=ListingImage.listing_id,
-        parent_id=listing_id,
+        parent_id=listing.id,
         conflict_detail="Image ID already exists for another listing",
     )
     if existing:
@@ -376,35 +1075,130 @@ def finalize_listing_image(
         db=db,
         image_model=ListingImage,
         id=payload.image_id,
-        listing_id=listing_id,
+        listing_id=listing.id,
         property_id=listing.property_id,
-        storage_key=payload.storage_key,
-        url=build_s3_url(payload.storage_key),
+        **_image_fields(
+            db=db, image_model=ListingImage, storage_key=payload.storage_key, head=head
+        ),
         display_order=payload.display_order
         if payload.display_order is not None
         else _next_display_order(
             db=db,
             image_model=ListingImage,
             parent_column=ListingImage.listing_id,
-            parent_id=listing_id,
+            parent_id=listing.id,
+        ),
+    )
+
+
+async def finalize_listing_image(
+    db: Session, listing_id: UUID, payload: ImageFinalizeRequest
+) -> ImageResponse:
+    """Finalize one uploaded listing image and persist metadata."""
+    listing = await run_in_threadpool(_require_listing, db=db, listing_id=listing_id)
+    existing = await run_in_threadpool(
+        _get_or_validate_existing_image,
+        db=db,
+        image_model=ListingImage,
+        image_id=payload.image_id,
+        parent_column=ListingImage.listing_id,
+        parent_id=listing_id,
+        conflict_detail="Image ID already exists for another listing",
+    )
+    if existing:
+        return ImageResponse.model_validate(existing)
+    head = await _read_finalized_object(
+        db=db,
+        payload=payload,
+        prefix=listing_images_prefix(
+            property_id=listing.property_id, listing_id=listing_id
         ),
+        detail="storage_key does not match listing path",
+    )
+    return await run_in_threadpool(
+        _persist_listing_image, db=db, listing=listing, payload=payload, head=head
     )
 
 
-def finalize_listing_images(
+async def finalize_listing_images(
     db: Session, listing_id: UUID, payload: BulkImageFinalizeRequest
 ) -> ImageListResponse:
-    """Finalize multiple uploaded listing images."""
+    """
+    Finalize multiple uploaded listing images.
+
+    All storage keys are validated and their heads read concurrently (one
+    ranged GET each, which also yields size, type and dimensions) before any
+    database work, so a batch costs roughly one S3 round trip; rows are then
+    written in one transaction.
+    """
     _ensure_unique_batch_ids(payload)
-    items = [
-        finalize_listing_image(db=db, listing_id=listing_id, payload=item)
-        for item in payload.items
-    ]
+    listing = await run_in_threadpool(_require_listing, db=db, listing_id=listing_id)
+    heads = await _read_finalized_objects(
+        db=db,
+        image_model=ListingImage,
+        items=payload.items,
+        prefix=listing_images_prefix(
+            property_id=listing.property_id, listing_id=listing_id
+        ),
+        detail="storage_key does not match listing path",
+    )
+    items = await run_in_threadpool(
+        _persist_image_batch,
+        db=db,
+        image_model=ListingImage,
+        parent_column=ListingImage.listing_id,
+        parent_id=listing_id,
+        items=payload.items,
+        heads=heads,
+        conflict_detail="Image ID already exists for another listing",
+        listing_id=listing_id,
+        property_id=listing.property_id,
+    )
     return ImageListResponse(items=items, total=len(items))
 
 
+def reorder_property_images(
+    db: Session, property_id: UUID, payload: ImageOrderRequest
+) -> ImageListResponse:
+    """Set the display order of all of a property's images at once."""
+    _require_property(db=db, property_id=property_id)
+    _reorder_images(
+        db=db,
+        image_model=PropertyImage,
+        parent_column=PropertyImage.property_id,
+        parent_id=property_id,
+        payload=payload,
+    )
+    return _list_images(
+        db=db,
+        image_model=PropertyImage,
+        parent_column=PropertyImage.property_id,
+        parent_id=property_id,
+    )
+
+
+def reorder_listing_images(
+    db: Session, listing_id: UUID, payload: ImageOrderRequest
+) -> ImageListResponse:
+    """Set the display order of all of a listing's images at once."""
+    _require_listing(db=db, listing_id=listing_id)
+    _reorder_images(
+        db=db,
+        image_model=ListingImage,
+        parent_column=ListingImage.listing_id,
+        parent_id=listing_id,
+        payload=payload,
+    )
+    return _list_images(
+        db=db,
+        image_model=ListingImage,
+        parent_column=ListingImage.listing_id,
+        parent_id=listing_id,
+    )
+
+
 def delete_property_image(db: Session, property_id: UUID, image_id: UUID) -> None:
-    """Delete one property image from storage and database."""
+    """Delete one property image and queue its storage object for deletion."""
     _delete_image_row(
         db=db,
         image_model=PropertyImage,
@@ -416,7 +1210,7 @@ def delete_property_image(db: Session, property_id: UUID, image_id: UUID) -> Non
 
 
 def delete_listing_image(db: Session, listing_id: UUID, image_id: UUID) -> None:
-    """Delete one listing image from storage and database."""
+    """Delete one listing image and queue its storage object for deletion."""
     _delete_image_row(
         db=db,
         image_model=ListingImage,
@@ -425,3 +1219,377 @@ def delete_listing_image(db: Session, listing_id: UUID, image_id: UUID) -> None:
         image_id=image_id,
         not_found_detail="Listing image not found",
     )
+
+
+def _queue_storage_deletion(db: Session, storage_key: str) -> None:
+    """Queue one object for the storage deletion worker and commit."""
+    db.add(StorageDeletion(storage_key=storage_key))
+    db.commit()
+
+
+async def _complete_multipart_upload(
+    db: Session, payload: ImageMultipartCompleteRequest
+) -> ObjectHead:
+    """
+    Assemble a multipart upload and read the resulting object's head.
+
+    Parts are signed with fixed sizes, but the total is checked again here:
+    an assembled object over the upload cap is queued for deletion and
+    rejected with 413.
+    """
+    _validate_storage_settings()
+    part_numbers = [part.part_number for part in payload.parts]
+    if part_numbers != sorted(set(part_numbers)):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="parts must be in ascending part_number order without duplicates",
+        )
+    try:
+        await run_storage_io(
+            get_storage().complete_multipart_upload,
+            payload.storage_key,
+            payload.upload_id,
+            [(part.part_number, part.etag) for part in payload.parts],
+        )
+    except S3MultipartUploadError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Multipart upload could not be completed "
+            "(unknown upload_id, or missing or mismatched parts)",
+        ) from exc
+    except S3Error as exc:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="Failed to complete multipart upload",
+        ) from exc
+    head = await _read_uploaded_object(payload.storage_key)
+    max_bytes = settings.IMAGE_UPLOAD_MAX_BYTES
+    if head.byte_size > max_bytes:
+        await run_in_threadpool(_queue_storage_deletion, db, payload.storage_key)
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=f"Image exceeds the {max_bytes} byte upload limit",
+        )
+    heads = await _with_content_hashes([payload], {payload.storage_key: head})
+    return heads[payload.storage_key]
+
+
+async def _abort_multipart_upload(payload: ImageMultipartAbortRequest) -> None:
+    """Discard a multipart upload; aborting an unknown upload is a no-op."""
+    _validate_storage_settings()
+    try:
+        await run_storage_io(
+            get_storage().abort_multipart_upload,
+            payload.storage_key,
+            payload.upload_id,
+        )
+    except S3Error as exc:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="Failed to abort multipart upload",
+        ) from exc
+
+
+async def _resume_multipart_upload(
+    payload: ImageMultipartResumeRequest,
+) -> ImageMultipartResumeResponse:
+    """List the parts already stored and re-sign URLs for the missing ones."""
+    _validate_storage_settings()
+    _ensure_upload_size(payload.size)
+    storage = get_storage()
+    try:
+        uploaded = await run_storage_io(
+            storage.list_parts, payload.storage_key, payload.upload_id
+        )
+        parts = _presign_part_urls(
+            storage,
+            payload.storage_key,
+            payload.upload_id,
+            payload.size,
+            skip=frozenset(part_number for part_number, _ in uploaded),
+        )
+    except S3ObjectNotFoundError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Multipart upload not found",
+        ) from exc
+    except S3Error as exc:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="Failed to list multipart upload parts",
+        ) from exc
+    return ImageMultipartResumeResponse(
+        upload_id=payload.upload_id,
+        uploaded=[
+            ImageUploadPart(part_number=part_number, etag=etag)
+            for part_number, etag in uploaded
+        ],
+        parts=parts,
+        expires_in_seconds=settings.S3_PRESIGNED_URL_EXPIRES_SECONDS,
+    )
+
+
+async def complete_property_multipart_upload(
+    db: Session, property_id: UUID, payload: ImageMultipartCompleteRequest
+) -> ImageResponse:
+    """
+    Complete a multipart property image upload and finalize it.
+
+    Retrying after a successful call returns the existing image.
+    """
+    await run_in_threadpool(_require_property, db=db, property_id=property_id)
+    _ensure_storage_key_prefix(
+        storage_key=payload.storage_key,
+        prefix=property_images_prefix(property_id),
+        detail="storage_key does not match property path",
+    )
+    existing = await run_in_threadpool(
+        _get_or_validate_existing_image,
+        db=db,
+        image_model=PropertyImage,
+        image_id=payload.image_id,
+        parent_column=PropertyImage.property_id,
+        parent_id=property_id,
+        conflict_detail="Image ID already exists for another property",
+    )
+    if existing:
+        return ImageResponse.model_validate(existing)
+    head = await _complete_multipart_upload(db=db, payload=payload)
+    return await run_in_threadpool(
+        _persist_property_image,
+        db=db,
+        property_id=property_id,
+        payload=payload,
+        head=head,
+    )
+
+
+async def abort_property_multipart_upload(
+    db: Session, property_id: UUID, payload: ImageMultipartAbortRequest
+) -> None:
+    """Abort a multipart property image upload."""
+    await run_in_threadpool(_require_property, db=db, property_id=property_id)
+    _ensure_storage_key_prefix(
+        storage_key=payload.storage_key,
+        prefix=property_images_prefix(property_id),
+        detail="storage_key does not match property path",
+    )
+    await _abort_multipart_upload(payload)
+
+
+async def resume_property_multipart_upload(
+    db: Session, property_id: UUID, payload: ImageMultipartResumeRequest
+) -> ImageMultipartResumeResponse:
+    """Return uploaded parts and fresh part URLs for a property image upload."""
+    await run_in_threadpool(_require_property, db=db, property_id=property_id)
+    _ensure_storage_key_prefix(
+        storage_key=payload.storage_key,
+        prefix=property_images_prefix(property_id),
+        detail="storage_key does not match property path",
+    )
+    return await _resume_multipart_upload(payload)
+
+
+async def complete_listing_multipart_upload(
+    db: Session, listing_id: UUID, payload: ImageMultipartCompleteRequest
+) -> ImageResponse:
+    """
+    Complete a multipart listing image upload and finalize it.
+
+    Retrying after a successful call returns the existing image.
+    """
+    listing = await run_in_threadpool(_require_listing, db=db, listing_id=listing_id)
+    _ensure_storage_key_prefix(
+        storage_key=payload.storage_key,
+        prefix=listing_images_prefix(
+            property_id=listing.property_id, listing_id=listing_id
+        ),
+        detail="storage_key does not match listing path",
+    )
+    existing = await run_in_threadpool(
+        _get_or_validate_existing_image,
+        db=db,
+        image_model=ListingImage,
+        image_id=payload.image_id,
+        parent_column=ListingImage.listing_id,
+        parent_id=listing_id,
+        conflict_detail="Image ID already exists for another listing",
+    )
+    if existing:
+        return ImageResponse.model_validate(existing)
+    head = await _complete_multipart_upload(db=db, payload=payload)
+    return await run_in_threadpool(
+        _persist_listing_image, db=db, listing=listing, payload=payload, head=head
+    )
+
+
+async def abort_listing_multipart_upload(
+    db: Session, listing_id: UUID, payload: ImageMultipartAbortRequest
+) -> None:
+    """Abort a multipart listing image upload."""
+    listing = await run_in_threadpool(_require_listing, db=db, listing_id=listing_id)
+    _ensure_storage_key_prefix(
+        storage_key=payload.storage_key,
+        prefix=listing_images_prefix(
+            property_id=listing.property_id, listing_id=listing_id
+        ),
+        detail="storage_key does not match listing path",
+    )
+    await _abort_multipart_upload(payload)
+
+
+async def resume_listing_multipart_upload(
+    db: Session, listing_id: UUID, payload: ImageMultipartResumeRequest
+) -> ImageMultipartResumeResponse:
+    """Return uploaded parts and fresh part URLs for a listing image upload."""
+    listing = await run_in_threadpool(_require_listing, db=db, listing_id=listing_id)
+    _ensure_storage_key_prefix(
+        storage_key=payload.storage_key,
+        prefix=listing_images_prefix(
+            property_id=listing.property_id, listing_id=listing_id
+        ),
+        detail="storage_key does not match listing path",
+    )
+    return await _resume_multipart_upload(payload)
+
+
+async def _abort_upload(upload: StreamingUpload) -> None:
+    """Best-effort abort of a streaming upload's multipart state."""
+    try:
+        await run_storage_io(upload.abort)
+    except S3Error:
+        pass
+
+
+async def _stream_image_upload(
+    body: AsyncIterator[bytes],
+    content_length: Optional[str],
+    storage_key_for_ext: Callable[[str], tuple[UUID, str]],
+) -> tuple[UUID, str, ObjectHead]:
+    """
+    Stream a request body into storage, sniffing its type and enforcing the
+    size cap on the fly.
+
+    Only one part is buffered at a time, so memory stays flat for any size.
+    Returns (image_id, storage_key, head) for the stored object.
+
+    Raises:
+        HTTPException: 413 over the size cap, 415 for non-image bodies,
+            502 on storage errors.
+    """
+    _validate_storage_settings()
+    max_bytes = settings.IMAGE_UPLOAD_MAX_BYTES
+    if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=f"Image exceeds the {max_bytes} byte upload limit",
+        )
+
+    chunks = body.__aiter__()
+    first = bytearray()
+    async for chunk in chunks:
+        first += chunk
+        if len(first) >= SNIFF_BYTES:
+            break
+    content_type = sniff_image_type(bytes(first))
+    if content_type is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Body is not a supported image "
+            f"({', '.join(sorted(IMAGE_EXTENSIONS))})",
+        )
+
+    image_id, storage_key = storage_key_for_ext(IMAGE_EXTENSIONS[content_type])
+    upload = StreamingUpload(
+        storage=get_storage(),
+        key=storage_key,
+        content_type=content_type,
+        part_size=settings.IMAGE_UPLOAD_PART_BYTES,
+        max_bytes=max_bytes,
+    )
+    try:
+        if upload.feed(bytes(first)):
+            await run_storage_io(upload.flush_parts)
+        async for chunk in chunks:
+            if upload.feed(chunk):
+                await run_storage_io(upload.flush_parts)
+        head = await run_storage_io(upload.finish)
+    except UploadTooLargeError as exc:
+        await _abort_upload(upload)
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=f"Image exceeds the {max_bytes} byte upload limit",
+        ) from exc
+    except S3Error as exc:
+        await _abort_upload(upload)
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="Failed to upload object to storage",
+        ) from exc
+    except BaseException:
+        # Client disconnects and cancellations must not leave parts behind
+        await _abort_upload(upload)
+        raise
+    return image_id, storage_key, head
+
+
+async def upload_property_image(
+    db: Session,
+    property_id: UUID,
+    body: AsyncIterator[bytes],
+    content_length: Optional[str],
+    display_order: Optional[int],
+) -> ImageResponse:
+    """Stream an image body to storage and finalize it as a property image."""
+    await run_in_threadpool(_require_property, db=db, property_id=property_id)
+
+    def storage_key_for_ext(ext: str) -> tuple[UUID, str]:
+        image_id = uuid.uuid4()
+        return image_id, build_storage_key_for_property(property_id, image_id, ext)
+
+    image_id, storage_key, head = await _stream_image_upload(
+        body=body,
+        content_length=content_length,
+        storage_key_for_ext=storage_key_for_ext,
+    )
+    return await run_in_threadpool(
+        _persist_property_image,
+        db=db,
+        property_id=property_id,
+        payload=ImageFinalizeRequest(
+            image_id=image_id, storage_key=storage_key, display_order=display_order
+        ),
+        head=head,
+    )
+
+
+async def upload_listing_image(
+    db: Session,
+    listing_id: UUID,
+    body: AsyncIterator[bytes],
+    content_length: Optional[str],
+    display_order: Optional[int],
+) -> ImageResponse:
+    """Stream an image body to storage and finalize it as a listing image."""
+    listing = await run_in_threadpool(_require_listing, db=db, listing_id=listing_id)
+
+    def storage_key_for_ext(ext: str) -> tuple[UUID, str]:
+        image_id = uuid.uuid4()
+        return image_id, build_storage_key_for_listing(
+            listing.property_id, listing_id, image_id, ext
+        )
+
+    image_id, storage_key, head = await _stream_image_upload(
+        body=body,
+        content_length=content_length,
+        storage_key_for_ext=storage_key_for_ext,
+    )
+    return await run_in_threadpool(
+        _persist_listing_image,
+        db=db,
+        listing=listing,
+        payload=ImageFinalizeRequest(
+            image_id=image_id, storage_key=storage_key, display_order=display_order
+        ),
+        head=head,
+    )
@@ -0,0 +1,843 @@
+"""
+Object storage backends for image files, with no FastAPI dependency.
+
+`get_storage()` returns the backend selected by STORAGE_BACKEND: "s3" for
+deployed environments, or "local" to keep objects on the filesystem and
+serve presigned-style URLs from the local storage routes, so the whole image
+pipeline can run offline (development, load tests).
+
+Backends are blocking. Async endpoints call them through run_storage_io(),
+which runs them on worker threads gated by their own capacity limiter, so a
+burst of slow storage round trips cannot exhaust the threadpool that sync
+endpoints (and every other run_in_threadpool call) share.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import mimetypes
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterator, Optional
+from urllib.parse import quote, urlencode
+
+import anyio
+import boto3
+from anyio.lowlevel import RunVar
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
+
+from app.api.v1.images.exceptions import (
+    S3Error,
+    S3MultipartUploadError,
+    S3ObjectNotFoundError,
+)
+from app.core.config import settings
+
+# Enough leading bytes to parse dimensions from common image headers
+IMAGE_HEADER_BYTES = 64 * 1024
+
+# Read size when hashing whole objects
+HASH_CHUNK_BYTES = 1024 * 1024
+
+# CompleteMultipartUpload error codes caused by the client's upload id or parts
+_MULTIPART_CLIENT_ERRORS = frozenset(
+    {"NoSuchUpload", "InvalidPart", "InvalidPartOrder", "EntityTooSmall"}
+)
+
+
+@dataclass(frozen=True)
+class ObjectHead:
+    """
+    Size, content type and (for ranged reads) leading bytes of an object,
+    plus its SHA-256 when it has been computed.
+    """
+
+    byte_size: int
+    content_type: Optional[str]
+    data: bytes = b""
+    sha256: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class StoredObject:
+    """One entry of an object listing."""
+
+    key: str
+    byte_size: int
+    last_modified: datetime
+
+
+@dataclass(frozen=True)
+class ObjectPage:
+    """A page of an object listing; pass next_token to fetch the next page."""
+
+    items: list[StoredObject]
+    next_token: Optional[str]
+
+
+class StorageBackend(ABC):
+    """
+    Interface the image services use for object storage.
+
+    Implementations raise S3ObjectNotFoundError for missing objects where a
+    method cannot return None, S3MultipartUploadError when a multipart upload
+    cannot be completed from the client's upload id and parts, and S3Error for
+    any other provider failure.
+    """
+
+    @abstractmethod
+    def put(self, key: str, body: bytes, content_type: str) -> None:
+        """Store bytes under key."""
+
+    @abstractmethod
+    def get(self, key: str) -> bytes:
+        """Return an object's bytes."""
+
+    @abstractmethod
+    def head(self, key: str) -> Optional[ObjectHead]:
+        """Return size and content type, or None if the object does not exist."""
+
+    @abstractmethod
+    def read_head(
+        self, key: str, length: int = IMAGE_HEADER_BYTES
+    ) -> Optional[ObjectHead]:
+        """Ranged read of the first `length` bytes; None if the object does not exist."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Delete an object; deleting a missing object is not an error."""
+
+    @abstractmethod
+    def delete_many(self, keys: list[str]) -> dict[str, str]:
+        """Delete many objects; returns key -> error message for failures."""
+
+    @abstractmethod
+    def presign_put(self, key: str, content_type: str, expires_in: int) -> str:
+        """URL a client can PUT the object body to (with this Content-Type)."""
+
+    @abstractmethod
+    def presign_post(
+        self, key: str, content_type: str, max_bytes: int, expires_in: int
+    ) -> tuple[str, dict[str, str]]:
+        """
+        URL and form fields for a browser POST upload. The policy pins the key
+        and Content-Type and rejects bodies outside 1..max_bytes bytes.
+        """
+
+    @abstractmethod
+    def presign_upload_part(
+        self,
+        key: str,
+        upload_id: str,
+        part_number: int,
+        content_length: int,
+        expires_in: int,
+    ) -> str:
+        """URL a client can PUT one multipart part to; the part size is signed."""
+
+    @abstractmethod
+    def list_objects(
+        self,
+        prefix: str,
+        next_token: Optional[str] = None,
+        page_size: int = 1000,
+        start_after: Optional[str] = None,
+    ) -> ObjectPage:
+        """
+        List objects under prefix in key order, one page at a time. start_after
+        begins the listing after that key, so a stored key can resume a listing
+        where a continuation token may have expired.
+        """
+
+    @abstractmethod
+    def url(self, key: str) -> str:
+        """Public URL clients use to read the object."""
+
+    @abstractmethod
+    def create_multipart_upload(self, key: str, content_type: str) -> str:
+        """Start a multipart upload and return its upload id."""
+
+    @abstractmethod
+    def upload_part(
+        self, key: str, upload_id: str, part_number: int, body: bytes
+    ) -> str:
+        """Upload one part (numbered from 1) and return its ETag."""
+
+    @abstractmethod
+    def complete_multipart_upload(
+        self, key: str, upload_id: str, parts: list[tuple[int, str]]
+    ) -> None:
+        """Assemble the object from (part_number, etag) pairs in order."""
+
+    @abstractmethod
+    def abort_multipart_upload(self, key: str, upload_id: str) -> None:
+        """Discard a multipart upload and any parts uploaded so far."""
+
+    @abstractmethod
+    def list_parts(self, key: str, upload_id: str) -> list[tuple[int, str]]:
+        """(part_number, etag) of the parts uploaded so far, in part order."""
+
+    def presign_puts(
+        self, targets: list[tuple[str, str]], expires_in: int
+    ) -> list[str]:
+        """Presign PUT URLs for many (key, content_type) pairs."""
+        return [
+            self.presign_put(key, content_type, expires_in)
+            for key, content_type in targets
+        ]
+
+    def sha256(self, key: str) -> str:
+        """Hex SHA-256 of an object's bytes."""
+        return hashlib.sha256(self.get(key)).hexdigest()
+
+
+def _is_not_found(exc: ClientError) -> bool:
+    code = exc.response.get("Error", {}).get("Code", "")
+    return code in {"404", "NoSuchKey", "NotFound"}
+
+
+class S3Storage(StorageBackend):
+    """StorageBackend on an S3 bucket. The boto3 client is created on first use."""
+
+    # S3 DeleteObjects accepts at most 1000 keys per request
+    DELETE_BATCH_SIZE = 1000
+
+    def __init__(self, bucket: str, region: str):
+        self.bucket = bucket
+        self.region = region
+        self._client = None
+        self._client_lock = threading.Lock()
+
+    @property
+    def client(self):
+        # boto3's default session is not thread-safe, so build the client once
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = boto3.client(
+                        "s3",
+                        region_name=self.region,
+                        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                        endpoint_url=f"https://s3.{self.region}.amazonaws.com",
+                        # One kept-alive connection per storage call that can
+                        # be in flight, so concurrent calls never wait on the pool
+                        config=Config(
+                            max_pool_connections=settings.STORAGE_IO_CONCURRENCY,
+                            tcp_keepalive=True,
+                        ),
+                    )
+        return self._client
+
+    def put(self, key: str, body: bytes, content_type: str) -> None:
+        try:
+            self.client.put_object(
+                Bucket=self.bucket, Key=key, Body=body, ContentType=content_type
+            )
+        except (ClientError, BotoCoreError) as exc:
+            raise S3Error(f"Failed to upload object {key!r}") from exc
+
+    def get(self, key: str) -> bytes:
+        try:
+            return self.client.get_object(Bucket=self.bucket, Key=key)["Body"].read()
+        except ClientError as exc:
+            if _is_not_found(exc):
+                raise S3ObjectNotFoundError(
+                    f"Object not found in storage: {key!r}"
+                ) from exc
+            raise S3Error(f"Failed to download object {key!r}") from exc
+        except BotoCoreError as exc:
+            raise S3Error(f"Failed to download object {key!r}") from exc
+
+    def sha256(self, key: str) -> str:
+        """Hash the object as it streams, without holding it in memory."""
+        digest = hashlib.sha256()
+        try:
+            body = self.client.get_object(Bucket=self.bucket, Key=key)["Body"]
+            for chunk in body.iter_chunks(HASH_CHUNK_BYTES):
+                digest.update(chunk)
+        except ClientError as exc:
+            if _is_not_found(exc):
+                raise S3ObjectNotFoundError(
+                    f"Object not found in storage: {key!r}"
+                ) from exc
+            raise S3Error(f"Failed to download object {key!r}") from exc
+        except BotoCoreError as exc:
+            raise S3Error(f"Failed to download object {key!r}") from exc
+        return digest.hexdigest()
+
+    def head(self, key: str) -> Optional[ObjectHead]:
+        try:
+            response = self.client.head_object(Bucket=self.bucket, Key=key)
+        except ClientError as exc:
+            if _is_not_found(exc):
+                return None
+            raise S3Error(f"Storage error checking {key!r}") from exc
+        except BotoCoreError as exc:
+            raise S3Error("Storage provider is unavailable") from exc
+        return ObjectHead(
+            byte_size=response["ContentLength"],
+            content_type=response.get("ContentType"),
+        )
+
+    def read_head(
+        self, key: str, length: int = IMAGE_HEADER_BYTES
+    ) -> Optional[ObjectHead]:
+        """
+        One ranged GET: the same round trip as a HEAD, but also returns the
+        header bytes; the full size comes from Content-Range.
+        """
+        try:
+            response = self.client.get_object(
+                Bucket=self.bucket, Key=key, Range=f"bytes=0-{length - 1}"
+            )
+            data = response["Body"].read()
+        except ClientError as exc:
+            if _is_not_found(exc):
+                return None
+            if exc.response.get("Error", {}).get("Code") == "InvalidRange":
+                # Zero-byte objects cannot satisfy any range
+                return ObjectHead(byte_size=0, content_type=None)
+            raise S3Error(f"Storage error reading {key!r}") from exc
+        except BotoCoreError as exc:
+            raise S3Error("Storage provider is unavailable") from exc
+        content_range = response.get("ContentRange")
+        byte_size = (
+            int(content_range.rsplit("/", 1)[1])
+            if content_range
+            else response["ContentLength"]
+        )
+        return ObjectHead(
+            byte_size=byte_size, content_type=response.get("ContentType"), data=data
+        )
+
+    def delete(self, key: str) -> None:
+        try:
+            self.client.delete_object(Bucket=self.bucket, Key=key)
+        except (ClientError, BotoCoreError) as exc:
+            raise S3Error(f"Failed to delete object {key!r}") from exc
+
+    def delete_many(self, keys: list[str]) -> dict[str, str]:
+        """
+        Delete with S3 multi-object delete requests (up to 1000 keys each).
+
+        Keys not in the returned mapping were deleted (or were already gone).
+        Raises S3Error if a request as a whole fails.
+        """
+        errors: dict[str, str] = {}
+        for start in range(0, len(keys), self.DELETE_BATCH_SIZE):
+            chunk = keys[start : start + self.DELETE_BATCH_SIZE]
+            try:
+                response = self.client.delete_objects(
+                    Bucket=self.bucket,
+                    Delete={"Objects": [{"Key": key} for key in chunk], "Quiet": True},
+                )
+            except (ClientError, BotoCoreError) as exc:
+                raise S3Error(f"Failed to delete {len(chunk)} objects") from exc
+            for error in response.get("Errors", []):
+                errors[error["Key"]] = (
+                    f"{error.get('Code', 'Error')}: {error.get('Message', '')}"
+                )
+        return errors
+
+    def presign_put(self, key: str, content_type: str, expires_in: int) -> str:
+        """Signing is local (no network), so batches are cheap to presign."""
+        try:
+            return self.client.generate_presigned_url(
+                ClientMethod="put_object",
+                Params={"Bucket": self.bucket, "Key": key, "ContentType": content_type},
+                ExpiresIn=expires_in,
+            )
+        except (ClientError, BotoCoreError) as exc:
+            raise S3Error(f"Failed to generate presigned URL for {key!r}") from exc
+
+    def presign_post(
+        self, key: str, content_type: str, max_bytes: int, expires_in: int
+    ) -> tuple[str, dict[str, str]]:
+        try:
+            post = self.client.generate_presigned_post(
+                Bucket=self.bucket,
+                Key=key,
+                Fields={"Content-Type": content_type},
+                Conditions=[
+                    {"Content-Type": content_type},
+                    ["content-length-range", 1, max_bytes],
+                ],
+                ExpiresIn=expires_in,
+            )
+        except (ClientError, BotoCoreError) as exc:
+            raise S3Error(f"Failed to generate presigned POST for {key!r}") from exc
+        return post["url"], post["fields"]
+
+    def presign_upload_part(
+        self,
+        key: str,
+        upload_id: str,
+        part_number: int,
+        content_length: int,
+        expires_in: int,
+    ) -> str:
+        """ContentLength becomes a signed header, so S3 rejects other sizes."""
+        try:
+            return self.client.generate_presigned_url(
+                ClientMethod="upload_part",
+                Params={
+                    "Bucket": self.bucket,
+                    "Key": key,
+                    "UploadId": upload_id,
+                    "PartNumber": part_number,
+                    "ContentLength": content_length,
+                },
+                ExpiresIn=expires_in,
+            )
+        except (ClientError, BotoCoreError) as exc:
+            raise S3Error(
+                f"Failed to generate presigned URL for part {part_number} of {key!r}"
+            ) from exc
+
+    def list_objects(
+        self,
+        prefix: str,
+        next_token: Optional[str] = None,
+        page_size: int = 1000,
+        start_after: Optional[str] = None,
+    ) -> ObjectPage:
+        params = {"Bucket": self.bucket, "Prefix": prefix, "MaxKeys": page_size}
+        if next_token:
+            params["ContinuationToken"] = next_token
+        if start_after:
+            params["StartAfter"] = start_after
+        try:
+            response = self.client.list_objects_v2(**params)
+        except (ClientError, BotoCoreError) as exc:
+            raise S3Error(f"Failed to list objects under {prefix!r}") from exc
+        return ObjectPage(
+            items=[
+                StoredObject(
+                    key=item["Key"],
+                    byte_size=item["Size"],
+                    last_modified=item["LastModified"],
+                )
+                for item in response.get("Contents", [])
+            ],
+            next_token=response.get("NextContinuationToken"),
+        )
+
+    def url(self, key: str) -> str:
+        return f"https://{self.bucket}.s3.{self.region}.amazonaws.com/{key}"
+
+    def create_multipart_upload(self, key: str, content_type: str) -> str:
+        try:
+            response = self.client.create_multipart_upload(
+                Bucket=self.bucket, Key=key, ContentType=content_type
+            )
+        except (ClientError, BotoCoreError) as exc:
+            raise S3Error(f"Failed to start multipart upload for {key!r}") from exc
+        return response["UploadId"]
+
+    def upload_part(
+        self, key: str, upload_id: str, part_number: int, body: bytes
+    ) -> str:
+        try:
+            response = self.client.upload_part(
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=body,
+            )
+        except (ClientError, BotoCoreError) as exc:
+            raise S3Error(f"Failed to upload part {part_number} of {key!r}") from exc
+        return response["ETag"]
+
+    def complete_multipart_upload(
+        self, key: str, upload_id: str, parts: list[tuple[int, str]]
+    ) -> None:
+        try:
+            self.client.complete_multipart_upload(
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={
+                    "Parts": [
+                        {"PartNumber": number, "ETag": etag} for number, etag in parts
+                    ]
+                },
+            )
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") in _MULTIPART_CLIENT_ERRORS:
+                raise S3MultipartUploadError(
+                    f"Cannot complete multipart upload of {key!r}"
+                ) from exc
+            raise S3Error(f"Failed to complete multipart upload of {key!r}") from exc
+        except BotoCoreError as exc:
+            raise S3Error(f"Failed to complete multipart upload of {key!r}") from exc
+
+    def abort_multipart_upload(self, key: str, upload_id: str) -> None:
+        """Aborting an unknown (or already finished) upload is not an error."""
+        try:
+            self.client.abort_multipart_upload(
+                Bucket=self.bucket, Key=key, UploadId=upload_id
+            )
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") == "NoSuchUpload":
+                return
+            raise S3Error(f"Failed to abort multipart upload of {key!r}") from exc
+        except BotoCoreError as exc:
+            raise S3Error(f"Failed to abort multipart upload of {key!r}") from exc
+
+    def list_parts(self, key: str, upload_id: str) -> list[tuple[int, str]]:
+        parts: list[tuple[int, str]] = []
+        params = {"Bucket": self.bucket, "Key": key, "UploadId": upload_id}
+        while True:
+            try:
+                response = self.client.list_parts(**params)
+            except ClientError as exc:
+                if exc.response.get("Error", {}).get("Code") == "NoSuchUpload":
+                    raise S3ObjectNotFoundError(
+                        f"Unknown multipart upload {upload_id!r}"
+                    ) from exc
+                raise S3Error(f"Failed to list parts of {key!r}") from exc
+            except BotoCoreError as exc:
+                raise S3Error(f"Failed to list parts of {key!r}") from exc
+            parts.extend(
+                (part["PartNumber"], part["ETag"]) for part in response.get("Parts", [])
+            )
+            if not response.get("IsTruncated"):
+                return parts
+            params["PartNumberMarker"] = response["NextPartNumberMarker"]
+
+
+class LocalStorage(StorageBackend):
+    """
+    StorageBackend on a local directory.
+
+    Presigned URLs point at the local storage routes and carry an HMAC
+    signature over method, key, scope (content type, or part / policy
+    limits) and expiry, mirroring how S3 presigned requests are scoped.
+    """
+
+    ROUTE_PREFIX = "/api/v1/storage"
+    # Dot-prefixed paths under the root are staging areas, never object keys
+    MULTIPART_DIR = ".multipart"
+
+    def __init__(self, root: Path, base_url: str, secret: str):
+        self.root = Path(root).resolve()
+        self.base_url = base_url.rstrip("/")
+        self._secret = secret.encode()
+
+    def path_for(self, key: str) -> Path:
+        """Filesystem path for key; rejects keys that escape the storage root."""
+        path = (self.root / key).resolve()
+        if key.startswith("/") or not path.is_relative_to(self.root):
+            raise S3Error(f"Invalid storage key {key!r}")
+        return path
+
+    @contextmanager
+    def writer(self, key: str) -> Iterator[BinaryIO]:
+        """Write an object through a temp file that replaces the target on success."""
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".upload-")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                yield fh
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def put(self, key: str, body: bytes, content_type: str) -> None:
+        with self.writer(key) as fh:
+            fh.write(body)
+
+    def get(self, key: str) -> bytes:
+        try:
+            return self.path_for(key).read_bytes()
+        except FileNotFoundError as exc:
+            raise S3ObjectNotFoundError(
+                f"Object not found in storage: {key!r}"
+            ) from exc
+
+    def sha256(self, key: str) -> str:
+        try:
+            with self.path_for(key).open("rb") as fh:
+                return hashlib.file_digest(fh, "sha256").hexdigest()
+        except FileNotFoundError as exc:
+            raise S3ObjectNotFoundError(
+                f"Object not found in storage: {key!r}"
+            ) from exc
+
+    def head(self, key: str) -> Optional[ObjectHead]:
+        path = self.path_for(key)
+        if not path.is_file():
+            return None
+        return ObjectHead(
+            byte_size=path.stat().st_size,
+            content_type=mimetypes.guess_type(key)[0],
+        )
+
+    def read_head(
+        self, key: str, length: int = IMAGE_HEADER_BYTES
+    ) -> Optional[ObjectHead]:
+        path = self.path_for(key)
+        try:
+            with path.open("rb") as fh:
+                data = fh.read(length)
+                byte_size = os.fstat(fh.fileno()).st_size
+        except (FileNotFoundError, IsADirectoryError):
+            return None
+        return ObjectHead(
+            byte_size=byte_size,
+            content_type=mimetypes.guess_type(key)[0],
+            data=data,
+        )
+
+    def delete(self, key: str) -> None:
+        self.path_for(key).unlink(missing_ok=True)
+
+    def delete_many(self, keys: list[str]) -> dict[str, str]:
+        errors = {}
+        for key in keys:
+            try:
+                self.delete(key)
+            except (OSError, S3Error) as exc:
+                errors[key] = str(exc)
+        return errors
+
+    def _signature(self, method: str, key: str, scope: str, expires: int) -> str:
+        message = f"{method}\n{key}\n{scope}\n{expires}".encode()
+        return hmac.new(self._secret, message, hashlib.sha256).hexdigest()
+
+    def verify_signature(
+        self, method: str, key: str, scope: str, expires: int, signature: str
+    ) -> bool:
+        """Check a presigned request's signature and expiry."""
+        if expires < time.time():
+            return False
+        expected = self._signature(method, key, scope, expires)
+        return hmac.compare_digest(expected, signature)
+
+    @staticmethod
+    def part_scope(upload_id: str, part_number: int, content_length: int) -> str:
+        """Signed scope of a presigned multipart part PUT."""
+        return f"part {upload_id} {part_number} {content_length}"
+
+    @staticmethod
+    def post_scope(content_type: str, max_bytes: int) -> str:
+        """Signed scope (the policy) of a presigned POST."""
+        return f"post {content_type} {max_bytes}"
+
+    def presign_put(self, key: str, content_type: str, expires_in: int) -> str:
+        self.path_for(key)
+        expires = int(time.time()) + expires_in
+        query = urlencode(
+            {
+                "expires": expires,
+                "signature": self._signature("PUT", key, content_type, expires),
+            }
+        )
+        return f"{self.url(key)}?{query}"
+
+    def presign_post(
+        self, key: str, content_type: str, max_bytes: int, expires_in: int
+    ) -> tuple[str, dict[str, str]]:
+        self.path_for(key)
+        expires = int(time.time()) + expires_in
+        scope = self.post_scope(content_type, max_bytes)
+        return f"{self.base_url}{self.ROUTE_PREFIX}", {
+            "key": key,
+            "Content-Type": content_type,
+            "max_bytes": str(max_bytes),
+            "expires": str(expires),
+            "signature": self._signature("POST", key, scope, expires),
+        }
+
+    def presign_upload_part(
+        self,
+        key: str,
+        upload_id: str,
+        part_number: int,
+        content_length: int,
+        expires_in: int,
+    ) -> str:
+        self._parts_dir(upload_id)
+        expires = int(time.time()) + expires_in
+        scope = self.part_scope(upload_id, part_number, content_length)
+        query = urlencode(
+            {
+                "uploadId": upload_id,
+                "partNumber": part_number,
+                "expires": expires,
+                "signature": self._signature("PUT", key, scope, expires),
+            }
+        )
+        return f"{self.url(key)}?{query}"
+
+    def list_objects(
+        self,
+        prefix: str,
+        next_token: Optional[str] = None,
+        page_size: int = 1000,
+        start_after: Optional[str] = None,
+    ) -> ObjectPage:
+        """Keys are listed in sorted order; next_token is the last key returned."""
+        after = max(filter(None, (next_token, start_after)), default=None)
+        # Only walk the directory the prefix lives in, not the whole root
+        base = self.path_for(prefix.rsplit("/", 1)[0]) if "/" in prefix else self.root
+        keys = sorted(
+            key
+            for key in (
+                path.relative_to(self.root).as_posix()
+                for path in base.rglob("*")
+                if path.is_file()
+            )
+            if key.startswith(prefix)
+            and not any(part.startswith(".") for part in key.split("/"))
+            and (after is None or key > after)
+        )
+        page = keys[:page_size]
+        items = []
+        for key in page:
+            stat = self.path_for(key).stat()
+            items.append(
+                StoredObject(
+                    key=key,
+                    byte_size=stat.st_size,
+                    last_modified=datetime.fromtimestamp(stat.st_mtime, timezone.utc),
+                )
+            )
+        return ObjectPage(
+            items=items, next_token=page[-1] if len(keys) > page_size else None
+        )
+
+    def url(self, key: str) -> str:
+        return f"{self.base_url}{self.ROUTE_PREFIX}/{quote(key)}"
+
+    def _parts_dir(self, upload_id: str) -> Path:
+        """Staging directory for a multipart upload's parts."""
+        if not upload_id.isalnum():
+            raise S3Error(f"Invalid upload id {upload_id!r}")
+        return self.root / self.MULTIPART_DIR / upload_id
+
+    def create_multipart_upload(self, key: str, content_type: str) -> str:
+        self.path_for(key)
+        upload_id = uuid.uuid4().hex
+        self._parts_dir(upload_id).mkdir(parents=True)
+        return upload_id
+
+    def upload_part(
+        self, key: str, upload_id: str, part_number: int, body: bytes
+    ) -> str:
+        parts_dir = self._parts_dir(upload_id)
+        if not parts_dir.is_dir():
+            raise S3Error(f"Unknown multipart upload {upload_id!r}")
+        (parts_dir / f"{part_number:05d}").write_bytes(body)
+        return f'"{hashlib.md5(body).hexdigest()}"'
+
+    def complete_multipart_upload(
+        self, key: str, upload_id: str, parts: list[tuple[int, str]]
+    ) -> None:
+        parts_dir = self._parts_dir(upload_id)
+        with self.writer(key) as fh:
+            for part_number, etag in parts:
+                part = parts_dir / f"{part_number:05d}"
+                try:
+                    body = part.read_bytes()
+                except FileNotFoundError as exc:
+                    raise S3MultipartUploadError(
+                        f"Missing part {part_number} of {key!r}"
+                    ) from exc
+                if f'"{hashlib.md5(body).hexdigest()}"' != etag:
+                    raise S3MultipartUploadError(
+                        f"ETag mismatch for part {part_number} of {key!r}"
+                    )
+                fh.write(body)
+        shutil.rmtree(parts_dir, ignore_errors=True)
+
+    def abort_multipart_upload(self, key: str, upload_id: str) -> None:
+        shutil.rmtree(self._parts_dir(upload_id), ignore_errors=True)
+
+    def list_parts(self, key: str, upload_id: str) -> list[tuple[int, str]]:
+        parts_dir = self._parts_dir(upload_id)
+        if not parts_dir.is_dir():
+            raise S3ObjectNotFoundError(f"Unknown multipart upload {upload_id!r}")
+        parts = sorted(
+            (part for part in parts_dir.iterdir() if part.name.isdigit()),
+            key=lambda part: int(part.name),
+        )
+        return [
+            (int(part.name), f'"{hashlib.md5(part.read_bytes()).hexdigest()}"')
+            for part in parts
+        ]
+
+
+_storage: Optional[StorageBackend] = None
+_storage_lock = threading.Lock()
+
+
+def storage_configured() -> bool:
+    """Whether the selected backend has the settings it needs."""
+    if settings.STORAGE_BACKEND == "local":
+        return True
+    return bool(settings.S3_BUCKET_NAME)
+
+
+def get_storage() -> StorageBackend:
+    """Return the process-wide backend selected by STORAGE_BACKEND."""
+    global _storage
+    if _storage is None:
+        with _storage_lock:
+            if _storage is None:
+                if settings.STORAGE_BACKEND == "local":
+                    _storage = LocalStorage(
+                        root=Path(settings.LOCAL_STORAGE_ROOT),
+                        base_url=settings.LOCAL_STORAGE_BASE_URL,
+                        secret=settings.JWT_SECRET_KEY,
+                    )
+                else:
+                    _storage = S3Storage(
+                        bucket=settings.S3_BUCKET_NAME,
+                        region=settings.AWS_REGION,
+                    )
+    return _storage
+
+
+# Per event loop, like anyio's default thread limiter
+_storage_io_limiter: RunVar[anyio.CapacityLimiter] = RunVar("storage_io_limiter")
+
+
+def _get_storage_io_limiter() -> anyio.CapacityLimiter:
+    try:
+        return _storage_io_limiter.get()
+    except LookupError:
+        limiter = anyio.CapacityLimiter(settings.STORAGE_IO_CONCURRENCY)
+        _storage_io_limiter.set(limiter)
+        return limiter
+
+
+async def run_storage_io(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Await a blocking storage call. It runs on a worker thread, but counts
+    against STORAGE_IO_CONCURRENCY instead of the shared threadpool limit.
+    """
+    return await anyio.to_thread.run_sync(
+        partial(func, *args, **kwargs), limiter=_get_storage_io_limiter()
+    )
+
+
+async def map_storage_io(func: Callable[[str], Any], keys: list[str]) -> dict[str, Any]:
+    """Await func(key) for many keys concurrently; returns key -> result."""
+    results = await asyncio.gather(*(run_storage_io(func, key) for key in keys))
+    return dict(zip(keys, results))
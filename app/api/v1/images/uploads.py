@@ -0,0 +1,136 @@
+"""
+Server-side streaming uploads for clients that cannot PUT to presigned URLs.
+
+`StreamingUpload` receives the request body chunk by chunk and forwards it to
+storage in fixed-size multipart parts, so memory per upload stays bounded by
+the part size regardless of file size. The image type is sniffed from the
+first bytes and the size cap is enforced as bytes arrive; the SHA-256 is
+computed on the way through for content-addressed storage.
+"""
+
+import hashlib
+from typing import Optional
+
+from app.api.v1.images.storage import IMAGE_HEADER_BYTES, ObjectHead, StorageBackend
+
+# Bytes needed to recognize every supported signature
+SNIFF_BYTES = 16
+
+# Storage key extension for each accepted content type
+IMAGE_EXTENSIONS = {
+    "image/jpeg": "jpg",
+    "image/png": "png",
+    "image/gif": "gif",
+    "image/webp": "webp",
+    "image/avif": "avif",
+}
+
+# ISO-BMFF major brands (bytes 8..12, after "ftyp") for AVIF. HEIC is not
+# accepted: Pillow has no HEIF decoder, so variants could not be rendered.
+_FTYP_BRANDS = {
+    b"avif": "image/avif",
+    b"avis": "image/avif",
+}
+
+
+def sniff_image_type(data: bytes) -> Optional[str]:
+    """Return the image content type from magic bytes, or None if unsupported."""
+    if data.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if data.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if data.startswith((b"GIF87a", b"GIF89a")):
+        return "image/gif"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    if data[4:8] == b"ftyp":
+        return _FTYP_BRANDS.get(data[8:12])
+    return None
+
+
+class UploadTooLargeError(Exception):
+    """Raised when a streamed body exceeds the configured size cap."""
+
+
+class StreamingUpload:
+    """
+    Forward a body to storage in parts as it arrives.
+
+    Bodies that fit in a single part are stored with one PUT; larger ones use
+    a multipart upload that is started lazily when the first part fills up.
+    feed() only buffers; flush_parts(), finish() and abort() do storage I/O
+    and block, so async callers run them in a threadpool.
+    """
+
+    def __init__(
+        self,
+        storage: StorageBackend,
+        key: str,
+        content_type: str,
+        part_size: int,
+        max_bytes: int,
+    ):
+        self.storage = storage
+        self.key = key
+        self.content_type = content_type
+        self.part_size = part_size
+        self.max_bytes = max_bytes
+        self.byte_size = 0
+        self.header = b""
+        self._buffer = bytearray()
+        self._digest = hashlib.sha256()
+        self._upload_id: Optional[str] = None
+        self._parts: list[tuple[int, str]] = []
+
+    def feed(self, chunk: bytes) -> bool:
+        """
+        Buffer a chunk without blocking; returns True once a full part is
+        waiting to be uploaded with flush_parts().
+        """
+        self.byte_size += len(chunk)
+        if self.byte_size > self.max_bytes:
+            raise UploadTooLargeError(f"Upload exceeds the {self.max_bytes} byte limit")
+        if len(self.header) < IMAGE_HEADER_BYTES:
+            self.header += chunk[: IMAGE_HEADER_BYTES - len(self.header)]
+        self._buffer += chunk
+        self._digest.update(chunk)
+        return len(self._buffer) >= self.part_size
+
+    def flush_parts(self) -> None:
+        """Upload every full part currently buffered."""
+        while len(self._buffer) >= self.part_size:
+            self._upload_part(bytes(self._buffer[: self.part_size]))
+            del self._buffer[: self.part_size]
+
+    def _upload_part(self, body: bytes) -> None:
+        if self._upload_id is None:
+            self._upload_id = self.storage.create_multipart_upload(
+                self.key, self.content_type
+            )
+        part_number = len(self._parts) + 1
+        etag = self.storage.upload_part(self.key, self._upload_id, part_number, body)
+        self._parts.append((part_number, etag))
+
+    def finish(self) -> ObjectHead:
+        """Flush the remainder, complete the object and return its head."""
+        if self._upload_id is None:
+            self.storage.put(self.key, bytes(self._buffer), self.content_type)
+        else:
+            if self._buffer:
+                self._upload_part(bytes(self._buffer))
+            self.storage.complete_multipart_upload(
+                self.key, self._upload_id, self._parts
+            )
+        self._buffer.clear()
+        return ObjectHead(
+            byte_size=self.byte_size,
+            content_type=self.content_type,
+            data=self.header,
+            sha256=self._digest.hexdigest(),
+        )
+
+    def abort(self) -> None:
+        """Discard any parts uploaded so far."""
+        self._buffer.clear()
+        if self._upload_id is not None:
+            self.storage.abort_multipart_upload(self.key, self._upload_id)
@@ -0,0 +1,326 @@
+"""
+Responsive image variants (several widths, WebP/AVIF), image metadata and
+perceptual hashes for finalized images.
+
+Finalize enqueues work onto a process pool so resizing and encoding never run
+on request threads. `render_variants` is pure (bytes in, encoded variants
+out) and `build_image_variants` takes any `StorageBackend`, so the pipeline
+can be exercised against `LocalStorage` without S3.
+"""
+
+import base64
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Optional
+from uuid import UUID
+
+from PIL import Image, ImageFile, ImageOps, features
+from sqlalchemy import update
+
+from app.api.v1.images.blobs import is_shared_object
+from app.api.v1.images.duplicates import dhash, flag_duplicate_listing, phash
+from app.api.v1.images.models import ListingImage, PropertyImage, StorageDeletion
+from app.api.v1.images.storage import StorageBackend, get_storage
+from app.core.config import settings
+from app.db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+# Image tables by name, so worker tasks only pickle plain values
+_IMAGE_MODELS = {
+    PropertyImage.__tablename__: PropertyImage,
+    ListingImage.__tablename__: ListingImage,
+}
+
+
+@dataclass(frozen=True)
+class RenderedVariant:
+    """One encoded variant of a source image."""
+
+    width: int
+    height: int
+    format: str
+    body: bytes
+
+    @property
+    def content_type(self) -> str:
+        return f"image/{self.format}"
+
+
+@dataclass(frozen=True)
+class RenderedImage:
+    """
+    Display dimensions, LQIP placeholder, perceptual hashes and encoded
+    variants of an image.
+    """
+
+    width: int
+    height: int
+    placeholder: str
+    phash: int
+    dhash: int
+    variants: list[RenderedVariant]
+
+
+def supported_formats(formats: list[str]) -> list[str]:
+    """Drop formats this Pillow build cannot encode (e.g. AVIF without libavif)."""
+    return [fmt for fmt in formats if features.check(fmt)]
+
+
+def variant_storage_key(storage_key: str, width: int, fmt: str) -> str:
+    """Key for a variant, stored next to its original: <stem>_<width>w.<fmt>."""
+    stem = storage_key.rsplit(".", 1)[0]
+    return f"{stem}_{width}w.{fmt}"
+
+
+def variant_keys(variants: Optional[dict]) -> list[str]:
+    """All storage keys referenced by an image row's variants JSON."""
+    return [item["key"] for items in (variants or {}).values() for item in items]
+
+
+# EXIF orientations that rotate the image by 90 degrees (width/height swap)
+_TRANSPOSED_ORIENTATIONS = {5, 6, 7, 8}
+
+# Width of the blurred placeholder; ~16px keeps the data URI a few hundred bytes
+PLACEHOLDER_WIDTH = 16
+
+
+def probe_dimensions(data: bytes) -> Optional[tuple[int, int]]:
+    """
+    Parse display (width, height) from the leading bytes of an image.
+
+    Only the header needs to be present; EXIF rotation is applied so the size
+    matches how browsers render the image. Returns None if the bytes are not a
+    recognizable image header, or declares more pixels than Pillow will decode
+    (a decompression bomb).
+    """
+    parser = ImageFile.Parser()
+    try:
+        parser.feed(data)
+    except (OSError, SyntaxError, ValueError, Image.DecompressionBombError):
+        return None
+    if parser.image is None:
+        return None
+    width, height = parser.image.size
+    # Read EXIF from the parsed header; getexif() would try to load pixel data
+    exif = Image.Exif()
+    if parser.image.info.get("exif"):
+        exif.load(parser.image.info["exif"])
+    if exif.get(0x0112) in _TRANSPOSED_ORIENTATIONS:
+        width, height = height, width
+    return width, height
+
+
+def render_placeholder(image: Image.Image) -> str:
+    """Encode a tiny, low-quality WebP of the image as a data: URI (LQIP)."""
+    height = max(1, round(image.height * PLACEHOLDER_WIDTH / image.width))
+    tiny = image.resize((PLACEHOLDER_WIDTH, height), Image.Resampling.BILINEAR)
+    buffer = BytesIO()
+    tiny.save(buffer, format="WEBP", quality=30)
+    return "data:image/webp;base64," + base64.b64encode(buffer.getvalue()).decode()
+
+
+def render_variants(
+    data: bytes, widths: list[int], formats: list[str], quality: int
+) -> RenderedImage:
+    """
+    Decode an image once and render its placeholder, perceptual hashes and
+    every (width, format) variant.
+
+    Widths wider than the source are clamped to the source width (never
+    upscaled), so a small upload yields one variant per format at its own size.
+    EXIF orientation is applied before resizing.
+    """
+    with Image.open(BytesIO(data)) as source:
+        # Full display size, taken before draft() shrinks what is decoded
+        full_width, full_height = source.size
+        if source.getexif().get(0x0112) in _TRANSPOSED_ORIENTATIONS:
+            full_width, full_height = full_height, full_width
+        # Let JPEG decode at a reduced scale that still covers the widest variant
+        source.draft("RGB", (max(widths), max(widths)))
+        image = ImageOps.exif_transpose(source)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if image.has_transparency_data else "RGB")
+
+        rendered = []
+        for width in sorted({min(w, full_width) for w in widths}):
+            height = max(1, round(full_height * width / full_width))
+            resized = (
+                image
+                if (width, height) == image.size
+                else image.resize((width, height), Image.Resampling.LANCZOS)
+            )
+            for fmt in formats:
+                buffer = BytesIO()
+                resized.save(buffer, format=fmt.upper(), quality=quality)
+                rendered.append(
+                    RenderedVariant(
+                        width=width,
+                        height=resized.height,
+                        format=fmt,
+                        body=buffer.getvalue(),
+                    )
+                )
+        return RenderedImage(
+            width=full_width,
+            height=full_height,
+            placeholder=render_placeholder(image),
+            phash=phash(image),
+            dhash=dhash(image),
+            variants=rendered,
+        )
+
+
+def build_image_variants(
+    storage: StorageBackend,
+    storage_key: str,
+    widths: list[int],
+    formats: list[str],
+    quality: int,
+) -> dict:
+    """
+    Render and upload variants for one stored original.
+
+    Returns the column values to store on the image row: width, height,
+    placeholder, phash, dhash, and variants as format -> list of
+    {key, url, width, height} in ascending width.
+    """
+    rendered = render_variants(
+        storage.get(storage_key),
+        widths=widths,
+        formats=supported_formats(formats),
+        quality=quality,
+    )
+    variants: dict[str, list[dict]] = {}
+    for variant in rendered.variants:
+        key = variant_storage_key(storage_key, variant.width, variant.format)
+        storage.put(key, variant.body, variant.content_type)
+        variants.setdefault(variant.format, []).append(
+            {
+                "key": key,
+                "url": storage.url(key),
+                "width": variant.width,
+                "height": variant.height,
+            }
+        )
+    return {
+        "width": rendered.width,
+        "height": rendered.height,
+        "placeholder": rendered.placeholder,
+        "phash": rendered.phash,
+        "dhash": rendered.dhash,
+        "variants": variants,
+    }
+
+
+def generate_image_variants(table_name: str, image_id: UUID, storage_key: str) -> int:
+    """
+    Process-pool task: build variants for one image and record them (with
+    its decoded dimensions, placeholder and, for listing images, perceptual
+    hashes) on its row. A listing whose new photo near-matches another
+    owner's listing is flagged as a possible duplicate.
+
+    If the image was deleted (or re-pointed) while rendering, the uploaded
+    variants are queued for deletion instead, unless other images still share
+    the object (content-addressed mode). Returns the number of variants.
+    """
+    image_model = _IMAGE_MODELS[table_name]
+    values = build_image_variants(
+        storage=get_storage(),
+        storage_key=storage_key,
+        widths=settings.image_variant_widths,
+        formats=settings.image_variant_formats,
+        quality=settings.IMAGE_VARIANT_QUALITY,
+    )
+    keys = variant_keys(values["variants"])
+    # Perceptual hashes are only stored for listing images
+    columns = image_model.__table__.columns
+    values = {name: value for name, value in values.items() if name in columns}
+    with SessionLocal() as db:
+        updated = db.execute(
+            update(image_model)
+            .where(
+                image_model.id == image_id,
+                image_model.storage_key == storage_key,
+            )
+            .values(**values)
+        ).rowcount
+        if not updated and not is_shared_object(db, storage_key):
+            db.add_all(StorageDeletion(storage_key=key) for key in keys)
+        db.commit()
+        if (
+            updated
+            and image_model is ListingImage
+            and settings.IMAGE_DUPLICATE_FLAGGING_ENABLED
+        ):
+            flag_duplicate_listing(db, image_id)
+            db.commit()
+    return len(keys)
+
+
+def flag_duplicate_listing_images(image_ids: list[UUID]) -> int:
+    """
+    Process-pool task: duplicate flagging for listing images that reused a
+    shared object's variants and hashes (content-addressed mode), and so never
+    pass through generate_image_variants. Returns how many were flagged.
+    """
+    flagged = 0
+    with SessionLocal() as db:
+        for image_id in image_ids:
+            flagged += flag_duplicate_listing(db, image_id)
+        db.commit()
+    return flagged
+
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """Create the variant process pool on first use (spawn: no forked DB state)."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=settings.IMAGE_VARIANT_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _executor
+
+
+def _log_failure(future: Future) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("Image variant task failed", exc_info=future.exception())
+
+
+def enqueue_image_variants(image_model, images: list[tuple[UUID, str]]) -> None:
+    """Schedule variant generation for (image_id, storage_key) pairs; returns immediately."""
+    if not settings.IMAGE_VARIANTS_ENABLED or not images:
+        return
+    executor = _get_executor()
+    for image_id, storage_key in images:
+        future = executor.submit(
+            generate_image_variants, image_model.__tablename__, image_id, storage_key
+        )
+        future.add_done_callback(_log_failure)
+
+
+def enqueue_duplicate_flagging(image_ids: list[UUID]) -> None:
+    """Schedule duplicate flagging for listing image ids; returns immediately."""
+    if not settings.IMAGE_DUPLICATE_FLAGGING_ENABLED or not image_ids:
+        return
+    future = _get_executor().submit(flag_duplicate_listing_images, image_ids)
+    future.add_done_callback(_log_failure)
+
+
+def shutdown_variant_executor() -> None:
+    """Stop the variant process pool, dropping work that has not started."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
@@ -1,12 +1,20 @@
+from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import (
+    get_current_user,
+    get_current_user_id,
+    get_db,
+    get_optional_current_user_id,
+)
 from app.api.v1.users.models import User
 from app.api.v1.listings.schemas import (
     AmenityResponse,
+    ListingBatchGetRequest,
+    ListingBatchGetResponse,
     ListingCreate,
     ListingFilterQuery,
     ListingListResponse,
@@ -17,6 +25,7 @@ from app.api.v1.listings.services import (
     create_listing,
     get_listing_by_id,
     get_listings,
+    get_listings_by_ids,
     list_amenities,
     soft_delete_listing,
     update_listing,
@@ -29,15 +38,17 @@ router = APIRouter()
 def get_listings_controller(
     db: Session = Depends(get_db),
     params: ListingFilterQuery = Depends(),
+    user_id: Optional[str] = Depends(get_optional_current_user_id),
 ):
     """
     Search and filter listings.
 
     Returns a paginated list of listings (excluding soft-deleted) with optional
     filters for status, unit type, rent range, property, text search, and
-    availability date.
+    availability date. Authentication is optional; when present each item
+    reports whether the current user saved it.
     """
-    return get_listings(db=db, **params.model_dump())
+    return get_listings(db=db, user_id=user_id, **params.model_dump())
 
 
 @router.get("/amenities", response_model=list[AmenityResponse])
@@ -65,6 +76,20 @@ def post_listing_controller(
     return create_listing(db=db, user_id=user.id, data=payload)
 
 
+@router.post("/batch-get", response_model=ListingBatchGetResponse)
+def batch_get_listings_controller(
+    payload: ListingBatchGetRequest,
+    db: Session = Depends(get_db),
+):
+    """
+    Return many listings by ID in one request.
+
+    Results follow the requested order; IDs that do not exist or have been
+    soft-deleted are returned in missing_ids instead of failing the request.
+    """
+    return get_listings_by_ids(db=db, listing_ids=payload.ids)
+
+
 @router.get("/{listing_id}", response_model=ListingResponse)
 def get_listing_controller(
     listing_id: UUID,
@@ -89,7 +114,7 @@ def patch_listing_controller(
     listing_id: UUID,
     payload: ListingUpdate,
     db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Update a listing (owner only).
@@ -100,7 +125,7 @@ def patch_listing_controller(
     listing = update_listing(
         db=db,
         listing_id=listing_id,
-        user_id=user.id,
+        user_id=user_id,
         data=payload,
     )
     if not listing:
@@ -115,7 +140,7 @@ def patch_listing_controller(
 def delete_listing_controller(
     listing_id: UUID,
     db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Soft-delete a listing (owner only).
@@ -126,7 +151,7 @@ def delete_listing_controller(
     deleted = soft_delete_listing(
         db=db,
         listing_id=listing_id,
-        user_id=user.id,
+        user_id=user_id,
     )
     if not deleted:
         raise HTTPException(
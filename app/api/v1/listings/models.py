@@ -2,6 +2,7 @@ import enum
 import uuid
 
 from sqlalchemy import (
+    Boolean,
     Column,
     Date,
     Enum,
@@ -64,6 +65,12 @@ class Listing(SoftDeleteBase):
     square_feet = Column(Integer, nullable=True)
     max_occupants = Column(Integer, nullable=True)
     status = Column(Enum(ListingStatus), default=ListingStatus.DRAFT, nullable=False)
+    possible_duplicate = Column(
+        Boolean,
+        default=False,
+        nullable=False,
+        comment="Set when a photo near-matches another owner's listing",
+    )
 
     # created_at, updated_at, deleted_at from SoftDeleteBase
 
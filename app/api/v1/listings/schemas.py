@@ -1,9 +1,11 @@
+import enum
 from datetime import date, datetime
-from typing import Optional
+from typing import Optional, Union
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from app.api.v1.images.schemas import ImageResponse
 from app.api.v1.listings.models import ListingStatus, UnitType
 
 
@@ -70,14 +72,44 @@ class ListingResponse(BaseModel):
     square_feet: Optional[int]
     max_occupants: Optional[int]
     status: ListingStatus
+    possible_duplicate: bool = Field(
+        False,
+        description="A photo near-matches another owner's listing (set in the "
+        "background after images are added)",
+    )
     created_at: datetime
     updated_at: datetime
     amenities: list[AmenityResponse] = Field(default_factory=list)
+    images: list[ImageResponse] = Field(default_factory=list)
+    is_saved: Optional[bool] = Field(
+        None, description="Whether the current user saved it; null when anonymous"
+    )
 
     class Config:
         from_attributes = True
 
 
+class ListingCardResponse(BaseModel):
+    """Compact listing projection for feed cards (no description or amenities)."""
+
+    id: UUID
+    property_id: UUID
+    title: str
+    monthly_rent: int
+    unit_type: UnitType
+    available_from: Optional[date]
+    status: ListingStatus
+    thumbnail_url: Optional[str] = None
+    is_saved: Optional[bool] = None
+
+
+class ListingView(str, enum.Enum):
+    """Projection used when returning listings from list endpoints."""
+
+    CARD = "card"
+    FULL = "full"
+
+
 class ListingFilterQuery(BaseModel):
     """Query parameters for searching and filtering listings."""
 
@@ -91,6 +123,13 @@ class ListingFilterQuery(BaseModel):
         None,
         description="Listings available on or after this date (YYYY-MM-DD)",
     )
+    view: ListingView = Field(
+        ListingView.FULL,
+        description="`card` returns a compact projection for feed pages",
+    )
+    images: int = Field(
+        0, ge=0, le=20, description="Embed the first N images of each listing"
+    )
     limit: int = Field(20, ge=1, le=100)
     offset: int = Field(0, ge=0)
 
@@ -98,5 +137,18 @@ class ListingFilterQuery(BaseModel):
 class ListingListResponse(BaseModel):
     """Paginated list of listings with total count."""
 
-    items: list[ListingResponse]
+    items: list[Union[ListingResponse, ListingCardResponse]]
     total: int
+
+
+class ListingBatchGetRequest(BaseModel):
+    """Payload for fetching many listings by ID in one request."""
+
+    ids: list[UUID] = Field(..., min_length=1, max_length=50)
+
+
+class ListingBatchGetResponse(BaseModel):
+    """Listings in requested order plus IDs that were not found or are deleted."""
+
+    items: list[ListingResponse]
+    missing_ids: list[UUID]
@@ -3,9 +3,12 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import HTTPException, status
-from sqlalchemy import and_, or_
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, delete, func, insert, literal, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Query, Session, aliased, load_only
 
+from app.api.v1.images.models import ListingImage
+from app.api.v1.images.schemas import ImageResponse
 from app.api.v1.listings.models import (
     Amenity,
     Listing,
@@ -16,12 +19,78 @@ from app.api.v1.listings.models import (
 )
 from app.api.v1.listings.schemas import (
     AmenityResponse,
+    ListingBatchGetResponse,
+    ListingCardResponse,
     ListingCreate,
     ListingListResponse,
     ListingResponse,
     ListingUpdate,
+    ListingView,
 )
 from app.api.v1.properties.models import Property
+from app.core.cache import TTLCache
+from app.api.v1.users.schemas import (
+    SavedListingBatchItem,
+    SavedListingBatchOutcome,
+    SavedListingsBatchResponse,
+)
+
+
+# The amenity catalog is small and rarely changes, so it is cached per process.
+_amenity_catalog_cache = TTLCache(maxsize=1, ttl_seconds=300)
+
+
+def _amenity_catalog(db: Session) -> dict[UUID, AmenityResponse]:
+    """Return all amenities keyed by ID (ordered by key), cached for a few minutes."""
+    catalog = _amenity_catalog_cache.get("catalog")
+    if catalog is None:
+        rows = db.query(Amenity).order_by(Amenity.key).all()
+        catalog = {r.id: AmenityResponse.model_validate(r) for r in rows}
+        _amenity_catalog_cache.set("catalog", catalog)
+    return catalog
+
+
+def _validate_amenity_ids(db: Session, amenity_ids: list[UUID]) -> list[UUID]:
+    """
+    Return amenity_ids de-duplicated (order kept) after checking them against the
+    cached catalog; the catalog is reloaded once before rejecting unknown IDs.
+
+    Raises:
+        HTTPException: 400 if any amenity ID does not exist.
+    """
+    amenity_ids = list(dict.fromkeys(amenity_ids))
+    unknown = [aid for aid in amenity_ids if aid not in _amenity_catalog(db)]
+    if unknown:
+        _amenity_catalog_cache.clear()
+        catalog = _amenity_catalog(db)
+        unknown = [aid for aid in unknown if aid not in catalog]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown amenity_id(s): {', '.join(str(a) for a in unknown)}",
+        )
+    return amenity_ids
+
+
+def _add_listing_amenities(
+    db: Session, listing_id: UUID, amenity_ids: list[UUID]
+) -> None:
+    """Insert listing_amenities rows for a listing in one multi-row INSERT."""
+    if not amenity_ids:
+        return
+    db.execute(
+        insert(ListingAmenity).values(
+            [{"listing_id": listing_id, "amenity_id": aid} for aid in amenity_ids]
+        )
+    )
+
+
+def _amenities_from_catalog(
+    db: Session, amenity_ids: list[UUID]
+) -> list[AmenityResponse]:
+    """Resolve amenity IDs to responses via the cached catalog (unknown IDs skipped)."""
+    catalog = _amenity_catalog(db)
+    return [catalog[aid] for aid in dict.fromkeys(amenity_ids) if aid in catalog]
 
 
 def list_amenities(db: Session) -> list[AmenityResponse]:
@@ -31,8 +100,7 @@ def list_amenities(db: Session) -> list[AmenityResponse]:
     Used when building create/edit listing forms so clients can show checkboxes
     or a multi-select for amenities.
     """
-    rows = db.query(Amenity).order_by(Amenity.key).all()
-    return [AmenityResponse.model_validate(r) for r in rows]
+    return list(_amenity_catalog(db).values())
 
 
 def _amenities_for_listing_ids(
@@ -58,15 +126,115 @@ def _amenities_for_listing_ids(
     return by_listing
 
 
+def _images_for_listing_ids(
+    db: Session, listing_ids: list[UUID], per_listing: int
+) -> dict[UUID, list[ImageResponse]]:
+    """
+    Load the first `per_listing` images (by display order) for multiple listings
+    in one windowed query (avoids one image request per listing card).
+
+    Returns:
+        Mapping of listing_id -> list of ImageResponse in display order.
+    """
+    if not listing_ids or per_listing <= 0:
+        return {}
+    ranked = (
+        db.query(
+            ListingImage,
+            func.row_number()
+            .over(
+                partition_by=ListingImage.listing_id,
+                order_by=(
+                    ListingImage.display_order.asc(),
+                    ListingImage.created_at.asc(),
+                ),
+            )
+            .label("position"),
+        )
+        .where(ListingImage.listing_id.in_(listing_ids))
+        .subquery()
+    )
+    ranked_image = aliased(ListingImage, ranked)
+    rows = (
+        db.query(ranked_image)
+        .where(ranked.c.position <= per_listing)
+        .order_by(ranked_image.listing_id, ranked.c.position)
+        .all()
+    )
+    by_listing = {lid: [] for lid in listing_ids}
+    for image in rows:
+        by_listing[image.listing_id].append(ImageResponse.model_validate(image))
+    return by_listing
+
+
+# Cards render at ~300 CSS px; thumbnails use the smallest variant this wide
+CARD_THUMBNAIL_WIDTH = 320
+
+# Columns needed to render a ListingCardResponse; everything else stays unloaded.
+_CARD_COLUMNS = (
+    Listing.id,
+    Listing.property_id,
+    Listing.title,
+    Listing.monthly_rent,
+    Listing.unit_type,
+    Listing.available_from,
+    Listing.status,
+)
+
+
+def _apply_view(q: Query, view: ListingView) -> Query:
+    """Narrow the listing SELECT to the columns the requested view needs."""
+    if view == ListingView.CARD:
+        return q.options(load_only(*_CARD_COLUMNS))
+    return q
+
+
+def _saved_listing_ids(db: Session, user_id: str, listing_ids: list[UUID]) -> set[UUID]:
+    """Return which of the given listings the user has saved, in one query."""
+    if not listing_ids:
+        return set()
+    rows = (
+        db.query(SavedListing.listing_id)
+        .where(
+            SavedListing.user_id == user_id,
+            SavedListing.listing_id.in_(listing_ids),
+        )
+        .all()
+    )
+    return {listing_id for (listing_id,) in rows}
+
+
+def _listing_to_card(
+    listing: Listing,
+    thumbnail_url: Optional[str],
+    is_saved: Optional[bool] = None,
+) -> ListingCardResponse:
+    """Build a ListingCardResponse from a (column-narrowed) ORM Listing."""
+    return ListingCardResponse(
+        id=listing.id,
+        property_id=listing.property_id,
+        title=listing.title,
+        monthly_rent=listing.monthly_rent,
+        unit_type=listing.unit_type,
+        available_from=listing.available_from,
+        status=listing.status,
+        thumbnail_url=thumbnail_url,
+        is_saved=is_saved,
+    )
+
+
 def _listing_to_out(
-    listing: Listing, amenities: list[AmenityResponse]
+    listing: Listing,
+    amenities: list[AmenityResponse],
+    images: Optional[list[ImageResponse]] = None,
+    is_saved: Optional[bool] = None,
 ) -> ListingResponse:
     """Build a ListingResponse from an ORM Listing and its preloaded amenities."""
     return ListingResponse(
         id=listing.id,
         property_id=listing.property_id,
         # Backward compatibility: schemas expect `user_id` though model uses `owner_id`.
-        user_id=getattr(listing, "user_id", None) or getattr(listing, "owner_id"),
+        user_id=listing.owner_id,
         title=listing.title,
         description=listing.description,
         monthly_rent=listing.monthly_rent,
@@ -78,12 +246,65 @@ def _listing_to_out(
         square_feet=listing.square_feet,
         max_occupants=listing.max_occupants,
         status=listing.status,
+        possible_duplicate=listing.possible_duplicate,
         created_at=listing.created_at,
         updated_at=listing.updated_at,
         amenities=amenities,
+        images=images or [],
+        is_saved=is_saved,
     )
 
 
+def _listing_page_items(
+    db: Session,
+    rows: list[Listing],
+    view: ListingView,
+    images: int = 0,
+    saved_ids: Optional[set[UUID]] = None,
+) -> list[ListingResponse | ListingCardResponse]:
+    """
+    Serialize a page of listings in the requested view, batching related loads.
+
+    Card items always carry a thumbnail; full items embed up to `images` images.
+    When saved_ids is given, each item's is_saved is set from it; otherwise it
+    is left null (anonymous request).
+    """
+    listing_ids = [r.id for r in rows]
+
+    def is_saved(listing_id: UUID) -> Optional[bool]:
+        return None if saved_ids is None else listing_id in saved_ids
+
+    if view == ListingView.CARD:
+        images_map = _images_for_listing_ids(
+            db=db, listing_ids=listing_ids, per_listing=1
+        )
+        return [
+            _listing_to_card(
+                listing=listing,
+                thumbnail_url=(
+                    images_map[listing.id][0].variant_url(CARD_THUMBNAIL_WIDTH)
+                    if images_map.get(listing.id)
+                    else None
+                ),
+                is_saved=is_saved(listing.id),
+            )
+            for listing in rows
+        ]
+    amenities_map = _amenities_for_listing_ids(db=db, listing_ids=listing_ids)
+    images_map = _images_for_listing_ids(
+        db=db, listing_ids=listing_ids, per_listing=images
+    )
+    return [
+        _listing_to_out(
+            listing=listing,
+            amenities=amenities_map.get(listing.id, []),
+            images=images_map.get(listing.id, []),
+            is_saved=is_saved(listing.id),
+        )
+        for listing in rows
+    ]
+
+
 def get_listings(
     db: Session,
     *,
@@ -94,6 +315,9 @@ def get_listings(
     property_id: Optional[UUID] = None,
     search: Optional[str] = None,
     available_from_after: Optional[str] = None,
+    view: ListingView = ListingView.FULL,
+    images: int = 0,
+    user_id: Optional[str] = None,
     limit: int = 20,
     offset: int = 0,
 ) -> ListingListResponse:
@@ -102,7 +326,10 @@ def get_listings(
 
     Excludes soft-deleted listings. Applies optional filters for status,
     unit type, rent range, property, text search (title/description), and
-    availability date. Results are ordered by created_at descending.
+    availability date. Results are ordered by created_at descending. With
+    view=card only the card columns are selected and a compact schema is returned;
+    with images=N the first N images of each listing are embedded. When user_id
+    is given, each item's is_saved is computed for the whole page in one query.
 
     Returns:
         ListingListResponse with items and total count.
@@ -134,16 +361,21 @@ def get_listings(
             pass  # Invalid date string: ignore filter
 
     total = q.count()
-    rows = q.order_by(Listing.created_at.desc()).offset(offset).limit(limit).all()
-    listing_ids = [r.id for r in rows]
-    amenities_map = _amenities_for_listing_ids(db=db, listing_ids=listing_ids)
-    items = [
-        _listing_to_out(
-            listing=listing,
-            amenities=amenities_map.get(listing.id, []),
-        )
-        for listing in rows
-    ]
+    rows = (
+        _apply_view(q, view)
+        .order_by(Listing.created_at.desc())
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
+    saved_ids = (
+        _saved_listing_ids(db=db, user_id=user_id, listing_ids=[r.id for r in rows])
+        if user_id is not None
+        else None
+    )
+    items = _listing_page_items(
+        db=db, rows=rows, view=view, images=images, saved_ids=saved_ids
+    )
     return ListingListResponse(items=items, total=total)
 
 
@@ -167,50 +399,81 @@ def get_listing_by_id(db: Session, listing_id: UUID) -> Optional[ListingResponse
     return _listing_to_out(listing=listing, amenities=amenities)
 
 
+def get_listings_by_ids(
+    db: Session, listing_ids: list[UUID]
+) -> ListingBatchGetResponse:
+    """
+    Return many listings by ID using one IN query plus one amenity query.
+
+    Items follow the requested order (duplicates collapsed); IDs that do not
+    exist or are soft-deleted are reported in missing_ids.
+    """
+    requested = list(dict.fromkeys(listing_ids))
+    rows = (
+        db.query(Listing)
+        .where(Listing.id.in_(requested), Listing.deleted_at.is_(None))
+        .all()
+    )
+    by_id = {row.id: row for row in rows}
+    amenities_map = _amenities_for_listing_ids(db=db, listing_ids=list(by_id))
+    items = [
+        _listing_to_out(listing=by_id[lid], amenities=amenities_map.get(lid, []))
+        for lid in requested
+        if lid in by_id
+    ]
+    missing_ids = [lid for lid in requested if lid not in by_id]
+    return ListingBatchGetResponse(items=items, missing_ids=missing_ids)
+
+
 def create_listing(db: Session, user_id: str, data: ListingCreate) -> ListingResponse:
     """
     Create a new listing owned by the given user.
 
-    Validates that the property exists before creating. Inserts the listing
-    and its listing_amenities in one transaction.
+    Validates amenity IDs and that the property exists before creating. Inserts
+    the listing and its listing_amenities (one multi-row INSERT) in one
+    transaction; the response is built from the INSERT ... RETURNING row and
+    the amenity catalog, without re-reading.
 
     Raises:
-        HTTPException: 404 if the payload's property_id does not exist.
+        HTTPException: 400 for unknown amenity IDs; 404 if the payload's
+            property_id does not exist.
     """
+    amenity_ids = _validate_amenity_ids(db=db, amenity_ids=data.amenity_ids)
     property_exists = db.get(Property, data.property_id) is not None
     if not property_exists:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Property not found",
         )
-    listing = Listing(
-        property_id=data.property_id,
-        user_id=user_id,
-        title=data.title,
-        description=data.description,
-        monthly_rent=data.monthly_rent,
-        deposit_amount=data.deposit_amount,
-        available_from=data.available_from,
-        lease_term_months=data.lease_term_months,
-        lease_type=data.lease_type,
-        unit_type=data.unit_type,
-        square_feet=data.square_feet,
-        max_occupants=data.max_occupants,
-        status=data.status,
-    )
-    db.add(listing)
-    db.flush()  # Get listing.id before adding listing_amenities
+    listing = db.scalars(
+        insert(Listing)
+        .values(
+            property_id=data.property_id,
+            owner_id=user_id,
+            title=data.title,
+            description=data.description,
+            monthly_rent=data.monthly_rent,
+            deposit_amount=data.deposit_amount,
+            available_from=data.available_from,
+            lease_term_months=data.lease_term_months,
+            lease_type=data.lease_type,
+            unit_type=data.unit_type,
+            square_feet=data.square_feet,
+            max_occupants=data.max_occupants,
+            status=data.status,
+        )
+        .returning(Listing)
+    ).one()
 
-    # Add listing_amenities
-    for amenity_id in data.amenity_ids:
-        db.add(ListingAmenity(listing_id=listing.id, amenity_id=amenity_id))
-    db.commit()
+    _add_listing_amenities(db=db, listing_id=listing.id, amenity_ids=amenity_ids)
 
-    db.refresh(listing)
-    amenities = _amenities_for_listing_ids(db=db, listing_ids=[listing.id]).get(
-        listing.id, []
+    # Serialize before commit: committing expires the row and would force a reload.
+    out = _listing_to_out(
+        listing=listing,
+        amenities=_amenities_from_catalog(db=db, amenity_ids=amenity_ids),
     )
-    return _listing_to_out(listing=listing, amenities=amenities)
+    db.commit()
+    return out
 
 
 def update_listing(
@@ -219,36 +482,70 @@ def update_listing(
     """
     Update a listing (owner only); partial update supported.
 
-    Only fields present in data are updated. If amenity_ids is provided, the
-    listing's amenities are replaced with the given set. Returns None if the
-    listing is not found, soft-deleted, or the user is not the owner.
+    Only fields present in data are updated, in one UPDATE ... RETURNING
+    scoped to the owner. If amenity_ids is provided, the listing's amenities
+    are set to exactly that set by diffing against the current rows and writing
+    only removals and additions. Returns None if the listing is not found,
+    soft-deleted, or the user is not the owner.
+
+    Raises:
+        HTTPException: 400 for unknown amenity IDs.
     """
-    listing = (
-        db.query(Listing)
-        .where(and_(Listing.id == listing_id, Listing.deleted_at.is_(None)))
-        .first()
+    update_data = data.model_dump(exclude_unset=True)
+    amenity_ids = update_data.pop("amenity_ids", None)
+    if amenity_ids is not None:
+        amenity_ids = _validate_amenity_ids(db=db, amenity_ids=amenity_ids)
+    owned = and_(
+        Listing.id == listing_id,
+        Listing.deleted_at.is_(None),
+        Listing.owner_id == user_id,
     )
-    if not listing or listing.user_id != user_id:
+    if update_data:
+        listing = db.scalars(
+            update(Listing)
+            .where(owned)
+            .values(**update_data)
+            .returning(Listing)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        ).one_or_none()
+    else:
+        listing = db.query(Listing).where(owned).first()
+    if not listing:
         return None
 
-    update = data.model_dump(exclude_unset=True)
-    amenity_ids = update.pop("amenity_ids", None)
-    for key, value in update.items():
-        setattr(listing, key, value)
-
     if amenity_ids is not None:
-        # Replace all listing_amenities with the new set
-        db.query(ListingAmenity).where(ListingAmenity.listing_id == listing_id).delete()
-        for aid in amenity_ids:
-            db.add(ListingAmenity(listing_id=listing_id, amenity_id=aid))
+        current = set(
+            db.scalars(
+                select(ListingAmenity.amenity_id).where(
+                    ListingAmenity.listing_id == listing_id
+                )
+            ).all()
+        )
+        to_remove = current.difference(amenity_ids)
+        if to_remove:
+            db.execute(
+                delete(ListingAmenity)
+                .where(
+                    ListingAmenity.listing_id == listing_id,
+                    ListingAmenity.amenity_id.in_(to_remove),
+                )
+                .execution_options(synchronize_session=False)
+            )
+        _add_listing_amenities(
+            db=db,
+            listing_id=listing_id,
+            amenity_ids=[aid for aid in amenity_ids if aid not in current],
+        )
+        amenities = _amenities_from_catalog(db=db, amenity_ids=amenity_ids)
+    else:
+        amenities = _amenities_for_listing_ids(db=db, listing_ids=[listing.id]).get(
+            listing.id, []
+        )
 
+    # Serialize before commit: committing expires the row and would force a reload.
+    out = _listing_to_out(listing=listing, amenities=amenities)
     db.commit()
-    db.refresh(listing)
-
-    amenities = _amenities_for_listing_ids(db=db, listing_ids=[listing.id]).get(
-        listing.id, []
-    )
-    return _listing_to_out(listing=listing, amenities=amenities)
+    return out
 
 
 def soft_delete_listing(db: Session, listing_id: UUID, user_id: str) -> bool:
@@ -264,7 +561,7 @@ def soft_delete_listing(db: Session, listing_id: UUID, user_id: str) -> bool:
         .where(and_(Listing.id == listing_id, Listing.deleted_at.is_(None)))
         .first()
     )
-    if not listing or listing.user_id != user_id:
+    if not listing or listing.owner_id != user_id:
         return False
     listing.soft_delete()
     db.commit()
@@ -272,10 +569,16 @@ def soft_delete_listing(db: Session, listing_id: UUID, user_id: str) -> bool:
 
 
 def get_saved_listings(
-    db: Session, *, user_id: str, limit: int = 20, offset: int = 0
+    db: Session,
+    *,
+    user_id: str,
+    view: ListingView = ListingView.FULL,
+    images: int = 0,
+    limit: int = 20,
+    offset: int = 0,
 ) -> ListingListResponse:
     """
-    Return listings saved by the given user, including amenities.
+    Return listings saved by the given user in the requested view.
 
     Excludes soft-deleted listings. Ordered by when the listing was created
     (desc) to match general listing ordering.
@@ -289,53 +592,176 @@ def get_saved_listings(
         )
     )
     total = q.count()
-    rows = q.order_by(Listing.created_at.desc()).offset(offset).limit(limit).all()
-    listing_ids = [r.id for r in rows]
-    amenities_map = _amenities_for_listing_ids(db=db, listing_ids=listing_ids)
-    items = [
-        _listing_to_out(listing=listing, amenities=amenities_map.get(listing.id, []))
-        for listing in rows
-    ]
+    rows = (
+        _apply_view(q, view)
+        .order_by(Listing.created_at.desc())
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
+    items = _listing_page_items(
+        db=db,
+        rows=rows,
+        view=view,
+        images=images,
+        saved_ids={r.id for r in rows},
+    )
     return ListingListResponse(items=items, total=total)
 
 
-def save_listing_for_user(db: Session, *, user_id: str, listing_id: UUID) -> bool:
-    """Save a listing for a user. Returns True if created, False if already saved."""
-    # Ensure listing exists and is not soft-deleted
-    listing = (
-        db.query(Listing)
-        .where(Listing.id == listing_id, Listing.deleted_at.is_(None))
-        .first()
+def check_saved_listings(
+    db: Session, *, user_id: str, listing_ids: list[UUID]
+) -> dict[UUID, bool]:
+    """Return saved state for each requested listing ID using one lookup."""
+    saved_ids = _saved_listing_ids(db=db, user_id=user_id, listing_ids=listing_ids)
+    return {listing_id: listing_id in saved_ids for listing_id in listing_ids}
+
+
+def _live_listing_ids(db: Session, listing_ids: list[UUID]) -> set[UUID]:
+    """Return which of the given listing IDs exist and are not soft-deleted."""
+    if not listing_ids:
+        return set()
+    return set(
+        db.scalars(
+            select(Listing.id).where(
+                Listing.id.in_(listing_ids), Listing.deleted_at.is_(None)
+            )
+        ).all()
     )
-    if not listing:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Listing not found"
-        )
 
-    exists = (
-        db.query(SavedListing)
-        .where(
-            SavedListing.user_id == user_id,
-            SavedListing.listing_id == listing_id,
-        )
-        .first()
-        is not None
+
+def _insert_saved_listings(
+    db: Session, user_id: str, listing_ids: list[UUID]
+) -> set[UUID]:
+    """
+    Save live listings for a user in one INSERT ... SELECT ... ON CONFLICT DO NOTHING.
+
+    Returns:
+        IDs of the rows actually inserted; IDs that were already saved or are
+        not live listings are absent. Caller must commit the session.
+    """
+    if not listing_ids:
+        return set()
+    live_listings = select(
+        literal(user_id, SavedListing.user_id.type),
+        Listing.id,
+        func.now(),
+        func.now(),
+    ).where(Listing.id.in_(listing_ids), Listing.deleted_at.is_(None))
+    return set(
+        db.scalars(
+            pg_insert(SavedListing)
+            .from_select(
+                ["user_id", "listing_id", "created_at", "updated_at"],
+                live_listings,
+            )
+            .on_conflict_do_nothing(index_elements=["user_id", "listing_id"])
+            .returning(SavedListing.listing_id)
+        ).all()
     )
-    if exists:
-        return False
 
-    db.add(SavedListing(user_id=user_id, listing_id=listing_id))
+
+def _delete_saved_listings(
+    db: Session, user_id: str, listing_ids: list[UUID]
+) -> set[UUID]:
+    """
+    Remove saved listings for a user in one DELETE ... RETURNING.
+
+    Returns:
+        IDs of the rows actually deleted. Caller must commit the session.
+    """
+    if not listing_ids:
+        return set()
+    return set(
+        db.scalars(
+            delete(SavedListing)
+            .where(
+                SavedListing.user_id == user_id,
+                SavedListing.listing_id.in_(listing_ids),
+            )
+            .returning(SavedListing.listing_id)
+            .execution_options(synchronize_session=False)
+        ).all()
+    )
+
+
+def save_listing_for_user(db: Session, *, user_id: str, listing_id: UUID) -> bool:
+    """
+    Save a listing for a user. Returns True if created, False if already saved.
+
+    Runs as a single upsert; the listing existence check only happens when
+    nothing was inserted, to tell "already saved" apart from a missing listing.
+
+    Raises:
+        HTTPException: 404 if the listing does not exist or is soft-deleted.
+    """
+    inserted = _insert_saved_listings(db=db, user_id=user_id, listing_ids=[listing_id])
     db.commit()
-    return True
+    if inserted:
+        return True
+    if not _live_listing_ids(db=db, listing_ids=[listing_id]):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Listing not found"
+        )
+    return False
 
 
 def unsave_listing_for_user(db: Session, *, user_id: str, listing_id: UUID) -> bool:
     """Remove a saved listing. Returns True if deleted, False if not present."""
-    q = db.query(SavedListing).where(
-        SavedListing.user_id == user_id, SavedListing.listing_id == listing_id
+    deleted = _delete_saved_listings(db=db, user_id=user_id, listing_ids=[listing_id])
+    db.commit()
+    return bool(deleted)
+
+
+def update_saved_listings_batch(
+    db: Session, *, user_id: str, add: list[UUID], remove: list[UUID]
+) -> SavedListingsBatchResponse:
+    """
+    Save and unsave many listings for a user in one transaction.
+
+    Saves run as a single INSERT ... SELECT over live listings with
+    ON CONFLICT DO NOTHING, and removals as a single DELETE ... WHERE
+    listing_id IN (...); both use RETURNING to report per-item outcomes.
+
+    Raises:
+        HTTPException: 400 if a listing ID appears in both add and remove.
+    """
+    add_ids = list(dict.fromkeys(add))
+    remove_ids = list(dict.fromkeys(remove))
+    if set(add_ids) & set(remove_ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="A listing ID cannot be in both add and remove",
+        )
+
+    inserted = _insert_saved_listings(db=db, user_id=user_id, listing_ids=add_ids)
+    # Only distinguish "already saved" from "not found" when something was
+    # skipped, so the common all-new case stays one statement.
+    existing = _live_listing_ids(
+        db=db, listing_ids=[lid for lid in add_ids if lid not in inserted]
     )
-    if q.first() is None:
-        return False
-    q.delete(synchronize_session=False)
+    added = []
+    for lid in add_ids:
+        if lid in inserted:
+            outcome = SavedListingBatchOutcome.SAVED
+        elif lid in existing:
+            outcome = SavedListingBatchOutcome.ALREADY_SAVED
+        else:
+            outcome = SavedListingBatchOutcome.NOT_FOUND
+        added.append(SavedListingBatchItem(listing_id=lid, outcome=outcome))
+
+    deleted = _delete_saved_listings(db=db, user_id=user_id, listing_ids=remove_ids)
+    removed = [
+        SavedListingBatchItem(
+            listing_id=lid,
+            outcome=(
+                SavedListingBatchOutcome.REMOVED
+                if lid in deleted
+                else SavedListingBatchOutcome.NOT_SAVED
+            ),
+        )
+        for lid in remove_ids
+    ]
+
     db.commit()
-    return True
+    return SavedListingsBatchResponse(added=added, removed=removed)
@@ -1,10 +1,13 @@
+from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db
+from app.api.deps import get_db, get_optional_current_user_id
 from app.api.v1.properties.schemas import (
+    PropertyBatchGetRequest,
+    PropertyBatchGetResponse,
     PropertyCreate,
     PropertyDetailResponse,
     PropertyListingsQuery,
@@ -18,6 +21,7 @@ from app.api.v1.properties.schemas import (
 )
 from app.api.v1.properties.services import (
     create_property,
+    get_properties_by_ids,
     get_property_detail,
     get_property_listings,
     get_property_reviews,
@@ -50,6 +54,15 @@ def post_property_controller(
     return create_property(db=db, data=payload)
 
 
+@router.post("/batch-get", response_model=PropertyBatchGetResponse)
+def batch_get_properties_controller(
+    payload: PropertyBatchGetRequest,
+    db: Session = Depends(get_db),
+):
+    """Return many properties with review statistics, in requested order."""
+    return get_properties_by_ids(db=db, property_ids=payload.ids)
+
+
 @router.get("/{property_id}", response_model=PropertyDetailResponse)
 def get_property_controller(
     property_id: UUID,
@@ -87,11 +100,15 @@ def get_property_listings_controller(
     property_id: UUID,
     db: Session = Depends(get_db),
     params: PropertyListingsQuery = Depends(),
+    user_id: Optional[str] = Depends(get_optional_current_user_id),
 ):
-    """Return listings associated with a property."""
+    """Return listings associated with a property (with is_saved when authenticated)."""
     return get_property_listings(
         db=db,
         property_id=property_id,
+        view=params.view,
+        images=params.images,
+        user_id=user_id,
         limit=params.limit,
         offset=params.offset,
     )
@@ -4,7 +4,7 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
-from app.api.v1.listings.schemas import ListingListResponse
+from app.api.v1.listings.schemas import ListingListResponse, ListingView
 
 
 class PropertyResponse(BaseModel):
@@ -68,6 +68,19 @@ class PropertyDetailResponse(PropertyResponse):
     review_stats: PropertyReviewStatsResponse
 
 
+class PropertyBatchGetRequest(BaseModel):
+    """Payload for fetching many properties by ID in one request."""
+
+    ids: list[UUID] = Field(..., min_length=1, max_length=50)
+
+
+class PropertyBatchGetResponse(BaseModel):
+    """Properties in requested order plus IDs that were not found or are deleted."""
+
+    items: list[PropertyDetailResponse]
+    missing_ids: list[UUID]
+
+
 class PropertySearchItemResponse(PropertyResponse):
     """Property item for search/list response."""
 
@@ -102,6 +115,8 @@ class PropertySearchQuery(BaseModel):
 class PropertyListingsQuery(BaseModel):
     """Query params for listing a property's listings."""
 
+    view: ListingView = ListingView.FULL
+    images: int = Field(0, ge=0, le=20)
     limit: int = Field(20, ge=1, le=100)
     offset: int = Field(0, ge=0)
 
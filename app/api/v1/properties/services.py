@@ -3,12 +3,14 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import HTTPException, status
-from sqlalchemy import func, or_
+from sqlalchemy import func, insert, or_, update
 from sqlalchemy.orm import Session
 
+from app.api.v1.listings.schemas import ListingView
 from app.api.v1.listings.services import get_listings as get_listings_for_property
 from app.api.v1.properties.models import Property
 from app.api.v1.properties.schemas import (
+    PropertyBatchGetResponse,
     PropertyCreate,
     PropertyDetailResponse,
     PropertyListResponse,
@@ -161,35 +163,50 @@ def search_properties(db: Session, params: PropertySearchQuery) -> PropertyListR
 
 
 def create_property(db: Session, data: PropertyCreate) -> PropertyResponse:
-    """Create a property."""
-    property_obj = Property(
-        name=data.name,
-        address=data.address,
-        postal_code=data.postal_code,
-        city=data.city,
-        state=data.state,
-        country=data.country,
-        latitude=data.latitude,
-        longitude=data.longitude,
-        management_company=data.management_company,
-    )
-    db.add(property_obj)
+    """Create a property; the response is built from the INSERT ... RETURNING row."""
+    property_obj = db.scalars(
+        insert(Property)
+        .values(
+            name=data.name,
+            address=data.address,
+            postal_code=data.postal_code,
+            city=data.city,
+            state=data.state,
+            country=data.country,
+            latitude=data.latitude,
+            longitude=data.longitude,
+            management_company=data.management_company,
+        )
+        .returning(Property)
+    ).one()
+    out = _to_property_response(property_obj=property_obj)
     db.commit()
-    db.refresh(property_obj)
-    return _to_property_response(property_obj=property_obj)
+    return out
 
 
 def update_property(
     db: Session, property_id: UUID, data: PropertyUpdate
 ) -> PropertyResponse:
-    """Update a property with partial fields."""
-    property_obj = _get_property_or_404(db=db, property_id=property_id)
+    """Update a property with partial fields in one UPDATE ... RETURNING."""
     update_data = data.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(property_obj, key, value)
+    if not update_data:
+        return _to_property_response(
+            property_obj=_get_property_or_404(db=db, property_id=property_id)
+        )
+    property_obj = db.scalars(
+        update(Property)
+        .where(Property.id == property_id, Property.deleted_at.is_(None))
+        .values(**update_data)
+        .returning(Property)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    ).one_or_none()
+    if not property_obj:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Property not found"
+        )
+    out = _to_property_response(property_obj=property_obj)
     db.commit()
-    db.refresh(property_obj)
-    return _to_property_response(property_obj=property_obj)
+    return out
 
 
 def soft_delete_property(db: Session, property_id: UUID) -> None:
@@ -199,14 +216,42 @@ def soft_delete_property(db: Session, property_id: UUID) -> None:
     db.commit()
 
 
-def get_property_detail(db: Session, property_id: UUID) -> PropertyDetailResponse:
-    """Get property details and aggregated review statistics."""
-    property_obj = _get_property_or_404(db=db, property_id=property_id)
-    review_count, average_rating = (
-        db.query(func.count(Review.id), func.avg(Review.rating))
-        .where(Review.property_id == property_id)
-        .one()
+def _review_stats_for_property_ids(
+    db: Session, property_ids: list[UUID]
+) -> dict[UUID, PropertyReviewStatsResponse]:
+    """
+    Aggregate review count and average rating for multiple properties in one query.
+
+    Returns:
+        Mapping of property_id -> PropertyReviewStatsResponse (zero stats when
+        the property has no reviews).
+    """
+    stats = {
+        pid: PropertyReviewStatsResponse(review_count=0, average_rating=None)
+        for pid in property_ids
+    }
+    if not property_ids:
+        return stats
+    rows = (
+        db.query(Review.property_id, func.count(Review.id), func.avg(Review.rating))
+        .where(Review.property_id.in_(property_ids))
+        .group_by(Review.property_id)
+        .all()
     )
+    for property_id, review_count, average_rating in rows:
+        stats[property_id] = PropertyReviewStatsResponse(
+            review_count=int(review_count or 0),
+            average_rating=(
+                round(float(average_rating), 2) if average_rating else None
+            ),
+        )
+    return stats
+
+
+def _to_detail_response(
+    property_obj: Property, review_stats: PropertyReviewStatsResponse
+) -> PropertyDetailResponse:
+    """Convert Property ORM row and its review stats to PropertyDetailResponse."""
     return PropertyDetailResponse(
         id=property_obj.id,
         name=property_obj.name,
@@ -220,28 +265,66 @@ def get_property_detail(db: Session, property_id: UUID) -> PropertyDetailRespons
         management_company=property_obj.management_company,
         created_at=property_obj.created_at,
         updated_at=property_obj.updated_at,
-        review_stats=PropertyReviewStatsResponse(
-            review_count=int(review_count or 0),
-            average_rating=(
-                round(float(average_rating), 2) if average_rating else None
-            ),
-        ),
+        review_stats=review_stats,
     )
 
 
+def get_property_detail(db: Session, property_id: UUID) -> PropertyDetailResponse:
+    """Get property details and aggregated review statistics."""
+    property_obj = _get_property_or_404(db=db, property_id=property_id)
+    stats = _review_stats_for_property_ids(db=db, property_ids=[property_id])
+    return _to_detail_response(
+        property_obj=property_obj, review_stats=stats[property_id]
+    )
+
+
+def get_properties_by_ids(
+    db: Session, property_ids: list[UUID]
+) -> PropertyBatchGetResponse:
+    """
+    Return many properties by ID using one IN query plus one review-stats query.
+
+    Items follow the requested order (duplicates collapsed); IDs that do not
+    exist or are soft-deleted are reported in missing_ids.
+    """
+    requested = list(dict.fromkeys(property_ids))
+    rows = (
+        db.query(Property)
+        .where(Property.id.in_(requested), Property.deleted_at.is_(None))
+        .all()
+    )
+    by_id = {row.id: row for row in rows}
+    stats = _review_stats_for_property_ids(db=db, property_ids=list(by_id))
+    items = [
+        _to_detail_response(property_obj=by_id[pid], review_stats=stats[pid])
+        for pid in requested
+        if pid in by_id
+    ]
+    missing_ids = [pid for pid in requested if pid not in by_id]
+    return PropertyBatchGetResponse(items=items, missing_ids=missing_ids)
+
+
 def get_property_listings(
-    db: Session, property_id: UUID, limit: int, offset: int
+    db: Session,
+    property_id: UUID,
+    limit: int,
+    offset: int,
+    view: ListingView = ListingView.FULL,
+    images: int = 0,
+    user_id: Optional[str] = None,
 ) -> PropertyListingsResponse:
     """Get listings associated with a property."""
     _get_property_or_404(db=db, property_id=property_id)
-    return PropertyListingsResponse.model_validate(
-        get_listings_for_property(
-            db=db,
-            property_id=property_id,
-            limit=limit,
-            offset=offset,
-        )
+    page = get_listings_for_property(
+        db=db,
+        property_id=property_id,
+        view=view,
+        images=images,
+        user_id=user_id,
+        limit=limit,
+        offset=offset,
     )
+    return PropertyListingsResponse(items=page.items, total=page.total)
 
 
 def get_property_reviews(
@@ -12,7 +12,7 @@ from app.api.v1.reviews.services import (
     get_review_by_id,
     update_review,
 )
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_current_user, get_current_user_id, get_db
 from sqlalchemy.orm import Session
 
 router = APIRouter()
@@ -42,15 +42,15 @@ def patch_review(
     review_id: UUID,
     payload: ReviewUpdate,
     db: Session = Depends(get_db),
-    user=Depends(get_current_user),
+    user_id: str = Depends(get_current_user_id),
 ):
-    return update_review(db, review_id=review_id, user_id=user.id, data=payload)
+    return update_review(db, review_id=review_id, user_id=user_id, data=payload)
 
 
 @router.delete("/reviews/{review_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_review_controller(
     review_id: UUID,
     db: Session = Depends(get_db),
-    user=Depends(get_current_user),
+    user_id: str = Depends(get_current_user_id),
 ):
-    delete_review(db, review_id=review_id, user_id=user.id)
+    delete_review(db, review_id=review_id, user_id=user_id)
@@ -1,6 +1,9 @@
+import uuid
 from uuid import UUID
 
 from fastapi import HTTPException, status
+from sqlalchemy import func, literal, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from app.api.v1.properties.models import Property
@@ -28,28 +31,46 @@ def _get_property_or_404(db: Session, property_id: UUID) -> None:
 def create_review(
     db: Session, *, property_id: UUID, user_id: str, data: ReviewCreate
 ) -> ReviewResponse:
-    _get_property_or_404(db, property_id)
+    """
+    Create the user's review for a property in a single upsert statement.
 
-    existing = (
-        db.query(Review)
-        .where(Review.property_id == property_id, Review.user_id == user_id)
-        .first()
-    )
-    if existing:
+    The INSERT selects from live properties and skips on the
+    (property_id, user_id) unique constraint; only when nothing is returned
+    do we look up the property to choose between 404 and 409.
+    """
+    live_property = select(
+        literal(uuid.uuid4(), Review.id.type),
+        Property.id,
+        literal(user_id, Review.user_id.type),
+        literal(data.rating, Review.rating.type),
+        literal(data.comment, Review.comment.type),
+        func.now(),
+        func.now(),
+    ).where(Property.id == property_id, Property.deleted_at.is_(None))
+    row = db.execute(
+        pg_insert(Review)
+        .from_select(
+            [
+                "id",
+                "property_id",
+                "user_id",
+                "rating",
+                "comment",
+                "created_at",
+                "updated_at",
+            ],
+            live_property,
+        )
+        .on_conflict_do_nothing(constraint="uq_review_property_user")
+        .returning(*Review.__table__.c)
+    ).first()
+    db.commit()
+    if row is None:
+        _get_property_or_404(db, property_id)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="You have already reviewed this property",
         )
-
-    row = Review(
-        property_id=property_id,
-        user_id=user_id,
-        rating=data.rating,
-        comment=data.comment,
-    )
-    db.add(row)
-    db.commit()
-    db.refresh(row)
     return ReviewResponse.model_validate(row)
 
 
@@ -65,23 +86,37 @@ def get_review_by_id(db: Session, *, review_id: UUID) -> ReviewResponse:
 def update_review(
     db: Session, *, review_id: UUID, user_id: str, data: ReviewUpdate
 ) -> ReviewResponse:
-    row = db.get(Review, review_id)
-    if not row:
+    """
+    Update the caller's review in one UPDATE ... RETURNING scoped to the author.
+
+    The review is only loaded when nothing was updated, to choose between
+    404 and 403.
+    """
+    update_data = data.model_dump(exclude_unset=True)
+    row = None
+    if update_data:
+        row = db.execute(
+            update(Review)
+            .where(Review.id == review_id, Review.user_id == user_id)
+            .values(**update_data)
+            .returning(*Review.__table__.c)
+            .execution_options(synchronize_session=False)
+        ).first()
+    if row is not None:
+        db.commit()
+        return ReviewResponse.model_validate(row)
+
+    existing = db.get(Review, review_id)
+    if not existing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Review not found"
         )
-    if row.user_id != user_id:
+    if existing.user_id != user_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You do not have permission to update this review",
         )
-
-    update = data.model_dump(exclude_unset=True)
-    for k, v in update.items():
-        setattr(row, k, v)
-    db.commit()
-    db.refresh(row)
-    return ReviewResponse.model_validate(row)
+    return ReviewResponse.model_validate(existing)
 
 
 def delete_review(db: Session, *, review_id: UUID, user_id: str) -> None:
@@ -1,11 +1,13 @@
 from fastapi import APIRouter
 from app.api.v1.auth.controller import router as auth_router
 from app.api.v1.images.controllers import router as images_router
+from app.api.v1.images.local_storage_controller import router as local_storage_router
 from app.api.v1.listings.controllers import router as listings_router
 from app.api.v1.properties.controllers import router as properties_router
 from app.api.v1.reviews.controller import router as reviews_router
 from app.api.v1.test.controller import router as test_router
 from app.api.v1.users.controller import router as users_router
+from app.core.config import settings
 
 api_router = APIRouter()
 api_router.include_router(test_router, prefix="/test", tags=["test"])
@@ -15,3 +17,5 @@ api_router.include_router(properties_router, prefix="/properties", tags=["proper
 api_router.include_router(listings_router, prefix="/listings", tags=["listings"])
 api_router.include_router(images_router, tags=["images"])
 api_router.include_router(reviews_router, tags=["reviews"])
+if settings.STORAGE_BACKEND == "local":
+    api_router.include_router(local_storage_router, prefix="/storage", tags=["storage"])
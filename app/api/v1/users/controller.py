@@ -1,21 +1,33 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, status
+from sqlalchemy import update
 
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, get_current_user_id, invalidate_cached_user
 from app.api.v1.listings.services import (
+    check_saved_listings,
     get_saved_listings,
     save_listing_for_user,
     unsave_listing_for_user,
+    update_saved_listings_batch,
 )
 from app.api.v1.listings.schemas import ListingListResponse
 from .models import User
-from .schemas import SavedListingsQuery, UserResponse, UserUpdate
+from .schemas import (
+    SavedListingsCheckRequest,
+    SavedListingsBatchRequest,
+    SavedListingsBatchResponse,
+    SavedListingsCheckResponse,
+    SavedListingsQuery,
+    UserResponse,
+    UserUpdate,
+)
 from sqlalchemy.orm import Session
 from app.api.deps import get_db
 
 router = APIRouter()
 
+
 @router.get("", response_model=UserResponse)
 def get_me(user: User = Depends(get_current_user)) -> UserResponse:
     return user
@@ -28,40 +40,82 @@ def patch_me(
     db: Session = Depends(get_db),
 ) -> UserResponse:
     """Update editable fields on the current user's profile."""
-    update = payload.model_dump(exclude_unset=True)
-    for k, v in update.items():
-        setattr(user, k, v)
+    update_data = payload.model_dump(exclude_unset=True)
+    if not update_data:
+        return UserResponse.model_validate(user)
+    # UPDATE ... RETURNING refreshes the loaded user in place; serialize before
+    # commit so the response needs no reload.
+    updated = db.scalars(
+        update(User)
+        .where(User.id == user.id)
+        .values(**update_data)
+        .returning(User)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    ).one()
+    out = UserResponse.model_validate(updated)
     db.commit()
-    db.refresh(user)
-    return user
+    invalidate_cached_user(user.id)
+    return out
 
 
 @router.get("/saved-listings", response_model=ListingListResponse)
 def get_my_saved_listings(
     params: SavedListingsQuery = Depends(),
-    user: User = Depends(get_current_user),
+    user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ):
     return get_saved_listings(
-        db=db, user_id=user.id, limit=params.limit, offset=params.offset
+        db=db,
+        user_id=user_id,
+        view=params.view,
+        images=params.images,
+        limit=params.limit,
+        offset=params.offset,
+    )
+
+
+@router.post("/saved-listings:check", response_model=SavedListingsCheckResponse)
+def check_my_saved_listings(
+    payload: SavedListingsCheckRequest,
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
+):
+    """Report which of the given listings the current user has saved."""
+    return SavedListingsCheckResponse(
+        saved=check_saved_listings(
+            db=db, user_id=user_id, listing_ids=payload.listing_ids
+        )
+    )
+
+
+# Declared before /saved-listings/{listing_id} so "batch" is not parsed as an ID
+@router.post("/saved-listings/batch", response_model=SavedListingsBatchResponse)
+def batch_update_my_saved_listings(
+    payload: SavedListingsBatchRequest,
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
+):
+    """Save and unsave many listings in one transaction with per-item outcomes."""
+    return update_saved_listings_batch(
+        db=db, user_id=user_id, add=payload.add, remove=payload.remove
     )
 
 
 @router.post("/saved-listings/{listing_id}", status_code=status.HTTP_204_NO_CONTENT)
 def save_listing(
     listing_id: UUID,
-    user: User = Depends(get_current_user),
+    user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ):
     # Idempotent: creating an existing saved listing still returns 204
-    save_listing_for_user(db=db, user_id=user.id, listing_id=listing_id)
+    save_listing_for_user(db=db, user_id=user_id, listing_id=listing_id)
 
 
 @router.delete("/saved-listings/{listing_id}", status_code=status.HTTP_204_NO_CONTENT)
 def unsave_listing(
     listing_id: UUID,
-    user: User = Depends(get_current_user),
+    user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ):
     # Idempotent delete
-    unsave_listing_for_user(db=db, user_id=user.id, listing_id=listing_id)
+    unsave_listing_for_user(db=db, user_id=user_id, listing_id=listing_id)
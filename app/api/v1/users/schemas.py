@@ -1,9 +1,13 @@
 """Pydantic schemas for users."""
 
+import enum
 from typing import Optional
+from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from app.api.v1.listings.schemas import ListingView
+
 
 class UserResponse(BaseModel):
     """User response schema (for GET /auth/me and other user-facing endpoints)."""
@@ -20,10 +24,55 @@ class UserResponse(BaseModel):
 class SavedListingsQuery(BaseModel):
     """Query params for listing saved listings of the current user."""
 
+    view: ListingView = ListingView.FULL
+    images: int = Field(0, ge=0, le=20)
     limit: int = Field(20, ge=1, le=100)
     offset: int = Field(0, ge=0)
 
 
+class SavedListingsCheckRequest(BaseModel):
+    """Listing IDs to check against the current user's saved listings."""
+
+    listing_ids: list[UUID] = Field(..., min_length=1, max_length=100)
+
+
+class SavedListingsCheckResponse(BaseModel):
+    """Saved state per requested listing ID."""
+
+    saved: dict[UUID, bool]
+
+
+class SavedListingsBatchRequest(BaseModel):
+    """Listing IDs to save and unsave for the current user in one transaction."""
+
+    add: list[UUID] = Field(default_factory=list, max_length=100)
+    remove: list[UUID] = Field(default_factory=list, max_length=100)
+
+
+class SavedListingBatchOutcome(str, enum.Enum):
+    """Per-item result of a batch save/unsave."""
+
+    SAVED = "saved"
+    ALREADY_SAVED = "already_saved"
+    NOT_FOUND = "not_found"
+    REMOVED = "removed"
+    NOT_SAVED = "not_saved"
+
+
+class SavedListingBatchItem(BaseModel):
+    """Outcome for one listing ID in a batch save/unsave."""
+
+    listing_id: UUID
+    outcome: SavedListingBatchOutcome
+
+
+class SavedListingsBatchResponse(BaseModel):
+    """Per-item outcomes for the add and remove lists, in request order."""
+
+    added: list[SavedListingBatchItem]
+    removed: list[SavedListingBatchItem]
+
+
 class UserUpdate(BaseModel):
     """Editable fields for the current user's profile."""
 
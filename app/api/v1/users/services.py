@@ -0,0 +1,40 @@
+from datetime import datetime
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.api.v1.users.models import User
+
+
+def upsert_google_user(db: Session, idinfo: dict) -> str:
+    """
+    Create or refresh the user for verified Google ID-token claims (JIT
+    provisioning) in one INSERT ... ON CONFLICT statement, and commit.
+
+    Returns the user id (the token's sub).
+    """
+    user_id = idinfo["sub"]
+    now = datetime.utcnow()
+    upsert = pg_insert(User).values(
+        id=user_id,
+        email=idinfo["email"],
+        name=idinfo.get("name"),
+        profile_picture=idinfo.get("picture"),
+        last_login=now,
+        created_at=now,
+        updated_at=now,
+    )
+    db.execute(
+        upsert.on_conflict_do_update(
+            index_elements=[User.id],
+            set_={
+                "email": upsert.excluded.email,
+                "name": upsert.excluded.name,
+                "profile_picture": upsert.excluded.profile_picture,
+                "last_login": upsert.excluded.last_login,
+                "updated_at": upsert.excluded.updated_at,
+            },
+        )
+    )
+    db.commit()
+    return user_id
@@ -29,11 +29,31 @@ class Settings(BaseSettings):
     GOOGLE_REDIRECT_URI: str
     # Accept raw string (CSV or JSON) to avoid provider JSON parsing errors
     ALLOWED_GOOGLE_HD: Optional[str] = None
+    # ID-token signing certificates, cached per process for their max-age
+    # (the default applies when none is sent) and refreshed in the background
+    # this long before expiry. Point the URL at a local stand-in to run offline.
+    GOOGLE_CERTS_URL: str = "https://www.googleapis.com/oauth2/v1/certs"
+    GOOGLE_CERTS_REFRESH_MARGIN_SECONDS: float = 300.0
+    GOOGLE_CERTS_DEFAULT_MAX_AGE_SECONDS: float = 3600.0
+    # Comma-separated emails of users allowed to call admin endpoints
+    ADMIN_EMAILS: str = ""
 
     # App JWT settings
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
+    # Per-process auth caches: verified tokens (by hash), and user rows (by id).
+    # User edits evict the local copy; other processes see them within the TTL.
+    AUTH_TOKEN_CACHE_SIZE: int = 10000
+    AUTH_TOKEN_CACHE_TTL_SECONDS: float = 300.0
+    AUTH_USER_CACHE_SIZE: int = 10000
+    AUTH_USER_CACHE_TTL_SECONDS: float = 30.0
+
+    # Object storage backend: "s3", or "local" to keep files under
+    # LOCAL_STORAGE_ROOT and serve them from /api/v1/storage (offline dev, load tests)
+    STORAGE_BACKEND: str = "s3"
+    LOCAL_STORAGE_ROOT: str = ".storage"
+    LOCAL_STORAGE_BASE_URL: str = "http://localhost:8000"
 
     # S3 object storage
     AWS_REGION: str = "us-east-2"
@@ -45,6 +65,40 @@ class Settings(BaseSettings):
 
     S3_BUCKET_NAME: Optional[str] = None
     S3_PRESIGNED_URL_EXPIRES_SECONDS: int = 600
+    # Max storage calls in flight per process from async endpoints; they get
+    # their own limiter instead of the shared threadpool, and the S3 client
+    # keeps this many pooled keep-alive connections
+    STORAGE_IO_CONCURRENCY: int = 64
+    # Image upload size cap (streaming, presigned POST and multipart modes) and
+    # multipart part size (S3 parts must be at least 5 MiB, except the last)
+    IMAGE_UPLOAD_MAX_BYTES: int = 25 * 1024 * 1024
+    IMAGE_UPLOAD_PART_BYTES: int = 8 * 1024 * 1024
+    # Deduplicate identical uploads into one shared, reference-counted object
+    IMAGE_CONTENT_ADDRESSED: bool = False
+
+    # Background worker that deletes storage objects queued by image deletes
+    STORAGE_DELETION_WORKER_ENABLED: bool = True
+    STORAGE_DELETION_POLL_SECONDS: float = 10.0
+    STORAGE_DELETION_BATCH_SIZE: int = 500
+    STORAGE_DELETION_RETRY_BASE_SECONDS: int = 30
+    STORAGE_DELETION_RETRY_MAX_SECONDS: int = 3600
+
+    # Responsive image variants generated after finalize (CSV strings, like ALLOWED_GOOGLE_HD)
+    IMAGE_VARIANTS_ENABLED: bool = True
+    IMAGE_VARIANT_WIDTHS: str = "320,640,1280"
+    IMAGE_VARIANT_FORMATS: str = "webp,avif"
+    IMAGE_VARIANT_QUALITY: int = 80
+    IMAGE_VARIANT_WORKERS: int = 2
+
+    # Near-duplicate listing photos: max Hamming distances (of 64 bits) for a
+    # pHash candidate and its dHash confirmation. Hashes are computed by the
+    # variant task, so this needs IMAGE_VARIANTS_ENABLED.
+    IMAGE_DUPLICATE_FLAGGING_ENABLED: bool = True
+    IMAGE_DUPLICATE_PHASH_DISTANCE: int = 8
+    IMAGE_DUPLICATE_DHASH_DISTANCE: int = 12
+    # In-process hash index: incremental sync interval and full rebuild interval
+    IMAGE_DUPLICATE_INDEX_REFRESH_SECONDS: float = 5.0
+    IMAGE_DUPLICATE_INDEX_REBUILD_SECONDS: float = 3600.0
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -75,6 +129,31 @@ class Settings(BaseSettings):
         # Fallback: CSV
         return [item.strip() for item in s.split(",") if item.strip()]
 
+    @property
+    def admin_emails(self) -> set[str]:
+        """Parsed admin emails, lowercased."""
+        return {
+            item.strip().lower()
+            for item in self.ADMIN_EMAILS.split(",")
+            if item.strip()
+        }
+
+    @property
+    def image_variant_widths(self) -> List[int]:
+        """Parsed variant widths in ascending order."""
+        return sorted(
+            {int(item) for item in self.IMAGE_VARIANT_WIDTHS.split(",") if item.strip()}
+        )
+
+    @property
+    def image_variant_formats(self) -> List[str]:
+        """Parsed variant output formats (lowercase Pillow format names)."""
+        return [
+            item.strip().lower()
+            for item in self.IMAGE_VARIANT_FORMATS.split(",")
+            if item.strip()
+        ]
+
 
 def load_settings() -> Settings:
     """Load settings, raising an error if the .env file is missing or invalid."""
@@ -2,6 +2,9 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.v1.router import api_router
+from app.api.v1.images.deletion_worker import start_storage_deletion_worker
+from app.api.v1.images.storage import storage_configured
+from app.api.v1.images.variants import shutdown_variant_executor
 from app.db.session import engine
 from app.db.base import DeclarativeBase
 from app.core.config import settings
@@ -16,8 +19,16 @@ async def lifespan(app: FastAPI):
     # Auto-create tables in development for quick setup
     if settings.ENVIRONMENT == "development":
         DeclarativeBase.metadata.create_all(bind=engine)
+    deletion_worker = None
+    if settings.STORAGE_DELETION_WORKER_ENABLED and storage_configured():
+        deletion_worker = start_storage_deletion_worker()
     yield
     # Shutdown
+    if deletion_worker is not None:
+        thread, stop_event = deletion_worker
+        stop_event.set()
+        thread.join(timeout=settings.STORAGE_DELETION_POLL_SECONDS)
+    shutdown_variant_executor()
     engine.dispose()
 
 
@@ -40,6 +51,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Multipart uploads read each part's ETag from the PUT response
+    expose_headers=["ETag"],
 )
 
 app.include_router(api_router, prefix="/api/v1")
@@ -0,0 +1,74 @@
+"""Benchmark pre-signed upload URL generation for image batches.
+
+Usage:
+    uv run python scripts/run_script.py bench_presigned_urls [batch_size] [rounds]
+
+Signing is local, so this needs storage settings in .env but no network or
+database (STORAGE_BACKEND=local works too). Compares one presign_put call per
+file (the old batch path) with a single presign_puts call for the whole batch.
+"""
+
+import sys
+import time
+import uuid
+
+from app.api.v1.images.s3_utils import generate_listing_image_id_and_key
+from app.api.v1.images.storage import get_storage
+from app.core.config import settings
+
+DEFAULT_BATCH_SIZE = 20
+DEFAULT_ROUNDS = 200
+
+
+def build_targets(batch_size: int) -> list[tuple[str, str]]:
+    property_id, listing_id = uuid.uuid4(), uuid.uuid4()
+    targets = []
+    for i in range(batch_size):
+        _, key = generate_listing_image_id_and_key(
+            property_id=property_id,
+            listing_id=listing_id,
+            filename=f"photo-{i}.jpg",
+            content_type="image/jpeg",
+        )
+        targets.append((key, "image/jpeg"))
+    return targets
+
+
+def per_url_microseconds(fn, targets: list[tuple[str, str]], rounds: int) -> float:
+    fn(targets)  # warm up botocore's lazy loaders
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn(targets)
+    elapsed = time.perf_counter() - start
+    return elapsed / (rounds * len(targets)) * 1_000_000
+
+
+def one_by_one(targets: list[tuple[str, str]]) -> None:
+    storage = get_storage()
+    for key, content_type in targets:
+        storage.presign_put(
+            key, content_type, expires_in=settings.S3_PRESIGNED_URL_EXPIRES_SECONDS
+        )
+
+
+def batched(targets: list[tuple[str, str]]) -> None:
+    get_storage().presign_puts(
+        targets, expires_in=settings.S3_PRESIGNED_URL_EXPIRES_SECONDS
+    )
+
+
+def main(batch_size: int, rounds: int) -> None:
+    targets = build_targets(batch_size)
+    single = per_url_microseconds(one_by_one, targets, rounds)
+    batch = per_url_microseconds(batched, targets, rounds)
+    print(f"backend={settings.STORAGE_BACKEND} batch_size={batch_size} rounds={rounds}")
+    print(f"  per-file calls: {single:8.1f} us/url")
+    print(f"  batch call:     {batch:8.1f} us/url")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(
+        batch_size=int(args[0]) if len(args) > 0 else DEFAULT_BATCH_SIZE,
+        rounds=int(args[1]) if len(args) > 1 else DEFAULT_ROUNDS,
+    )
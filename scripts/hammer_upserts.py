@@ -0,0 +1,243 @@
+"""Hammer the single-statement upsert paths concurrently and check the outcomes.
+
+Usage:
+    uv run python scripts/run_script.py hammer_upserts [workers] [rounds]
+
+Runs against the PostgreSQL database in .env. Each round releases `workers`
+threads at once, each with its own session, on:
+
+- create_review for one (property, user): exactly one succeeds, the rest
+  get 409, and one review row exists.
+- save_listing_for_user, then unsave_listing_for_user, for one
+  (user, listing): no call fails (the endpoints always return 204) and
+  there is one saved row after the saves and none after the unsaves.
+- upsert_google_user for one Google sub with different profiles: no call
+  fails and one user row exists, holding one of the submitted profiles.
+
+The script creates its own property, listing and users and deletes them
+afterwards. It exits non-zero if any check fails.
+"""
+
+import sys
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import HTTPException
+from sqlalchemy import delete, func, select
+
+from app.api.v1.listings.models import Listing, SavedListing, UnitType
+from app.api.v1.listings.services import (
+    save_listing_for_user,
+    unsave_listing_for_user,
+)
+from app.api.v1.properties.models import Property
+from app.api.v1.reviews.models import Review
+from app.api.v1.reviews.schemas import ReviewCreate
+from app.api.v1.reviews.services import create_review
+from app.api.v1.users.models import User
+from app.api.v1.users.services import upsert_google_user
+from app.db.session import SessionLocal
+from scripts.script_user import SCRIPT_USER_ID, ensure_script_user
+
+DEFAULT_WORKERS = 12
+DEFAULT_ROUNDS = 5
+
+
+def hammer(workers: int, call) -> list:
+    """
+    Run call(db, worker_index) on every worker at once. Each result is the
+    call's return value, or the HTTPException / other exception it raised.
+    """
+    barrier = threading.Barrier(workers)
+
+    def run(index: int):
+        with SessionLocal() as db:
+            barrier.wait()
+            try:
+                return call(db, index)
+            except Exception as exc:
+                db.rollback()
+                return exc
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run, range(workers)))
+
+
+def count(model, *where) -> int:
+    with SessionLocal() as db:
+        return db.scalar(select(func.count()).select_from(model).where(*where))
+
+
+def unexpected(results: list) -> list:
+    """Exceptions other than the HTTPExceptions the endpoints map to responses."""
+    return [
+        r
+        for r in results
+        if isinstance(r, Exception) and not isinstance(r, HTTPException)
+    ]
+
+
+class Checks:
+    def __init__(self):
+        self.failed = 0
+
+    def check(self, label: str, ok: bool, detail: str) -> None:
+        print(f"  {'ok  ' if ok else 'FAIL'} {label}: {detail}")
+        if not ok:
+            self.failed += 1
+
+
+def create_fixtures() -> tuple[uuid.UUID, uuid.UUID]:
+    with SessionLocal() as db:
+        ensure_script_user(db)
+        prop = Property(
+            owner_id=SCRIPT_USER_ID,
+            name="Upsert hammer",
+            address="1 Hammer Way",
+            postal_code="90024",
+            city="Los Angeles",
+            state="CA",
+            country="US",
+            latitude=34.0689,
+            longitude=-118.4452,
+        )
+        db.add(prop)
+        db.flush()
+        listing = Listing(
+            property_id=prop.id,
+            owner_id=SCRIPT_USER_ID,
+            title="Upsert hammer",
+            description="Temporary listing for scripts/hammer_upserts.py",
+            monthly_rent=1000,
+            unit_type=UnitType.STUDIO,
+        )
+        db.add(listing)
+        db.commit()
+        return prop.id, listing.id
+
+
+def delete_fixtures(property_id: uuid.UUID, listing_id: uuid.UUID, user_ids) -> None:
+    with SessionLocal() as db:
+        db.execute(delete(Review).where(Review.property_id == property_id))
+        db.execute(delete(SavedListing).where(SavedListing.listing_id == listing_id))
+        db.execute(delete(Listing).where(Listing.id == listing_id))
+        db.execute(delete(Property).where(Property.id == property_id))
+        db.execute(delete(User).where(User.id.in_(user_ids)))
+        db.commit()
+
+
+def hammer_reviews(checks: Checks, workers: int, property_id, user_id: str) -> None:
+    payload = ReviewCreate(rating=5, comment="hammer")
+    results = hammer(
+        workers,
+        lambda db, _: create_review(
+            db, property_id=property_id, user_id=user_id, data=payload
+        ),
+    )
+    created = [r for r in results if not isinstance(r, Exception)]
+    conflicts = [
+        r for r in results if isinstance(r, HTTPException) and r.status_code == 409
+    ]
+    rows = count(Review, Review.property_id == property_id, Review.user_id == user_id)
+    checks.check(
+        "create_review",
+        len(created) == 1
+        and len(conflicts) == workers - 1
+        and rows == 1
+        and not unexpected(results),
+        f"{len(created)} created, {len(conflicts)} x 409, {rows} row(s), "
+        f"{len(unexpected(results))} error(s)",
+    )
+    with SessionLocal() as db:
+        db.execute(delete(Review).where(Review.property_id == property_id))
+        db.commit()
+
+
+def hammer_saved_listing(
+    checks: Checks, workers: int, listing_id, user_id: str
+) -> None:
+    def saved_rows() -> int:
+        return count(
+            SavedListing,
+            SavedListing.user_id == user_id,
+            SavedListing.listing_id == listing_id,
+        )
+
+    results = hammer(
+        workers,
+        lambda db, _: save_listing_for_user(db, user_id=user_id, listing_id=listing_id),
+    )
+    inserted = sum(1 for r in results if r is True)
+    failures = [r for r in results if isinstance(r, Exception)]
+    rows = saved_rows()
+    checks.check(
+        "save_listing_for_user",
+        inserted == 1 and not failures and rows == 1,
+        f"{inserted} inserted, {len(failures)} failure(s), {rows} row(s)",
+    )
+
+    results = hammer(
+        workers,
+        lambda db, _: unsave_listing_for_user(
+            db, user_id=user_id, listing_id=listing_id
+        ),
+    )
+    removed = sum(1 for r in results if r is True)
+    failures = [r for r in results if isinstance(r, Exception)]
+    rows = saved_rows()
+    checks.check(
+        "unsave_listing_for_user",
+        removed == 1 and not failures and rows == 0,
+        f"{removed} removed, {len(failures)} failure(s), {rows} row(s)",
+    )
+
+
+def hammer_google_upsert(checks: Checks, workers: int, sub: str) -> None:
+    names = [f"Hammer {index}" for index in range(workers)]
+    results = hammer(
+        workers,
+        lambda db, index: upsert_google_user(
+            db,
+            {"sub": sub, "email": f"{sub}@ucla.edu", "name": names[index]},
+        ),
+    )
+    failures = [r for r in results if isinstance(r, Exception)]
+    with SessionLocal() as db:
+        rows = db.scalars(select(User).where(User.id == sub)).all()
+    checks.check(
+        "upsert_google_user",
+        not failures and len(rows) == 1 and rows[0].name in names,
+        f"{len(failures)} failure(s), {len(rows)} row(s)",
+    )
+
+
+def main(workers: int, rounds: int) -> None:
+    property_id, listing_id = create_fixtures()
+    reviewer_id = f"hammer-{uuid.uuid4()}"
+    google_sub = f"hammer-{uuid.uuid4()}"
+    checks = Checks()
+    try:
+        with SessionLocal() as db:
+            db.add(User(id=reviewer_id, email=f"{reviewer_id}@ucla.edu"))
+            db.commit()
+        for round_number in range(1, rounds + 1):
+            print(f"round {round_number}/{rounds} ({workers} workers)")
+            hammer_reviews(checks, workers, property_id, reviewer_id)
+            hammer_saved_listing(checks, workers, listing_id, reviewer_id)
+            hammer_google_upsert(checks, workers, google_sub)
+    finally:
+        delete_fixtures(property_id, listing_id, [reviewer_id, google_sub])
+
+    if checks.failed:
+        print(f"{checks.failed} check(s) failed", file=sys.stderr)
+        sys.exit(1)
+    print("all checks passed")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(
+        workers=int(args[0]) if len(args) > 0 else DEFAULT_WORKERS,
+        rounds=int(args[1]) if len(args) > 1 else DEFAULT_ROUNDS,
+    )
@@ -0,0 +1,152 @@
+"""Find (and optionally delete) stored image objects no image row references.
+
+Usage:
+    uv run python scripts/run_script.py reconcile_image_storage [options]
+
+Pages through properties/ in storage, matching each page against the image
+tables, and prints orphans older than the grace period. With --delete they are
+queued in the storage_deletions outbox, which the app's deletion worker drains.
+
+Progress is checkpointed after every page, so an interrupted run (or one cut
+short by --max-keys) resumes where it stopped; the checkpoint is removed once
+a pass completes and the next run starts over. Keep the grace period well
+above the time clients take to finalize an upload.
+"""
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import asdict
+from datetime import timedelta
+from pathlib import Path
+
+from app.api.v1.images.reconcile import (
+    IMAGES_ROOT_PREFIX,
+    ReconcileStats,
+    iter_reconcile_pages,
+    queue_orphans,
+)
+from app.api.v1.images.storage import get_storage
+from app.db.session import SessionLocal
+
+DEFAULT_CHECKPOINT = ".reconcile_image_storage.json"
+DEFAULT_GRACE_HOURS = 24.0
+DEFAULT_PAGE_SIZE = 1000
+
+
+def load_checkpoint(path: Path, prefix: str) -> dict:
+    """Saved progress for prefix, or a fresh pass."""
+    if path.exists():
+        checkpoint = json.loads(path.read_text())
+        if checkpoint.get("prefix") == prefix:
+            return checkpoint
+    return {"prefix": prefix, "start_after": None, "elapsed": 0.0, "totals": {}}
+
+
+def save_checkpoint(path: Path, checkpoint: dict) -> None:
+    """Write through a temp file so an interrupted write keeps the old one."""
+    tmp = path.with_name(f"{path.name}.tmp")
+    tmp.write_text(json.dumps(checkpoint, indent=2))
+    tmp.replace(path)
+
+
+def report(label: str, stats: ReconcileStats, elapsed: float) -> None:
+    rate = stats.scanned / elapsed if elapsed > 0 else 0.0
+    print(
+        f"{label}: scanned={stats.scanned} ({rate:.0f} keys/s) "
+        f"referenced={stats.referenced} recent={stats.recent} "
+        f"queued={stats.queued} skipped={stats.skipped} "
+        f"orphans={stats.orphans} ({stats.orphan_bytes / 1024**2:.1f} MiB)",
+        file=sys.stderr,
+    )
+
+
+def main(args: argparse.Namespace) -> None:
+    checkpoint_path = Path(args.checkpoint)
+    if args.restart:
+        checkpoint_path.unlink(missing_ok=True)
+    checkpoint = load_checkpoint(checkpoint_path, args.prefix)
+    if checkpoint["start_after"]:
+        print(f"Resuming after {checkpoint['start_after']}", file=sys.stderr)
+    totals = ReconcileStats(**checkpoint["totals"])
+    previous_elapsed = checkpoint["elapsed"]
+
+    run = ReconcileStats()
+    start = time.perf_counter()
+    done = False
+    with SessionLocal() as db:
+        pages = iter_reconcile_pages(
+            db,
+            get_storage(),
+            grace=timedelta(hours=args.grace_hours),
+            start_after=checkpoint["start_after"],
+            prefix=args.prefix,
+            page_size=args.page_size,
+        )
+        for page in pages:
+            for obj in page.orphans:
+                print(f"{obj.key}\t{obj.byte_size}\t{obj.last_modified.isoformat()}")
+            if args.delete:
+                queue_orphans(db, [obj.key for obj in page.orphans])
+            run.add(page.stats)
+            totals.add(page.stats)
+            elapsed = time.perf_counter() - start
+            checkpoint.update(
+                start_after=page.last_key,
+                elapsed=previous_elapsed + elapsed,
+                totals=asdict(totals),
+            )
+            save_checkpoint(checkpoint_path, checkpoint)
+            report("progress", run, elapsed)
+            done = page.done
+            if args.max_keys and run.scanned >= args.max_keys:
+                break
+
+    if done:
+        checkpoint_path.unlink(missing_ok=True)
+        report("pass complete", totals, checkpoint["elapsed"])
+        action = (
+            "queued for deletion" if args.delete else "found (--delete queues them)"
+        )
+        print(f"{totals.orphans} orphans {action}.", file=sys.stderr)
+    else:
+        print(
+            f"Stopped after {checkpoint['start_after']}; run again to resume.",
+            file=sys.stderr,
+        )
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="reconcile_image_storage",
+        description="Report or delete image objects no image row references.",
+    )
+    parser.add_argument(
+        "--delete",
+        action="store_true",
+        help="queue orphans for deletion instead of only reporting them",
+    )
+    parser.add_argument(
+        "--grace-hours",
+        type=float,
+        default=DEFAULT_GRACE_HOURS,
+        help="ignore unreferenced objects modified more recently than this",
+    )
+    parser.add_argument("--prefix", default=IMAGES_ROOT_PREFIX)
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE)
+    parser.add_argument(
+        "--max-keys",
+        type=int,
+        default=0,
+        help="stop (resumably) after about this many keys; 0 runs the full pass",
+    )
+    parser.add_argument("--checkpoint", default=DEFAULT_CHECKPOINT)
+    parser.add_argument(
+        "--restart", action="store_true", help="discard the checkpoint and start over"
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    main(parse_args(sys.argv[1:]))